@@ -1,6 +1,7 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_init
 
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bc.settings")
@@ -8,3 +9,11 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bc.settings")
 app = Celery("bc")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def warm_caches(**kwargs):
+    """Warm the caches before the worker starts consuming tasks (see warm_on_start)."""
+    from deals.services.cache_warmup import warm_on_start
+
+    warm_on_start("celery worker")
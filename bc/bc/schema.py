@@ -0,0 +1,31 @@
+"""
+OpenAPI schema generation for the project's swagger/redoc views.
+"""
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+from deals import cache_metrics
+from deals.caching import LocalCache
+
+METRICS_NAME = "openapi_schema"
+
+
+class CachedSchemaGenerator(OpenAPISchemaGenerator):
+    """
+    Schema generator that builds each schema once per process. The schema
+    only depends on the code and the requested URL, so entries never go
+    stale; warm_caches fills this before a worker takes traffic.
+    """
+    schemas = LocalCache(max_entries=16)
+
+    def get_schema(self, request=None, public=False):
+        url = self.url
+        if url is None and request is not None:
+            url = request.build_absolute_uri()
+        key = (self.version, public, url)
+        schema = self.schemas.get(key)
+        cache_metrics.record(METRICS_NAME, hits=schema is not None, misses=schema is None)
+        if schema is None:
+            with cache_metrics.timed(METRICS_NAME):
+                schema = super().get_schema(request, public)
+            self.schemas.set(key, schema)
+        return schema
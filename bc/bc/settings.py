@@ -165,6 +165,39 @@ REST_FRAMEWORK = {
     },
 }
 
+# Keyset pagination for list endpoints (opt-in via ?cursor= / ?page_size=)
+CURSOR_PAGINATION_DEFAULT_PAGE_SIZE = int(os.getenv('CURSOR_PAGINATION_DEFAULT_PAGE_SIZE', '50'))
+CURSOR_PAGINATION_MAX_PAGE_SIZE = int(os.getenv('CURSOR_PAGINATION_MAX_PAGE_SIZE', '500'))
+
+# Rows fetched per server-side cursor round trip by the streaming deal export
+DEAL_EXPORT_CHUNK_SIZE = int(os.getenv('DEAL_EXPORT_CHUNK_SIZE', '2000'))
+
+# Render list endpoints from values_list() tuples instead of model instances
+FAST_LIST_SERIALIZATION = os.getenv('FAST_LIST_SERIALIZATION', 'True') == 'True'
+
+# Bulk create endpoints: items accepted per request and rows per INSERT
+BULK_CREATE_MAX_ITEMS = int(os.getenv('BULK_CREATE_MAX_ITEMS', '1000'))
+BULK_CREATE_BATCH_SIZE = int(os.getenv('BULK_CREATE_BATCH_SIZE', '500'))
+
+# Full-text search endpoint result limits
+SEARCH_DEFAULT_LIMIT = int(os.getenv('SEARCH_DEFAULT_LIMIT', '20'))
+SEARCH_MAX_LIMIT = int(os.getenv('SEARCH_MAX_LIMIT', '100'))
+
+# Counterparty (buyer/seller) typeahead and its in-process cache of hot
+# prefixes (prefixes up to COUNTERPARTY_HOT_PREFIX_LENGTH characters)
+COUNTERPARTY_TYPEAHEAD_LIMIT = int(os.getenv('COUNTERPARTY_TYPEAHEAD_LIMIT', '10'))
+COUNTERPARTY_TYPEAHEAD_MAX_LIMIT = int(os.getenv('COUNTERPARTY_TYPEAHEAD_MAX_LIMIT', '50'))
+COUNTERPARTY_HOT_PREFIX_LENGTH = int(os.getenv('COUNTERPARTY_HOT_PREFIX_LENGTH', '3'))
+COUNTERPARTY_PREFIX_CACHE_SIZE = int(os.getenv('COUNTERPARTY_PREFIX_CACHE_SIZE', '1024'))
+COUNTERPARTY_PREFIX_CACHE_TTL = int(os.getenv('COUNTERPARTY_PREFIX_CACHE_TTL', '300'))
+
+# Deals changed per transaction by the bulk submit/cancel/reprocess admin actions
+DEAL_BULK_ACTION_CHUNK_SIZE = int(os.getenv('DEAL_BULK_ACTION_CHUNK_SIZE', '500'))
+
+# Admin changelists of large tables show planner estimates instead of exact
+# counts once the estimate reaches this many rows
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.getenv('ADMIN_ESTIMATED_COUNT_THRESHOLD', '10000'))
+
 # Celery
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://redis:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://redis:6379/0')
@@ -173,6 +206,24 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Deal stats rollup reconciliation period in seconds (run by celery beat)
+DEAL_STATS_RECONCILE_INTERVAL = int(os.getenv('DEAL_STATS_RECONCILE_INTERVAL', '3600'))
+# AI suggestion percentile bands (deals.services.suggestion_benchmarks):
+# rebuild period in seconds (run by celery beat), and the fewest historical
+# deals a band needs before it is used instead of a broader one
+SUGGESTION_BENCHMARK_REFRESH_INTERVAL = int(os.getenv('SUGGESTION_BENCHMARK_REFRESH_INTERVAL', '86400'))
+SUGGESTION_MIN_SAMPLES = int(os.getenv('SUGGESTION_MIN_SAMPLES', '5'))
+CELERY_BEAT_SCHEDULE = {
+    'reconcile-deal-stats': {
+        'task': 'deals.tasks.stats_tasks.reconcile_deal_stats',
+        'schedule': DEAL_STATS_RECONCILE_INTERVAL,
+    },
+    'refresh-suggestion-benchmarks': {
+        'task': 'deals.tasks.stats_tasks.refresh_suggestion_benchmarks',
+        'schedule': SUGGESTION_BENCHMARK_REFRESH_INTERVAL,
+    },
+}
+
 # Redis
 REDIS_URL = os.getenv('REDIS_URL', 'redis://redis:6379/0')
 
@@ -234,6 +285,43 @@ CACHE_MIDDLEWARE_ALIAS = "default"
 CACHE_MIDDLEWARE_SECONDS = 300
 CACHE_MIDDLEWARE_KEY_PREFIX = "bc"
 
+# In-process (L1) copies of reference data in front of Redis: entries kept
+# per namespace, how often (seconds) a worker re-reads the namespace version
+# stamp, and the pub/sub channel that broadcasts invalidations
+REFERENCE_CACHE_L1_MAX_ENTRIES = int(os.getenv('REFERENCE_CACHE_L1_MAX_ENTRIES', '256'))
+REFERENCE_CACHE_VERSION_CHECK_INTERVAL = float(os.getenv('REFERENCE_CACHE_VERSION_CHECK_INTERVAL', '5'))
+CACHE_INVALIDATION_CHANNEL = os.getenv('CACHE_INVALIDATION_CHANNEL', 'cache_invalidation')
+
+# Stampede protection: how long (seconds) an expired or invalidated value is
+# kept to serve while one request recomputes it, how long a recompute lock is
+# held at most, and how long requests with no value to fall back on wait for it
+CACHE_STALE_TTL = int(os.getenv('CACHE_STALE_TTL', '86400'))
+CACHE_LOCK_TIMEOUT = int(os.getenv('CACHE_LOCK_TIMEOUT', '10'))
+CACHE_LOCK_WAIT = float(os.getenv('CACHE_LOCK_WAIT', '2'))
+
+# Pre-rendered, pre-compressed response bodies of reference endpoints:
+# lifetime in seconds, bodies kept per process, and the size below which
+# bodies are not compressed
+RENDERED_CACHE_TIMEOUT = int(os.getenv('RENDERED_CACHE_TIMEOUT', '3600'))
+RENDERED_CACHE_L1_MAX_ENTRIES = int(os.getenv('RENDERED_CACHE_L1_MAX_ENTRIES', '128'))
+RENDERED_CACHE_MIN_COMPRESS_SIZE = int(os.getenv('RENDERED_CACHE_MIN_COMPRESS_SIZE', '200'))
+
+# Cache warm-up (deals.services.cache_warmup): whether gunicorn and Celery
+# workers warm the caches before taking traffic, how long (seconds) after
+# one worker warmed the shared caches the others only warm their own
+# process, how many warmers run at once, and the Host / Accept headers
+# rendered responses are warmed for
+CACHE_WARMUP_ON_START = os.getenv('CACHE_WARMUP_ON_START', 'True').lower() in ('true', '1', 'yes')
+CACHE_WARMUP_LOCK_TIMEOUT = int(os.getenv('CACHE_WARMUP_LOCK_TIMEOUT', '300'))
+CACHE_WARMUP_WORKERS = int(os.getenv('CACHE_WARMUP_WORKERS', '4'))
+CACHE_WARMUP_HOSTS = os.getenv('CACHE_WARMUP_HOSTS', ALLOWED_HOSTS[0]).split(',')
+CACHE_WARMUP_ACCEPT = os.getenv('CACHE_WARMUP_ACCEPT', 'application/json')
+
+# Cache hit/miss/latency metrics (deals.cache_metrics): whether they are
+# recorded, and how often (seconds) each process adds its counts to Redis
+CACHE_METRICS_ENABLED = os.getenv('CACHE_METRICS_ENABLED', 'True').lower() in ('true', '1', 'yes')
+CACHE_METRICS_FLUSH_INTERVAL = float(os.getenv('CACHE_METRICS_FLUSH_INTERVAL', '10'))
+
 # Security Settings
 if not DEBUG:
     SECURE_BROWSER_XSS_FILTER = True
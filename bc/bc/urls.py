@@ -27,6 +27,8 @@ urlpatterns = [
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 
+from bc.schema import CachedSchemaGenerator
+
 schema_view = get_schema_view(
     openapi.Info(
         title="BC API",
@@ -34,6 +36,7 @@ schema_view = get_schema_view(
         description="API for BC",
     ),
     public=True,
+    generator_class=CachedSchemaGenerator,
 )
 
 urlpatterns += [
@@ -1,9 +1,14 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.postgres.search import SearchQuery
+from django.urls import reverse
 from django.utils.html import format_html
 
 from .models import (DropdownOption, NewBusinessConfirmation, CommercialTerms, 
                      AdditionalClause, PaymentTerms, BusinessConfirmationDeal, 
-                     TaskStatus)
+                     TaskStatus, DealBulkJob)
+from .models.search import SEARCH_CONFIG
+from .pagination import EstimatedCountPaginator
+from .services import bulk_deal_actions
 
 
 @admin.register(AdditionalClause)
@@ -37,6 +42,13 @@ class AdditionalClauseAdmin(admin.ModelAdmin):
         return obj.clause[:70] + ("..." if len(obj.clause) > 70 else "")
     short_clause.short_description = "Clause Preview"
 
+    def get_search_results(self, request, queryset, search_term):
+        """Search clauses through the full-text index instead of ILIKE."""
+        if not search_term:
+            return queryset, False
+        query = SearchQuery(search_term, search_type="websearch", config=SEARCH_CONFIG)
+        return queryset.filter(search_vector=query), False
+
 
 @admin.register(DropdownOption)
 class DropdownOptionAdmin(admin.ModelAdmin):
@@ -277,8 +289,20 @@ class PaymentTermsAdmin(admin.ModelAdmin):
     readonly_fields = ("created_at", "updated_at")
 
 
+class LargeTableAdminMixin:
+    """
+    Changelist settings for tables that grow without bound: estimated
+    counts above a threshold, no second COUNT(*) for the unfiltered total,
+    and no date_hierarchy (its year links need SELECT DISTINCT over the
+    whole table); the created_at list filter covers date drill-down.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    date_hierarchy = None
+
+
 @admin.register(BusinessConfirmationDeal)
-class BusinessConfirmationDealAdmin(admin.ModelAdmin):
+class BusinessConfirmationDealAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = (
         "id",
         "user",
@@ -289,44 +313,77 @@ class BusinessConfirmationDealAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     )
+    list_select_related = (
+        "user",
+        "new_business_confirmation",
+        "commercial_terms",
+        "payment_terms",
+    )
     list_filter = ("status", "created_at", "updated_at")
     search_fields = (
         "id",
         "user__username",
         "new_business_confirmation__buyer",
         "new_business_confirmation__seller",
-        "commercial_terms__incoterm",
+        "commercial_terms__delivery_term",
         "payment_terms__payment_method",
     )
     readonly_fields = ("created_at", "updated_at")
     ordering = ("-created_at",)
-    date_hierarchy = "created_at"
     autocomplete_fields = (
         "user",
         "new_business_confirmation",
         "commercial_terms",
         "payment_terms",
     )
+    actions = ("submit_selected_deals", "cancel_selected_deals", "reprocess_selected_deals")
+
+    def _queue_bulk_job(self, request, queryset, action):
+        """Queue a bulk job for the selected deals and link to its progress."""
+        job = bulk_deal_actions.enqueue(action, queryset, user=request.user)
+        self.message_user(
+            request,
+            format_html(
+                '{} of {} deals queued. <a href="{}">Follow progress</a>.',
+                job.get_action_display(),
+                job.total,
+                reverse("admin:deals_dealbulkjob_change", args=[job.pk]),
+            ),
+            messages.SUCCESS,
+        )
+
+    def submit_selected_deals(self, request, queryset):
+        """Submit draft and cancelled deals for processing in the background."""
+        self._queue_bulk_job(request, queryset, DealBulkJob.SUBMIT)
+    submit_selected_deals.short_description = "Submit selected deals for processing"
+
+    def cancel_selected_deals(self, request, queryset):
+        """Cancel draft and submitted deals in the background."""
+        self._queue_bulk_job(request, queryset, DealBulkJob.CANCEL)
+    cancel_selected_deals.short_description = "Cancel selected deals"
+
+    def reprocess_selected_deals(self, request, queryset):
+        """Queue submitted, processing and completed deals for processing again."""
+        self._queue_bulk_job(request, queryset, DealBulkJob.REPROCESS)
+    reprocess_selected_deals.short_description = "Reprocess selected deals"
 
 
 @admin.register(TaskStatus)
-class TaskStatusAdmin(admin.ModelAdmin):
-    list_display = ("id", "task_id", "deal", "status", "created_at", "updated_at")
+class TaskStatusAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "task_id", "deal_display", "status", "created_at", "updated_at")
+    list_select_related = ("deal__user",)
     list_filter = ("status", "created_at", "updated_at")
     search_fields = ("task_id", "deal__id", "deal__user__username")
     readonly_fields = ("created_at", "updated_at")
     ordering = ("-created_at",)
-    date_hierarchy = "created_at"
     autocomplete_fields = ("deal",)
 
-    def get_queryset(self, request):
-        """Optimize queryset with select_related if needed (for future FKs)."""
-        return super().get_queryset(request)
-
     def deal_display(self, obj):
         """Display deal information in list view."""
         if not obj.deal:
             return "-"
+        if not obj.deal.user:
+            return str(obj.deal.id)
         return f"{obj.deal.id} - {obj.deal.user.username}"
     deal_display.short_description = "Deal"
 
@@ -347,4 +404,26 @@ class TaskStatusAdmin(admin.ModelAdmin):
             return format_html('<span style="color: #17a2b8;">{}</span>', obj.get_status_display())
         elif obj.status == TaskStatus.FAILED:
             return format_html('<span style="color: #dc3545;">{}</span>', obj.get_status_display())
-        return obj.get_status_display()
\ No newline at end of file
+        return obj.get_status_display()
+
+
+@admin.register(DealBulkJob)
+class DealBulkJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "action", "status", "progress_display", "changed", "requested_by", "created_at", "completed_at")
+    list_select_related = ("requested_by",)
+    list_filter = ("action", "status", "created_at")
+    readonly_fields = (
+        "id", "task_id", "action", "requested_by", "status", "total", "processed",
+        "changed", "skipped", "message", "created_at", "updated_at", "completed_at",
+    )
+    ordering = ("-created_at",)
+
+    def has_add_permission(self, request):
+        """Jobs are only created by the deal admin actions."""
+        return False
+
+    def progress_display(self, obj):
+        """Display processed/total with a percentage."""
+        percent = obj.processed * 100 // obj.total if obj.total else 100
+        return f"{obj.processed}/{obj.total} ({percent}%)"
+    progress_display.short_description = "Progress"
@@ -6,4 +6,11 @@ class DealsConfig(AppConfig):
     name = "deals"
     
     def ready(self):
+        from django.db.models.signals import pre_migrate
         import deals.signals
+
+        pre_migrate.connect(
+            deals.signals.create_postgres_extensions,
+            sender=self,
+            dispatch_uid="deals_create_postgres_extensions",
+        )
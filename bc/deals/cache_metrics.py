@@ -0,0 +1,167 @@
+"""
+Hit, miss and latency counters for the deals caches.
+
+Every logical cache records its lookups here: fresh hits, misses, stale
+serves, and how long recomputing a miss took. Counts are buffered per
+process and added to one Redis hash per cache (HINCRBY) at most every
+CACHE_METRICS_FLUSH_INTERVAL seconds, so recording costs no network round
+trip. Recompute times are counted in fixed histogram buckets, which add up
+across processes and give p50/p95 without keeping every sample.
+"""
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+import redis
+from django.conf import settings
+
+from deals import caching
+
+logger = logging.getLogger("deals")
+
+
+METRICS_KEY = "cache_metrics:{}"
+NAMES_KEY = "cache_metrics:names"
+
+HITS = "hits"
+MISSES = "misses"
+STALE = "stale"
+RECOMPUTES = "recomputes"
+RECOMPUTE_MS = "recompute_ms"
+
+# Upper bounds (ms) of the recompute latency buckets; slower recomputes
+# fall into the last, open-ended bucket
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+OVERFLOW_BUCKET = "le_inf"
+
+
+def _bucket(ms: float) -> str:
+    for bound in LATENCY_BUCKETS_MS:
+        if ms <= bound:
+            return f"le_{bound}"
+    return OVERFLOW_BUCKET
+
+
+class _Buffer:
+    def __init__(self):
+        self.counts = Counter()
+        self.lock = threading.Lock()
+        self.flushed_at = time.monotonic()
+        self.pid = os.getpid()
+
+
+_buffer = _Buffer()
+
+
+def _add(name: str, **fields) -> None:
+    if not settings.CACHE_METRICS_ENABLED:
+        return
+    with _buffer.lock:
+        if _buffer.pid != os.getpid():
+            # Forked worker: the parent's unflushed counts are the parent's
+            _buffer.counts.clear()
+            _buffer.pid = os.getpid()
+        for field, value in fields.items():
+            if value:
+                _buffer.counts[(name, field)] += value
+        due = time.monotonic() - _buffer.flushed_at >= settings.CACHE_METRICS_FLUSH_INTERVAL
+    if due:
+        flush()
+
+
+def record(name: str, hits: int = 0, misses: int = 0, stale: int = 0) -> None:
+    """Count lookups of cache ``name``."""
+    _add(name, **{HITS: hits, MISSES: misses, STALE: stale})
+
+
+def record_recompute(name: str, seconds: float) -> None:
+    ms = seconds * 1000
+    _add(name, **{RECOMPUTES: 1, RECOMPUTE_MS: round(ms), _bucket(ms): 1})
+
+
+@contextmanager
+def timed(name: str):
+    """Record the duration of the block as one recompute of cache ``name``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_recompute(name, time.perf_counter() - started)
+
+
+def flush() -> None:
+    """Add this process's buffered counts to Redis."""
+    with _buffer.lock:
+        counts, _buffer.counts = _buffer.counts, Counter()
+        _buffer.flushed_at = time.monotonic()
+    if not counts:
+        return
+    try:
+        pipe = caching._redis_client().pipeline(transaction=False)
+        for (name, field), value in counts.items():
+            pipe.hincrby(METRICS_KEY.format(name), field, value)
+        pipe.sadd(NAMES_KEY, *{name for name, _ in counts})
+        pipe.execute()
+    except redis.RedisError as e:
+        # Metrics are best effort; losing one interval is fine
+        logger.warning(f"Failed to flush cache metrics: {str(e)}")
+
+
+def _percentile(histogram, total: int, fraction: float):
+    """
+    Upper bound (ms) of the bucket holding the ``fraction`` quantile, or the
+    largest bound when it is in the open-ended bucket; None without samples.
+    """
+    if not total:
+        return None
+    seen = 0
+    for bound in LATENCY_BUCKETS_MS:
+        seen += histogram.get(f"le_{bound}", 0)
+        if seen >= fraction * total:
+            return bound
+    return LATENCY_BUCKETS_MS[-1]
+
+
+def report(names=None):
+    """
+    Aggregated metrics per cache, all processes included. ``hit_ratio`` is
+    fresh hits over all lookups; stale serves are reported separately.
+    """
+    flush()
+    client = caching._redis_client()
+    names = sorted(name.decode() for name in client.smembers(NAMES_KEY)) if names is None else list(names)
+    pipe = client.pipeline(transaction=False)
+    for name in names:
+        pipe.hgetall(METRICS_KEY.format(name))
+
+    rows = []
+    for name, raw in zip(names, pipe.execute()):
+        values = {field.decode(): int(value) for field, value in raw.items()}
+        hits, misses, stale = values.get(HITS, 0), values.get(MISSES, 0), values.get(STALE, 0)
+        lookups = hits + misses + stale
+        recomputes = values.get(RECOMPUTES, 0)
+        rows.append({
+            "cache": name,
+            "lookups": lookups,
+            "hits": hits,
+            "misses": misses,
+            "stale": stale,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+            "recomputes": recomputes,
+            "recompute_avg_ms": round(values.get(RECOMPUTE_MS, 0) / recomputes, 1) if recomputes else None,
+            "recompute_p50_ms": _percentile(values, recomputes, 0.5),
+            "recompute_p95_ms": _percentile(values, recomputes, 0.95),
+        })
+    return rows
+
+
+def reset() -> None:
+    """Drop all aggregated metrics, including this process's buffer."""
+    with _buffer.lock:
+        _buffer.counts.clear()
+    client = caching._redis_client()
+    names = [name.decode() for name in client.smembers(NAMES_KEY)]
+    client.delete(NAMES_KEY, *(METRICS_KEY.format(name) for name in names))
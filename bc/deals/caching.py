@@ -0,0 +1,385 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+
+from deals import cache_metrics
+
+logger = logging.getLogger("deals")
+
+
+class LocalCache:
+    """
+    Small thread-safe LRU with optional per-entry expiry, local to the
+    process. ``ttl=None`` keeps entries until they are evicted or cleared.
+    """
+
+    def __init__(self, max_entries: int, ttl: float = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry[0] is not None and entry[0] < time.monotonic()):
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value) -> None:
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_checks = threading.local()
+
+
+class FreshnessCheck:
+    """Whether a stale value was served while the check was active (see verified_reads())."""
+
+    def __init__(self):
+        self.stale = False
+
+
+@contextmanager
+def verified_reads():
+    """
+    Within the block, TieredCache checks its version stamp against Redis on
+    every read instead of once per check interval, and serving a stale
+    value (stale-while-revalidate) is recorded on the yielded
+    FreshnessCheck. For callers that store what they build from the cache
+    under a key of their own, which must not outlive the values it used.
+    """
+    check = FreshnessCheck()
+    _active_checks().append(check)
+    try:
+        yield check
+    finally:
+        _active_checks().remove(check)
+
+
+def _active_checks():
+    if not hasattr(_checks, "active"):
+        _checks.active = []
+    return _checks.active
+
+
+def _verifying() -> bool:
+    return bool(_active_checks())
+
+
+def _report_stale() -> None:
+    for check in _active_checks():
+        check.stale = True
+
+
+class SingleFlightCache:
+    """
+    Redis cache with stampede protection and stale-while-revalidate.
+
+    Each value is stored with a separate freshness marker. The marker
+    expires after ``timeout`` and is deleted on invalidation. The value
+    itself is kept CACHE_STALE_TTL seconds longer, as a fallback. When a
+    key is not fresh, one caller wins a Redis lock (SET NX with expiry) and
+    recomputes it. Everyone else gets the previous value immediately. When
+    there is no previous value, they wait up to CACHE_LOCK_WAIT seconds for
+    the winner's result.
+    """
+
+    def __init__(self, namespace: str, timeout: int):
+        self.namespace = namespace
+        self.timeout = timeout
+
+    def prefix(self) -> str:
+        return self.namespace
+
+    def key(self, key: str) -> str:
+        return f"{self.prefix()}:{key}"
+
+    def fresh_key(self, key: str) -> str:
+        return f"{self.prefix()}:{key}:fresh"
+
+    def lock_key(self, key: str) -> str:
+        return f"lock:{self.prefix()}:{key}"
+
+    def _lookup(self, keys):
+        """Split ``keys`` into ``(fresh values, stale values)``; absent keys are in neither."""
+        names = [self.key(key) for key in keys] + [self.fresh_key(key) for key in keys]
+        values = cache.get_many(names)
+        fresh, stale = {}, {}
+        for key in keys:
+            value = values.get(self.key(key))
+            if value is None:
+                continue
+            if self.fresh_key(key) in values:
+                fresh[key] = value
+            else:
+                stale[key] = value
+        return fresh, stale
+
+    def get_many(self, keys):
+        """Fresh values for ``keys``; stale values count as misses."""
+        return self._lookup(keys)[0]
+
+    def get(self, key, default=None):
+        return self.get_many([key]).get(key, default)
+
+    def set_many(self, data) -> None:
+        cache.set_many({self.key(key): value for key, value in data.items()}, self.timeout + settings.CACHE_STALE_TTL)
+        cache.set_many({self.fresh_key(key): 1 for key in data}, self.timeout)
+
+    def set(self, key, value) -> None:
+        self.set_many({key: value})
+
+    def get_or_set_many(self, keys, compute):
+        """
+        Values for all ``keys``. ``compute(missing_keys)`` must return a
+        dict with a value for every key it is given. It is called at most
+        once, only for keys this caller won the lock for (or gave up
+        waiting on), so missing keys are still loaded in one batch.
+        """
+        keys = list(keys)
+        result, stale = self._lookup(keys)
+        pending = [key for key in keys if key not in result]
+        if not pending:
+            cache_metrics.record(self.namespace, hits=len(keys))
+            return result
+
+        token = uuid.uuid4().hex
+        owned = [key for key in pending if cache.add(self.lock_key(key), token, settings.CACHE_LOCK_TIMEOUT)]
+        try:
+            served_stale = [key for key in pending if key not in owned and key in stale]
+            result.update({key: stale[key] for key in served_stale})
+            if served_stale:
+                _report_stale()
+            cache_metrics.record(
+                self.namespace, hits=len(keys) - len(pending), stale=len(served_stale),
+                misses=len(pending) - len(served_stale),
+            )
+            waiting = [key for key in pending if key not in owned and key not in stale]
+            if waiting:
+                result.update(self._wait_for(waiting))
+            todo = owned + [key for key in waiting if key not in result]
+            if todo:
+                with cache_metrics.timed(self.namespace):
+                    computed = compute(todo)
+                self.set_many(computed)
+                result.update(computed)
+        finally:
+            self._release(owned, token)
+        return result
+
+    def get_or_set(self, key, compute):
+        """Single-key get_or_set_many; ``compute()`` takes no arguments."""
+        return self.get_or_set_many([key], lambda keys: {key: compute()})[key]
+
+    def _wait_for(self, keys):
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+        found = {}
+        while True:
+            found.update(self.get_many([key for key in keys if key not in found]))
+            if len(found) == len(keys) or time.monotonic() >= deadline:
+                return found
+            time.sleep(0.05)
+
+    def _release(self, keys, token) -> None:
+        if not keys:
+            return
+        held = cache.get_many([self.lock_key(key) for key in keys])
+        cache.delete_many([name for name, value in held.items() if value == token])
+
+    def invalidate(self, keys=()) -> None:
+        """
+        Mark ``keys`` stale. Their values stay in Redis, so the next reader
+        recomputes while concurrent readers are served the old value.
+        """
+        if keys:
+            cache.delete_many([self.fresh_key(key) for key in keys])
+
+
+class TieredCache(SingleFlightCache):
+    """
+    Two-tier cache for reference data: an in-process LRU (L1) in front of
+    the shared Redis cache (L2), which keeps SingleFlightCache semantics.
+
+    Every namespace has a version stamp in Redis that changes on each
+    invalidation. L1 entries are tagged with the stamp they were filled
+    under and are only served while it is current. The stamp itself is
+    re-read at most every REFERENCE_CACHE_VERSION_CHECK_INTERVAL seconds,
+    so most hits make no network call. Invalidations are also broadcast over
+    Redis pub/sub, which makes other processes drop their L1 immediately.
+    The check interval bounds staleness if a message is missed.
+
+    invalidate_all() drops the whole namespace, including keys the caller
+    cannot name: it changes a generation stamp that is part of every Redis
+    key, read together with the version stamp.
+    """
+    VERSION_KEY = "cache_version:{}"
+    GENERATION_KEY = "cache_generation:{}"
+
+    def __init__(self, namespace: str, timeout: int, max_entries: int = None):
+        super().__init__(namespace, timeout)
+        self.version_key = self.VERSION_KEY.format(namespace)
+        self.generation_key = self.GENERATION_KEY.format(namespace)
+        self.local = LocalCache(max_entries or settings.REFERENCE_CACHE_L1_MAX_ENTRIES, ttl=timeout)
+        self._version = None
+        self._generation = 0
+        self._version_checked_at = 0.0
+        self._lock = threading.Lock()
+        _registry[namespace] = self
+
+    def version(self):
+        """
+        The namespace version stamp, re-read from Redis at most once per
+        check interval, or on every call inside verified_reads().
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._version is not None and not _verifying()
+                and now - self._version_checked_at < settings.REFERENCE_CACHE_VERSION_CHECK_INTERVAL
+            ):
+                return self._version
+        _ensure_listener()
+        stamps = cache.get_many([self.version_key, self.generation_key])
+        version = stamps.get(self.version_key)
+        if version is None:
+            # First use, or Redis lost the stamp: start a new one
+            cache.add(self.version_key, time.time_ns(), None)
+            version = cache.get(self.version_key)
+        with self._lock:
+            if version != self._version:
+                self.local.clear()
+            self._version, self._version_checked_at = version, now
+            self._generation = stamps.get(self.generation_key, 0)
+        return version
+
+    def prefix(self) -> str:
+        self.version()
+        return f"{self.namespace}:{self._generation}"
+
+    def _lookup(self, keys):
+        """L1 first; fresh L2 values are copied into L1, stale ones are not."""
+        version = self.version()
+        fresh, remote = {}, []
+        for key in keys:
+            entry = self.local.get(key)
+            if entry is not None and entry[0] == version:
+                fresh[key] = entry[1]
+            else:
+                remote.append(key)
+        if not remote:
+            return fresh, {}
+        remote_fresh, stale = super()._lookup(remote)
+        for key, value in remote_fresh.items():
+            self.local.set(key, (version, value))
+        fresh.update(remote_fresh)
+        return fresh, stale
+
+    def set_many(self, data) -> None:
+        version = self.version()
+        super().set_many(data)
+        for key, value in data.items():
+            self.local.set(key, (version, value))
+
+    def invalidate(self, keys=()) -> None:
+        """
+        Mark ``keys`` stale in L2, change the namespace version and tell
+        every process to drop its L1 copy of the namespace.
+        """
+        super().invalidate(keys)
+        cache.set(self.version_key, time.time_ns(), None)
+        self.clear_local()
+        _publish(self.namespace)
+
+    def invalidate_all(self) -> None:
+        """
+        Invalidate every key of the namespace. Unlike invalidate(), no stale
+        values are left to serve while the first readers recompute.
+        """
+        cache.set(self.generation_key, time.time_ns(), None)
+        self.invalidate()
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self.local.clear()
+            self._version = None
+
+
+_registry = {}
+_listener = {"pid": None}
+_listener_lock = threading.Lock()
+_clients = {}
+
+
+def _redis_client():
+    """A redis-py client for pub/sub, one per process (connections do not survive fork)."""
+    client = _clients.get(os.getpid())
+    if client is None:
+        client = _clients[os.getpid()] = redis.Redis.from_url(settings.REDIS_URL)
+    return client
+
+
+def _publish(namespace: str) -> None:
+    try:
+        _redis_client().publish(settings.CACHE_INVALIDATION_CHANNEL, json.dumps({"namespace": namespace}))
+    except redis.RedisError as e:
+        # Other processes still notice the new version stamp within the check interval
+        logger.warning(f"Failed to broadcast invalidation of {namespace}: {str(e)}")
+
+
+def _listen() -> None:
+    backoff = 1
+    while True:
+        try:
+            pubsub = _redis_client().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+            backoff = 1
+            for message in pubsub.listen():
+                namespace = json.loads(message["data"]).get("namespace")
+                tiered_cache = _registry.get(namespace)
+                if tiered_cache is not None:
+                    tiered_cache.clear_local()
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener disconnected, retrying in {backoff}s: {str(e)}")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+
+def _ensure_listener() -> None:
+    """
+    Start the invalidation listener thread once per process. Checked on use
+    rather than at import so that forked gunicorn/Celery workers each get
+    their own thread.
+    """
+    if _listener["pid"] == os.getpid():
+        return
+    with _listener_lock:
+        if _listener["pid"] == os.getpid():
+            return
+        threading.Thread(target=_listen, name="cache-invalidation-listener", daemon=True).start()
+        _listener["pid"] = os.getpid()
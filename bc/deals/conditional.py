@@ -0,0 +1,181 @@
+"""
+Conditional GET (ETag / Last-Modified) for the deals API.
+
+Validators are derived without serializing anything. Lists use per-table
+version stamps kept in the cache and bumped from post_save/post_delete
+(see deals.signals), so a 304 costs no database query at all. Task status,
+which clients poll per row while other tasks churn, uses ``MAX(updated_at)``
+and ``COUNT(*)`` over a primary key lookup instead.
+
+Models registered with track_models() are bumped automatically, once per
+transaction after it commits. Writes that bypass model signals
+(``QuerySet.update()``, ``bulk_create()``) must call
+bump_table_versions_on_commit() themselves, unless the model's manager is
+built from VersionedQuerySet.
+"""
+import hashlib
+import time
+from collections import namedtuple
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db.models import Count, Max, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from deals import invalidation
+
+
+Validators = namedtuple("Validators", ["etag", "last_modified"])
+
+TABLE_VERSION_KEY = "table_version:{}"
+
+# Sent with ``sender=model`` after VersionedQuerySet bulk writes, which send
+# no post_save/post_delete
+bulk_changed = Signal()
+
+
+def _etag(request, *parts):
+    """
+    Hash the validator parts with everything else the body depends on: the
+    path and query string (filters, fields, expand, cursor) and the Accept
+    header (JSON vs browsable API).
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    for part in (request.get_full_path(), request.META.get("HTTP_ACCEPT", ""), *parts):
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"|")
+    return quote_etag(digest.hexdigest())
+
+
+def queryset_validators(request, queryset, related=()):
+    """
+    Validators for a queryset of rows with ``updated_at``. ``related`` names
+    forward relations rendered inline whose ``updated_at`` counts as well.
+    """
+    aggregates = {"count": Count("pk"), "updated_at": Max("updated_at")}
+    for relation in related:
+        aggregates[f"{relation}__updated_at"] = Max(f"{relation}__updated_at")
+    values = queryset.order_by().aggregate(**aggregates)
+
+    stamps = [values[name] for name in aggregates if name != "count"]
+    last_modified = max((stamp for stamp in stamps if stamp is not None), default=None)
+    etag = _etag(request, queryset.model._meta.label, values["count"], *stamps)
+    return Validators(etag, last_modified)
+
+
+def bump_table_version(model):
+    """Record that ``model``'s table changed; returns the new version stamp."""
+    stamp = time.time_ns()
+    cache.set(TABLE_VERSION_KEY.format(model._meta.label_lower), stamp, None)
+    return stamp
+
+
+def bump_table_versions(models):
+    for model in models:
+        bump_table_version(model)
+
+
+# A reader that sees a new stamp must find the caches behind the views
+# already invalidated (see deals.response_cache)
+invalidation.run_last(bump_table_versions)
+
+
+def bump_table_versions_on_commit(*models):
+    """
+    bump_table_versions() once the current transaction commits, coalesced
+    per transaction (see deals.invalidation). A reader can then not cache
+    uncommitted rows under the new stamp, and a rolled-back transaction
+    bumps nothing, then or later.
+    """
+    invalidation.invalidate(bump_table_versions, models)
+
+
+def _bump_table_version_on_change(sender, **kwargs):
+    bump_table_versions_on_commit(sender)
+
+
+def track_models(*models):
+    """
+    Bump the table version of each of ``models`` after every save, delete
+    and VersionedQuerySet bulk write commits. Safe to call more than once
+    per model.
+    """
+    for model in models:
+        label = model._meta.label_lower
+        for signal, name in ((post_save, "save"), (post_delete, "delete"), (bulk_changed, "bulk")):
+            signal.connect(
+                _bump_table_version_on_change, sender=model, weak=False,
+                dispatch_uid=f"table_version_{name}_{label}",
+            )
+
+
+class VersionedQuerySet(QuerySet):
+    """
+    QuerySet whose ``update()`` and ``bulk_create()`` (and so
+    ``bulk_update()``) send bulk_changed, for models whose cached views
+    must see writes that bypass model signals.
+    """
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        if rows:
+            bulk_changed.send(sender=self.model)
+        return rows
+
+    update.alters_data = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        created = super().bulk_create(objs, *args, **kwargs)
+        if created:
+            bulk_changed.send(sender=self.model)
+        return created
+
+    bulk_create.alters_data = True
+
+
+def table_validators(request, *models):
+    """Validators for whole tables tracked with bump_table_version()."""
+    keys = [TABLE_VERSION_KEY.format(model._meta.label_lower) for model in models]
+    versions = cache.get_many(keys)
+    stamps = []
+    for model, key in zip(models, keys):
+        stamp = versions.get(key)
+        stamps.append(stamp if stamp is not None else bump_table_version(model))
+    last_modified = datetime.fromtimestamp(max(stamps) / 1e9, tz=dt_timezone.utc)
+    return Validators(_etag(request, *(model._meta.label for model in models), *stamps), last_modified)
+
+
+def related_models(model, relations):
+    """``model`` followed by the models behind the forward ``relations``."""
+    return (model,) + tuple(model._meta.get_field(name).related_model for name in relations)
+
+
+def not_modified(request, validators):
+    """
+    Return a 304 (or 412) response when the request's If-None-Match /
+    If-Modified-Since headers match ``validators``, otherwise None.
+    """
+    last_modified = validators.last_modified
+    response = get_conditional_response(
+        request,
+        etag=validators.etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        with_validators(response, validators)
+    return response
+
+
+def with_validators(response, validators):
+    """Attach ETag / Last-Modified to a successful or 304 response."""
+    if response.status_code not in (200, 304):
+        return response
+    response["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response["Last-Modified"] = http_date(validators.last_modified.timestamp())
+    # Browsers may keep the body but must revalidate before reusing it
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,163 @@
+"""
+Read-only fast path for list endpoints.
+
+DRF's ModelSerializer instantiates a model per row and walks a field object
+per column. For plain reads we can skip both: fetch ``values_list()`` tuples
+and convert each column with a converter compiled once per serializer. The
+output is the same dicts, in the same key order, as ``serializer.data``.
+"""
+from datetime import date
+
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+
+class UnsupportedSerializer(Exception):
+    """Raised when a serializer has fields the fast path cannot reproduce."""
+
+
+# Fields whose to_representation() is the identity for values read from the
+# database (str for CharField, int for IntegerField, and so on).
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.JSONField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+def _file_url_converter(model_field):
+    storage = model_field.storage
+
+    def to_url(name):
+        return storage.url(name) if name else None
+    return to_url
+
+
+def _iso_datetime_converter(field):
+    """
+    DateTimeField.to_representation() for ISO output with the timezone
+    resolved once instead of per value. Naive values take the DRF path.
+    """
+    field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if field_timezone is None:
+        return field.to_representation
+    fallback = field.to_representation
+
+    def to_iso(value):
+        if value.tzinfo is None:
+            return fallback(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+    return to_iso
+
+
+def _compile_converter(field, model_field):
+    """
+    Return the converter for one serializer field: ``None`` for identity,
+    otherwise a callable applied to non-null column values.
+    """
+    if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is not None:
+        return field.pk_field.to_representation
+    if isinstance(field, IDENTITY_FIELDS) and not isinstance(field, serializers.FileField):
+        if isinstance(field, serializers.JSONField) and field.binary:
+            return field.to_representation
+        return None
+    if isinstance(field, serializers.UUIDField):
+        return str if field.uuid_format == "hex_verbose" else field.to_representation
+    if isinstance(field, serializers.DecimalField):
+        coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        if coerce_to_string or field.normalize_output:
+            return field.to_representation
+        # Postgres numeric(max_digits, decimal_places) is already quantized
+        return None
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if output_format and output_format.lower() == "iso-8601":
+            return _iso_datetime_converter(field)
+        return field.to_representation
+    if isinstance(field, serializers.DateField):
+        output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+        if output_format and output_format.lower() == "iso-8601":
+            return date.isoformat
+        return field.to_representation
+    if isinstance(field, serializers.FileField):
+        if not getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL):
+            return field.to_representation
+        if field.context.get("request") is not None:
+            raise UnsupportedSerializer("absolute file URLs need the request")
+        return _file_url_converter(model_field)
+    raise UnsupportedSerializer(f"{type(field).__name__} is not supported")
+
+
+class FastListReader:
+    """
+    Compiled reader for one serializer configuration.
+
+    ``columns`` is the ``values_list()`` column list: the keyset columns
+    first, then one column per rendered field (nested relations are read
+    through ``relation__field`` joins).
+    """
+
+    def __init__(self, serializer, key_columns=()):
+        self.columns = list(key_columns)
+        self.plan = self._compile(serializer, prefix="")
+
+    def _column(self, name):
+        self.columns.append(name)
+        return len(self.columns) - 1
+
+    def _compile(self, serializer, prefix):
+        model = serializer.Meta.model
+        plan = []
+        for field in serializer._readable_fields:
+            if field.source == "*" or "." in field.source:
+                raise UnsupportedSerializer(f"{field.field_name} has a dotted source")
+            if isinstance(field, serializers.BaseSerializer):
+                related_pk = field.Meta.model._meta.pk.name
+                nested_prefix = f"{prefix}{field.source}__"
+                presence = self._column(nested_prefix + related_pk)
+                plan.append((field.field_name, presence, None, self._compile(field, nested_prefix)))
+                continue
+            model_field = model._meta.get_field(field.source)
+            converter = _compile_converter(field, model_field)
+            plan.append((field.field_name, self._column(prefix + field.source), converter, None))
+        return plan
+
+    def queryset(self, queryset):
+        return queryset.values_list(*self.columns)
+
+    def _render_row(self, plan, row):
+        output = {}
+        for name, index, converter, nested in plan:
+            value = row[index]
+            if nested is not None:
+                output[name] = None if value is None else self._render_row(nested, row)
+            elif converter is None or value is None:
+                output[name] = value
+            else:
+                output[name] = converter(value)
+        return output
+
+    def render(self, rows):
+        plan = self.plan
+        render_row = self._render_row
+        return [render_row(plan, row) for row in rows]
+
+
+def get_fast_reader(serializer_class, key_columns=(), **serializer_kwargs):
+    """
+    Build a FastListReader for ``serializer_class``, or return None when the
+    fast path is disabled or the serializer uses unsupported fields.
+    """
+    if not getattr(settings, "FAST_LIST_SERIALIZATION", True):
+        return None
+    try:
+        return FastListReader(serializer_class(**serializer_kwargs), key_columns)
+    except UnsupportedSerializer:
+        return None
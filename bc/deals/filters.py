@@ -0,0 +1,122 @@
+from rest_framework import serializers
+from drf_yasg import openapi
+
+from deals.models import BusinessConfirmationDeal
+
+
+class BusinessConfirmationDealFilterSerializer(serializers.Serializer):
+    """
+    Validates the query parameters accepted by the deal list.
+
+    Every filter maps onto an indexed column: (status, created_at),
+    (user_id, created_at), NewBusinessConfirmation material/buyer/seller
+    and CommercialTerms delivery_term.
+    """
+    ORDERING_FIELDS = ("created_at", "updated_at", "status")
+
+    status = serializers.MultipleChoiceField(
+        choices=BusinessConfirmationDeal.STATUS_CHOICES, required=False
+    )
+    user = serializers.IntegerField(required=False)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    updated_after = serializers.DateTimeField(required=False)
+    updated_before = serializers.DateTimeField(required=False)
+    material = serializers.CharField(required=False)
+    buyer = serializers.CharField(required=False)
+    seller = serializers.CharField(required=False)
+    delivery_term = serializers.CharField(required=False)
+    ordering = serializers.ChoiceField(
+        choices=[prefix + field for field in ORDERING_FIELDS for prefix in ("", "-")],
+        required=False
+    )
+
+    LOOKUPS = {
+        "user": "user_id",
+        "created_after": "created_at__gte",
+        "created_before": "created_at__lt",
+        "updated_after": "updated_at__gte",
+        "updated_before": "updated_at__lt",
+        "material": "new_business_confirmation__material",
+        "buyer": "new_business_confirmation__buyer",
+        "seller": "new_business_confirmation__seller",
+        "delivery_term": "commercial_terms__delivery_term",
+    }
+
+    def to_internal_value(self, data):
+        # Accept ?status=draft,submitted as well as repeated ?status= params
+        if hasattr(data, "getlist") and "status" in data:
+            data = data.copy()
+            statuses = [value for raw in data.getlist("status") for value in raw.split(",") if value]
+            data.setlist("status", statuses)
+        return super().to_internal_value(data)
+
+    def related_models(self):
+        """
+        Models behind the relations the validated filters join, whose
+        changes can move deals in or out of the filtered list.
+        """
+        fields = dict.fromkeys(
+            BusinessConfirmationDeal._meta.get_field(lookup.split("__")[0])
+            for name, lookup in self.LOOKUPS.items() if name in self.validated_data and "__" in lookup
+        )
+        return tuple(field.related_model for field in fields if field.is_relation)
+
+    def filter_queryset(self, queryset):
+        params = self.validated_data
+        if params.get("status"):
+            queryset = queryset.filter(status__in=sorted(params["status"]))
+        lookups = {
+            lookup: params[name] for name, lookup in self.LOOKUPS.items() if name in params
+        }
+        return queryset.filter(**lookups)
+
+
+DEAL_FILTER_PARAMETERS = [
+    openapi.Parameter(
+        "status", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=False,
+        description="Deal status; comma-separated for several (e.g. draft,submitted)"
+    ),
+    openapi.Parameter(
+        "user", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, required=False,
+        description="ID of the deal owner"
+    ),
+    openapi.Parameter(
+        "created_after", openapi.IN_QUERY, type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME,
+        required=False, description="Only deals created at or after this time"
+    ),
+    openapi.Parameter(
+        "created_before", openapi.IN_QUERY, type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME,
+        required=False, description="Only deals created before this time"
+    ),
+    openapi.Parameter(
+        "updated_after", openapi.IN_QUERY, type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME,
+        required=False, description="Only deals updated at or after this time"
+    ),
+    openapi.Parameter(
+        "updated_before", openapi.IN_QUERY, type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME,
+        required=False, description="Only deals updated before this time"
+    ),
+    openapi.Parameter(
+        "material", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=False,
+        description="Exact material of the new business confirmation"
+    ),
+    openapi.Parameter(
+        "buyer", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=False,
+        description="Exact buyer of the new business confirmation"
+    ),
+    openapi.Parameter(
+        "seller", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=False,
+        description="Exact seller of the new business confirmation"
+    ),
+    openapi.Parameter(
+        "delivery_term", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=False,
+        description="Exact delivery term of the commercial terms"
+    ),
+    openapi.Parameter(
+        "ordering", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=False,
+        enum=[prefix + field for field in BusinessConfirmationDealFilterSerializer.ORDERING_FIELDS
+              for prefix in ("", "-")],
+        description="Sort field, prefix with '-' for descending (default -created_at)"
+    ),
+]
@@ -0,0 +1,115 @@
+"""
+Deferred, coalesced cache invalidation.
+
+Invalidations are queued per thread as ``handler -> set of items`` and run
+after the current transaction commits. A concurrent reader can therefore
+not re-cache rows that are about to change, and a transaction that saves
+many rows invalidates each key once, in one call per handler. Outside a
+transaction they run immediately. Inside bulk_invalidation() they are held
+until the outermost block ends.
+
+If a transaction rolls back, Django drops the flush hook and the next
+invalidate() on the thread discards the items queued for it, so they cannot
+fire during some later, unrelated transaction. Items queued in a savepoint
+that rolls back inside a transaction which already registered the hook
+still run on commit, which only invalidates more than necessary.
+"""
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+
+logger = logging.getLogger("deals")
+
+
+_local = threading.local()
+
+# Handlers that run after every other handler of a flush
+_last = set()
+
+
+def _state():
+    if not hasattr(_local, "pending"):
+        _local.pending = {}
+        _local.suppressed = 0
+        # Whether a flush hook was registered for the pending items
+        _local.scheduled = False
+    return _local
+
+
+def _in_transaction(connection) -> bool:
+    # Atomic blocks opened by TestCase do not count, as in Django's own
+    # durable=True check; tests then see the same behaviour as autocommit
+    return any(not getattr(block, "_from_testcase", False) for block in connection.atomic_blocks)
+
+
+def invalidate(handler, items) -> None:
+    """
+    Queue ``handler(items)``. Items queued for the same handler before the
+    flush are merged into one set, so ``handler`` must accept an iterable
+    and be the same function (or bound method) on every call.
+    """
+    state = _state()
+    _discard_rolled_back(state)
+    state.pending.setdefault(handler, set()).update(items)
+    if not state.suppressed:
+        _schedule()
+
+
+def _hook_registered(connection) -> bool:
+    # Checked against the live hook list rather than a flag, because a
+    # rolled-back savepoint discards the hook registered inside it
+    return any(entry[1] is flush for entry in connection.run_on_commit)
+
+
+def _discard_rolled_back(state) -> None:
+    """Drop the pending items if their flush hook was discarded by a rollback without running."""
+    if state.scheduled and not _hook_registered(transaction.get_connection()):
+        logger.debug(f"Discarding invalidations of a rolled-back transaction: {len(state.pending)} handlers")
+        state.pending, state.scheduled = {}, False
+
+
+def run_last(handler) -> None:
+    """
+    Run ``handler`` after the other handlers of each flush, for stamps that
+    announce a change readers must then find in every cache.
+    """
+    _last.add(handler)
+
+
+def _schedule() -> None:
+    connection = transaction.get_connection()
+    if not _in_transaction(connection):
+        flush()
+    elif not _hook_registered(connection):
+        transaction.on_commit(flush)
+        _state().scheduled = True
+
+
+def flush() -> None:
+    """Run every queued invalidation now. A failing handler does not stop the others."""
+    state = _state()
+    pending, state.pending, state.scheduled = state.pending, {}, False
+    for handler, items in sorted(pending.items(), key=lambda item: item[0] in _last):
+        try:
+            handler(items)
+        except Exception as e:
+            logger.error(f"Cache invalidation {handler.__qualname__} failed for {len(items)} keys: {str(e)}")
+
+
+@contextmanager
+def bulk_invalidation():
+    """
+    Hold invalidations for the duration of a bulk load and emit them once,
+    deduplicated, at the end (after commit when inside a transaction).
+    Also usable as a decorator.
+    """
+    state = _state()
+    state.suppressed += 1
+    try:
+        yield
+    finally:
+        state.suppressed -= 1
+        if not state.suppressed and state.pending:
+            _schedule()
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from deals import cache_metrics
+
+
+class Command(BaseCommand):
+    help = 'Report hit ratio and recompute latency of every deals cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Clear the collected metrics after reporting them',
+        )
+
+    def handle(self, *args, **options):
+        rows = cache_metrics.report()
+        if rows:
+            self.stdout.write(
+                f'{"cache":<24} {"lookups":>9} {"hit ratio":>9} {"stale":>7} {"misses":>7} {"p50 ms":>7} {"p95 ms":>7}'
+            )
+        else:
+            self.stdout.write('No cache metrics recorded yet')
+
+        for row in rows:
+            hit_ratio = '-' if row['hit_ratio'] is None else f'{row["hit_ratio"]:.1%}'
+            p50 = '-' if row['recompute_p50_ms'] is None else f'<={row["recompute_p50_ms"]}'
+            p95 = '-' if row['recompute_p95_ms'] is None else f'<={row["recompute_p95_ms"]}'
+            self.stdout.write(
+                f'{row["cache"]:<24} {row["lookups"]:>9} {hit_ratio:>9} {row["stale"]:>7} '
+                f'{row["misses"]:>7} {p50:>7} {p95:>7}'
+            )
+
+        if options['reset']:
+            cache_metrics.reset()
+            self.stdout.write(self.style.SUCCESS('Cache metrics reset'))
@@ -0,0 +1,58 @@
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from deals.services import deal_export
+
+
+class Command(BaseCommand):
+    help = 'Stream all business confirmation deals with their terms to NDJSON or CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            dest='export_format',
+            choices=deal_export.EXPORT_FORMATS,
+            default=deal_export.NDJSON,
+            help='Output format (default: ndjson)',
+        )
+        parser.add_argument(
+            '--gzip',
+            action='store_true',
+            help='Gzip-compress the output',
+        )
+        parser.add_argument(
+            '--output',
+            help='File to write to (default: stdout)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.DEAL_EXPORT_CHUNK_SIZE,
+            help=f'Rows fetched per database round trip (default: {settings.DEAL_EXPORT_CHUNK_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] <= 0:
+            raise CommandError('--chunk-size must be positive')
+
+        chunks = deal_export.stream_export(
+            options['export_format'],
+            gzip=options['gzip'],
+            chunk_size=options['chunk_size'],
+        )
+
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                written = self._write(chunks, output)
+            self.stderr.write(self.style.SUCCESS(f'Wrote {written} bytes to {options["output"]}'))
+        else:
+            self._write(chunks, sys.stdout.buffer)
+
+    def _write(self, chunks, output):
+        written = 0
+        for chunk in chunks:
+            output.write(chunk)
+            written += len(chunk)
+        output.flush()
+        return written
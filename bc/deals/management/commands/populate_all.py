@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
+from deals.invalidation import bulk_invalidation
 
 
 class Command(BaseCommand):
@@ -32,24 +33,36 @@ class Command(BaseCommand):
             ('populate_commercial_terms', 'Populating commercial terms...'),
             ('populate_payment_terms', 'Populating payment terms...'),
             ('populate_bc_deals', 'Populating business confirmation deals...'),
+            ('refresh_suggestion_benchmarks', 'Computing AI suggestion benchmarks...'),
         ]
 
-        for command_name, description in commands:
-            self.stdout.write(f'{description}')
-            try:
-                if clear_flag and command_name in ['populate_dropdown_options', 'populate_additional_clauses']:
-                    call_command(command_name, clear_flag)
-                elif command_name == 'populate_bc_deals':
-                    # BC deals need fewer records as they combine other models
-                    call_command(command_name, clear_flag, count=min(count, 5))
-                else:
-                    call_command(command_name, clear_flag, count=count)
-                self.stdout.write(self.style.SUCCESS(f'✓ {description} completed'))
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'✗ {description} failed: {str(e)}')
-                )
+        # One invalidation per cache for the whole run, before warming
+        with bulk_invalidation():
+            for command_name, description in commands:
+                self.stdout.write(f'{description}')
+                try:
+                    if clear_flag and command_name in ['populate_dropdown_options', 'populate_additional_clauses']:
+                        call_command(command_name, clear_flag)
+                    elif command_name == 'populate_bc_deals':
+                        # BC deals need fewer records as they combine other models
+                        call_command(command_name, clear_flag, count=min(count, 5))
+                    elif command_name == 'refresh_suggestion_benchmarks':
+                        call_command(command_name)
+                    else:
+                        call_command(command_name, clear_flag, count=count)
+                    self.stdout.write(self.style.SUCCESS(f'✓ {description} completed'))
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.ERROR(f'✗ {description} failed: {str(e)}')
+                    )
 
         self.stdout.write(
             self.style.SUCCESS('Database population completed!')
         )
+
+        # The new rows invalidated the reference caches; refill them
+        self.stdout.write('Warming caches...')
+        try:
+            call_command('warm_caches')
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'✗ Cache warm-up failed: {str(e)}'))
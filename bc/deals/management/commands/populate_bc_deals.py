@@ -7,6 +7,7 @@ from deals.models import (
     PaymentTerms
 )
 import random
+from deals.invalidation import bulk_invalidation
 
 
 class Command(BaseCommand):
@@ -25,6 +26,7 @@ class Command(BaseCommand):
             help='Number of business confirmation deals to create (default: 5)',
         )
 
+    @bulk_invalidation()
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing business confirmation deals...')
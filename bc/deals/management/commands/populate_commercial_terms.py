@@ -3,6 +3,7 @@ from deals.models import CommercialTerms
 from decimal import Decimal
 from datetime import date, timedelta
 import random
+from deals.invalidation import bulk_invalidation
 
 
 class Command(BaseCommand):
@@ -21,6 +22,7 @@ class Command(BaseCommand):
             help='Number of commercial terms to create (default: 10)',
         )
 
+    @bulk_invalidation()
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing commercial terms...')
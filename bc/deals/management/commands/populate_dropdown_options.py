@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from deals.models import DropdownOption
+from deals.invalidation import bulk_invalidation
 
 
 class Command(BaseCommand):
@@ -12,6 +13,7 @@ class Command(BaseCommand):
             help='Clear existing dropdown options before populating',
         )
 
+    @bulk_invalidation()
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing dropdown options...')
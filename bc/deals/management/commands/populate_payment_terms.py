@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from deals.models import PaymentTerms
 from decimal import Decimal
+from deals.invalidation import bulk_invalidation
 
 
 class Command(BaseCommand):
@@ -19,6 +20,7 @@ class Command(BaseCommand):
             help='Number of payment terms to create (default: 10)',
         )
 
+    @bulk_invalidation()
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing payment terms...')
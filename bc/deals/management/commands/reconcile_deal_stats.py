@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from deals.services import deal_stats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the deal stats rollup from the deals tables'
+
+    def handle(self, *args, **options):
+        drifted = deal_stats.reconcile()
+        self.stdout.write(self.style.SUCCESS(f'Deal stats reconciled, {drifted} buckets corrected'))
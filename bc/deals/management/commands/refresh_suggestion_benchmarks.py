@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from deals.services import suggestion_benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the AI suggestion percentile bands from the deals history'
+
+    def handle(self, *args, **options):
+        count = suggestion_benchmarks.refresh()
+        self.stdout.write(self.style.SUCCESS(f'Suggestion benchmarks refreshed: {count} bands'))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from deals.services import cache_warmup
+
+
+class Command(BaseCommand):
+    help = 'Precompute cached reference payloads (dropdowns, clauses, stats rollups, schema)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only',
+            nargs='+',
+            choices=list(cache_warmup.WARMERS),
+            help='Warm only these caches (default: all)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of warmers to run at once (default: CACHE_WARMUP_WORKERS)',
+        )
+
+    def handle(self, *args, **options):
+        results = cache_warmup.warm(options['only'], workers=options['workers'])
+
+        failed = []
+        for name, (result, error, seconds) in results.items():
+            if error is None:
+                self.stdout.write(self.style.SUCCESS(f'✓ {name}: {result} ({seconds:.2f}s)'))
+            else:
+                failed.append(name)
+                self.stdout.write(self.style.ERROR(f'✗ {name} failed: {str(error)}'))
+
+        if failed:
+            raise CommandError(f'Cache warm-up failed for: {", ".join(failed)}')
@@ -4,6 +4,10 @@ from .new_business_confirmation import NewBusinessConfirmation
 from .commercial_terms import CommercialTerms, AdditionalClause
 from .payment_terms import PaymentTerms
 from .task_status import TaskStatus
+from .deal_stats import DealStatsBucket
+from .bulk_job import DealBulkJob
+from .suggestion_benchmark import SuggestionBenchmark
 
 __all__ = ["BusinessConfirmationDeal", "DropdownOption", "CommercialTerms", 
-           "AdditionalClause", "PaymentTerms", "NewBusinessConfirmation", "TaskStatus"]
+           "AdditionalClause", "PaymentTerms", "NewBusinessConfirmation", "TaskStatus",
+           "DealStatsBucket", "DealBulkJob", "SuggestionBenchmark"]
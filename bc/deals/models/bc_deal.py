@@ -72,6 +72,14 @@ class BusinessConfirmationDeal(models.Model):
     class Meta:
         verbose_name = "Business Confirmation Deal"
         verbose_name_plural = "Business Confirmation Deals"
+        indexes = [
+            # Keyset pagination on (created_at, id)
+            models.Index(fields=["created_at", "id"], name="bcdeal_created_id_idx"),
+            # Filtered deal lists
+            models.Index(fields=["status", "created_at"], name="bcdeal_status_created_idx"),
+            models.Index(fields=["user", "created_at"], name="bcdeal_user_created_idx"),
+            models.Index(fields=["updated_at", "id"], name="bcdeal_updated_id_idx"),
+        ]
 
     def __str__(self):
         return f"Business Confirmation Deal {self.id}"
@@ -0,0 +1,101 @@
+import uuid
+
+from django.db import models
+from django.contrib.auth import get_user_model
+
+
+class DealBulkJob(models.Model):
+    """
+    A bulk status change over many deals, started from the deals admin and
+    run by a Celery worker. Progress counters are updated after every chunk.
+    """
+    SUBMIT = "submit"
+    CANCEL = "cancel"
+    REPROCESS = "reprocess"
+
+    ACTION_CHOICES = [
+        (SUBMIT, "Submit"),
+        (CANCEL, "Cancel"),
+        (REPROCESS, "Reprocess"),
+    ]
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (COMPLETED, "Completed"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    task_id = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text="Celery task ID"
+    )
+    action = models.CharField(
+        max_length=20,
+        choices=ACTION_CHOICES
+    )
+    requested_by = models.ForeignKey(
+        get_user_model(),
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="deal_bulk_jobs",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=PENDING
+    )
+    total = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of deals selected"
+    )
+    processed = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of selected deals looked at so far"
+    )
+    changed = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of deals whose status was changed"
+    )
+    message = models.TextField(
+        blank=True,
+        null=True,
+        help_text="Error details if the job failed"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Date and time when the job was queued"
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Date and time of the last progress update"
+    )
+    completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Date and time when the job finished"
+    )
+
+    class Meta:
+        verbose_name = "Deal Bulk Job"
+        verbose_name_plural = "Deal Bulk Jobs"
+        ordering = ["-created_at"]
+
+    @property
+    def skipped(self):
+        return self.processed - self.changed
+
+    def __str__(self):
+        return f"{self.get_action_display()} {self.total} deals - {self.status}"
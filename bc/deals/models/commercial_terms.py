@@ -1,6 +1,12 @@
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.validators import MinValueValidator
 
+from deals.conditional import VersionedQuerySet
+
+from .search import SEARCH_CONFIG, JSONStringsVector
+
 
 class AdditionalClause(models.Model):
     clause = models.TextField(
@@ -28,10 +34,26 @@ class AdditionalClause(models.Model):
         help_text="Date and time when the additional clause was last updated",
     )
 
+    # Maintained by Postgres on every write, including bulk_create()/update()
+    search_vector = models.GeneratedField(
+        expression=SearchVector("clause", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    # Bulk writes bump the table version behind the cached API responses
+    objects = VersionedQuerySet.as_manager()
+
     class Meta:
         ordering = ["display_order"]
         verbose_name = "Additional Clause"
         verbose_name_plural = "Additional Clauses"
+        indexes = [
+            # Keyset pagination on (created_at, id)
+            models.Index(fields=["created_at", "id"], name="addclause_created_id_idx"),
+            # Full-text search
+            GinIndex(fields=["search_vector"], name="addclause_search_idx"),
+        ]
 
     def __str__(self):
         return self.clause
@@ -154,9 +176,24 @@ class CommercialTerms(models.Model):
         help_text="Date and time when the commercial terms were last updated",
     )
 
+    # Full-text index over the string values of ``clauses``
+    search_vector = models.GeneratedField(
+        expression=JSONStringsVector("clauses"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         verbose_name = "Commercial Terms"
         verbose_name_plural = "Commercial Terms"
+        indexes = [
+            # Keyset pagination on (created_at, id)
+            models.Index(fields=["created_at", "id"], name="commterms_created_id_idx"),
+            # Deal list filters
+            models.Index(fields=["delivery_term"], name="commterms_delivery_term_idx"),
+            # Full-text search
+            GinIndex(fields=["search_vector"], name="commterms_search_idx"),
+        ]
 
     def __str__(self):
         return f"Commercial Terms for Business Confirmation {self.id}"
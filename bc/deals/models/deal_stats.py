@@ -0,0 +1,49 @@
+from django.db import models
+
+
+class DealStatsBucket(models.Model):
+    """
+    Read model for deal statistics: one row per (status, material, month)
+    holding the number of deals in that bucket and their summed quantity.
+
+    Rows are adjusted incrementally when deals are created, change status or
+    are deleted (see ``deals.services.deal_stats``) and rebuilt from the
+    source tables by the periodic reconciliation task.
+    """
+    status = models.CharField(
+        max_length=50,
+        help_text="Business confirmation deal status"
+    )
+    material = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="Material of the deal's new business confirmation (empty if none)"
+    )
+    month = models.DateField(
+        help_text="First day of the month the deal was created in"
+    )
+    deal_count = models.IntegerField(
+        default=0,
+        help_text="Number of deals in the bucket"
+    )
+    total_quantity = models.DecimalField(
+        max_digits=20,
+        decimal_places=2,
+        default=0,
+        help_text="Summed new business confirmation quantity of the deals in the bucket"
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Date and time when the bucket was last adjusted"
+    )
+
+    class Meta:
+        verbose_name = "Deal Stats Bucket"
+        verbose_name_plural = "Deal Stats Buckets"
+        constraints = [
+            models.UniqueConstraint(fields=["status", "material", "month"], name="dealstats_bucket_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.status} {self.material}: {self.deal_count}"
@@ -1,5 +1,7 @@
 from django.db import models
 
+from deals.conditional import VersionedQuerySet
+
 
 class DropdownOption(models.Model):
     field_name = models.CharField(
@@ -31,6 +33,9 @@ class DropdownOption(models.Model):
         help_text="Whether this option is active"
     )
 
+    # Bulk writes bump the table version behind the cached API responses
+    objects = VersionedQuerySet.as_manager()
+
     class Meta:
         unique_together = ["field_name", "option_values"]
         ordering = ["field_name", "display_order", "option_values"]
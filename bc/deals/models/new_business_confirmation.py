@@ -1,6 +1,8 @@
 import uuid
 
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MinValueValidator
 
 
@@ -46,6 +48,20 @@ class NewBusinessConfirmation(models.Model):
         ordering = ["-created_at"]
         verbose_name = "New Business Confirmation"
         verbose_name_plural = "New Business Confirmations"
+        indexes = [
+            # Keyset pagination on (created_at, id)
+            models.Index(fields=["created_at", "id"], name="nbc_created_id_idx"),
+            # Deal list filters
+            models.Index(fields=["material"], name="nbc_material_idx"),
+            models.Index(fields=["buyer"], name="nbc_buyer_idx"),
+            models.Index(fields=["seller"], name="nbc_seller_idx"),
+            # Trigram indexes for icontains / istartswith (counterparty
+            # typeahead and admin search). Django compares UPPER(column), so
+            # the indexes are on that expression. Requires pg_trgm.
+            GinIndex(OpClass(Upper("buyer"), name="gin_trgm_ops"), name="nbc_buyer_trgm_idx"),
+            GinIndex(OpClass(Upper("seller"), name="gin_trgm_ops"), name="nbc_seller_trgm_idx"),
+            GinIndex(OpClass(Upper("material"), name="gin_trgm_ops"), name="nbc_material_trgm_idx"),
+        ]
 
     def __str__(self):
         return f"New Business Confirmation {self.id}: {self.buyer} - {self.material}"
@@ -1,6 +1,10 @@
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .search import SEARCH_CONFIG
+
 
 class PaymentTerms(models.Model):
     # Payment Stages
@@ -104,10 +108,25 @@ class PaymentTerms(models.Model):
         auto_now=True,
         help_text="Date and time when the payment terms were last updated",
     )
+
+    # Maintained by Postgres on every write, including bulk_create()/update()
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            "provisional_payment_terms", "final_payment_terms", config=SEARCH_CONFIG
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     
     class Meta:
         verbose_name = "Payment Terms"
         verbose_name_plural = "Payment Terms"
+        indexes = [
+            # Keyset pagination on (created_at, id)
+            models.Index(fields=["created_at", "id"], name="payterms_created_id_idx"),
+            # Full-text search
+            GinIndex(fields=["search_vector"], name="payterms_search_idx"),
+        ]
     
     def __str__(self):
         return f"Payment Terms {self.id} for Deal"
@@ -0,0 +1,32 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models import Func, TextField
+
+
+# Text search configuration used by the generated search_vector columns and
+# by the queries against them; both sides must agree.
+SEARCH_CONFIG = "english"
+
+
+class JSONStringsVector(Func):
+    """
+    ``jsonb_to_tsvector()`` over the string values of a JSON column. It is
+    immutable, so it can back a generated column.
+    """
+    function = "jsonb_to_tsvector"
+    template = (
+        f"%(function)s('{SEARCH_CONFIG}'::regconfig, COALESCE(%(expressions)s, '[]'::jsonb), "
+        "'[\"string\"]'::jsonb)"
+    )
+    output_field = SearchVectorField()
+
+
+class JSONStrings(Func):
+    """
+    The string values of a JSON column joined by spaces: the text that
+    ``JSONStringsVector`` indexes, for ``ts_headline()``.
+    """
+    template = (
+        "array_to_string(ARRAY(SELECT jsonb_path_query(COALESCE(%(expressions)s, '[]'::jsonb), "
+        "'strict $.** ? (@.type() == \"string\")') #>> '{}'), ' ')"
+    )
+    output_field = TextField()
@@ -0,0 +1,62 @@
+from django.db import models
+
+
+class SuggestionBenchmark(models.Model):
+    """
+    Percentile band of one numeric deal term within one context of
+    historical deals, read by the AI suggestions service.
+
+    Context columns hold normalised values (lower case, spaces and dashes
+    as underscores); ``ANY`` marks a column that was rolled up, so every
+    term also has bands per (material, delivery_term), per material and
+    overall to fall back on. Rebuilt from the deals tables by
+    ``deals.services.suggestion_benchmarks.refresh``.
+    """
+    ANY = "*"
+
+    field = models.CharField(
+        max_length=100,
+        help_text="Benchmarked term (e.g., treatment_charge, prepayment_percentage)"
+    )
+    material = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="Normalised material, '*' for any"
+    )
+    delivery_term = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        help_text="Normalised delivery term, '*' for any"
+    )
+    transport_mode = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        help_text="Normalised transport mode, '*' for any"
+    )
+    sample_count = models.IntegerField(
+        help_text="Number of historical deals in the band"
+    )
+    p10 = models.DecimalField(max_digits=20, decimal_places=4, help_text="10th percentile")
+    p25 = models.DecimalField(max_digits=20, decimal_places=4, help_text="25th percentile")
+    p50 = models.DecimalField(max_digits=20, decimal_places=4, help_text="Median")
+    p75 = models.DecimalField(max_digits=20, decimal_places=4, help_text="75th percentile")
+    p90 = models.DecimalField(max_digits=20, decimal_places=4, help_text="90th percentile")
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Date and time when the band was computed"
+    )
+
+    class Meta:
+        verbose_name = "Suggestion Benchmark"
+        verbose_name_plural = "Suggestion Benchmarks"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["field", "material", "delivery_term", "transport_mode"], name="suggestion_benchmark_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.field} {self.material}/{self.delivery_term}/{self.transport_mode}: {self.p25}-{self.p75}"
@@ -0,0 +1,254 @@
+import base64
+import binascii
+import json
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from drf_yasg import openapi
+
+from deals.conditional import not_modified, related_models, table_validators, with_validators
+from deals.fast_serializers import get_fast_reader
+
+
+Cursor = namedtuple("Cursor", ["position", "pk", "reverse"])
+
+
+def estimated_count(queryset):
+    """
+    Planner row estimate for ``queryset`` on Postgres, or None when no
+    usable estimate exists. Unfiltered querysets read ``pg_class.reltuples``
+    (maintained by ANALYZE/autovacuum); filtered ones use the top-level
+    EXPLAIN row estimate.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # -1 (or 0 on older servers) until the table is first analyzed
+        return row[0] if row and row[0] > 0 else None
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for admin changelists over large tables. Above
+    ADMIN_ESTIMATED_COUNT_THRESHOLD rows the planner estimate is used
+    instead of an exact COUNT(*), which scans the table or index; below it
+    the exact count is cheap and is used as is.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = estimated_count(self.object_list)
+        if estimate is not None and estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+            return estimate
+        return super().count
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset pagination over (ordering field, id), by default (created_at, id).
+
+    Pages are fetched with a WHERE clause on the last seen (position, id)
+    pair instead of OFFSET, and no COUNT(*) is issued: one extra row is read
+    to know whether another page exists. Cursors are opaque base64 tokens.
+    The ordering field must be non-null.
+    """
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering="-created_at", row_key=None):
+        self.ordering_field = ordering.lstrip("-")
+        self.descending = ordering.startswith("-")
+        # Maps a page row to its (position, pk); rows are model instances
+        # unless the caller paginates values_list() tuples.
+        self.row_key = row_key or (lambda row: (getattr(row, self.ordering_field), row.pk))
+        self.default_page_size = settings.CURSOR_PAGINATION_DEFAULT_PAGE_SIZE
+        self.max_page_size = settings.CURSOR_PAGINATION_MAX_PAGE_SIZE
+
+    def is_requested(self, request):
+        """Pagination is opt-in so existing clients keep receiving plain lists."""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.default_page_size
+        if page_size <= 0:
+            return self.default_page_size
+        return min(page_size, self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request, queryset.model)
+
+        reverse = self.cursor is not None and self.cursor.reverse
+        descending = self.descending != reverse
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(prefix + self.ordering_field, prefix + "pk")
+
+        if self.cursor is not None:
+            lookup = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{self.ordering_field}__{lookup}": self.cursor.position})
+                | Q(**{self.ordering_field: self.cursor.position, f"pk__{lookup}": self.cursor.pk})
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        self.page = results
+        return results
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        position, pk = self.row_key(self.page[-1])
+        return self.encode_cursor(Cursor(position, pk, False))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        position, pk = self.row_key(self.page[0])
+        return self.encode_cursor(Cursor(position, pk, True))
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position = model._meta.get_field(self.ordering_field).to_python(payload["p"])
+            pk = model._meta.pk.to_python(payload["i"])
+            reverse = bool(payload.get("r", False))
+        except (TypeError, KeyError, ValueError, UnicodeEncodeError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        if position is None or pk is None:
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(position, pk, reverse)
+
+    def encode_cursor(self, cursor):
+        position = cursor.position
+        if hasattr(position, "isoformat"):
+            position = position.isoformat()
+        payload = {"p": str(position), "i": str(cursor.pk)}
+        if cursor.reverse:
+            payload["r"] = 1
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+
+SPARSE_FIELDS_PARAMETER = openapi.Parameter(
+    "fields",
+    openapi.IN_QUERY,
+    description="Comma-separated subset of fields to return; other columns are not loaded",
+    type=openapi.TYPE_STRING,
+    required=False
+)
+
+CURSOR_PAGINATION_PARAMETERS = [
+    openapi.Parameter(
+        KeysetCursorPagination.cursor_query_param,
+        openapi.IN_QUERY,
+        description="Opaque cursor from a previous response's next/previous link",
+        type=openapi.TYPE_STRING,
+        required=False
+    ),
+    openapi.Parameter(
+        KeysetCursorPagination.page_size_query_param,
+        openapi.IN_QUERY,
+        description="Number of results per page (capped by CURSOR_PAGINATION_MAX_PAGE_SIZE)",
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+]
+
+
+def paginate_list(view, request, queryset, serializer_class, ordering=None, models=(), **serializer_kwargs):
+    """
+    Serialize ``queryset`` for a list GET, paginating it when the client
+    asks for a cursor page. Returns ``(response, count)``.
+
+    ``ordering`` (e.g. ``"-updated_at"``) replaces the default
+    ``-created_at`` keyset; unpaginated lists are sorted by it too.
+
+    ``?fields=`` limits both the rendered fields and the columns read from
+    the database. Rows are read as ``values_list()`` tuples through
+    ``deals.fast_serializers`` whenever the serializer supports it.
+
+    Responses carry ETag / Last-Modified; a matching conditional request
+    gets a 304 before any row is read or serialized. The validators cover
+    the queryset's model, the expanded relations and ``models``, which
+    should name every other model the queryset's filters join.
+    """
+    ordering_field = (ordering or "-created_at").lstrip("-")
+    fields = serializer_class.fields_from_request(request)
+    if fields is not None:
+        serializer_kwargs["fields"] = fields
+
+    validators = table_validators(
+        request, *dict.fromkeys(related_models(queryset.model, serializer_kwargs.get("expand", ())) + tuple(models))
+    )
+    response = not_modified(request, validators)
+    if response is not None:
+        return response, 0
+
+    reader = get_fast_reader(serializer_class, key_columns=(ordering_field, "pk"), **serializer_kwargs)
+    if reader is not None:
+        queryset = reader.queryset(queryset)
+        paginator = KeysetCursorPagination(ordering or "-created_at", row_key=lambda row: (row[0], row[1]))
+        render = reader.render
+    else:
+        if fields is not None:
+            queryset = queryset.only(*serializer_class.only_columns(fields, extra=(ordering_field,)))
+        paginator = KeysetCursorPagination(ordering or "-created_at")
+
+        def render(rows):
+            return serializer_class(rows, many=True, **serializer_kwargs).data
+
+    if not paginator.is_requested(request):
+        if ordering:
+            queryset = queryset.order_by(ordering, ordering.replace(ordering_field, "pk"))
+        data = render(queryset)
+        return with_validators(Response(data), validators), len(data)
+
+    page = paginator.paginate_queryset(queryset, request, view=view)
+    return with_validators(paginator.get_paginated_response(render(page)), validators), len(page)
@@ -0,0 +1,216 @@
+"""
+Cache of final, pre-compressed response bodies for reference endpoints.
+
+Keys are derived from the conditional GET validators (see deals.conditional),
+which already change whenever the underlying tables do. Entries never need
+invalidating; entries for old versions simply expire. On a miss the body is
+rendered once and stored uncompressed, gzipped and (when the ``brotli``
+package is installed) brotli-compressed. A hit returns the stored bytes for
+the client's Accept-Encoding without rendering or compressing anything.
+
+Reference-data views opt in with the cached_response() decorator.
+"""
+import functools
+import gzip
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.functional import cached_property
+from rest_framework.renderers import JSONRenderer
+
+from deals import cache_metrics
+from deals.caching import LocalCache, verified_reads
+from deals.conditional import VersionedQuerySet, not_modified, table_validators, track_models, with_validators
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger("deals")
+
+
+IDENTITY = "identity"
+GZIP = "gzip"
+BROTLI = "br"
+
+ENCODINGS = (BROTLI, GZIP, IDENTITY) if brotli is not None else (GZIP, IDENTITY)
+
+CACHE_KEY = "rendered:{}:{}"
+METRICS_NAME = "rendered_responses"
+
+
+def accepted_encoding(request) -> str:
+    """The best stored encoding the client accepts (brotli, then gzip, then none)."""
+    accepted = {}
+    for item in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.lower()] = quality
+    for encoding in ENCODINGS[:-1]:
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return IDENTITY
+
+
+def _compress(body: bytes):
+    variants = {IDENTITY: (IDENTITY, body)}
+    small = len(body) < settings.RENDERED_CACHE_MIN_COMPRESS_SIZE
+    # Compression runs once per version, so use the slowest, smallest settings
+    variants[GZIP] = (IDENTITY, body) if small else (GZIP, gzip.compress(body, compresslevel=9, mtime=0))
+    if brotli is not None:
+        variants[BROTLI] = (IDENTITY, body) if small else (BROTLI, brotli.compress(body, quality=11))
+    return variants
+
+
+class RenderedResponse(HttpResponse):
+    """
+    A response with a stored body. ``data`` is decoded from the body on
+    access only, for callers that inspect it like a DRF Response.
+    """
+
+    @cached_property
+    def data(self):
+        body = self.content
+        content_encoding = self.get("Content-Encoding", IDENTITY)
+        if content_encoding == GZIP:
+            body = gzip.decompress(body)
+        elif content_encoding == BROTLI:
+            body = brotli.decompress(body)
+        return json.loads(body)
+
+
+class RenderedResponseCache:
+    """
+    Response-bytes cache in front of a view's JSON rendering. Bodies are kept
+    in Redis and in a small per-process LRU; since keys embed the version
+    they are immutable, so the LRU needs no invalidation.
+    """
+
+    def __init__(self, timeout: int = None, max_entries: int = None):
+        self.timeout = timeout or settings.RENDERED_CACHE_TIMEOUT
+        self.local = LocalCache(max_entries or settings.RENDERED_CACHE_L1_MAX_ENTRIES, ttl=self.timeout)
+
+    def key(self, request, validators, encoding: str) -> str:
+        # The host is part of the key because paginated bodies embed absolute links
+        version = hashlib.md5(f"{validators.etag}|{request.get_host()}".encode("utf-8"), usedforsecurity=False)
+        return CACHE_KEY.format(version.hexdigest(), encoding)
+
+    def respond(self, request, validators, build):
+        """
+        The cached body for ``request`` if there is one, else ``build()``'s
+        response rendered, compressed and stored. ``build`` returns a DRF
+        Response; anything but a 200 is returned as is. Only JSON responses
+        are cached, so the browsable API still works.
+
+        ``build()`` runs inside caching.verified_reads(): the reference
+        caches it reads are checked against their Redis version stamps, and
+        a body built from a stale value is returned without being stored
+        and without validators, so it cannot be pinned under the new ETag.
+        """
+        if validators.etag is None or not isinstance(getattr(request, "accepted_renderer", None), JSONRenderer):
+            return build()
+
+        encoding = accepted_encoding(request)
+        key = self.key(request, validators, encoding)
+        entry = self.local.get(key)
+        if entry is None:
+            entry = cache.get(key)
+            if entry is not None:
+                self.local.set(key, entry)
+
+        cache_metrics.record(METRICS_NAME, hits=entry is not None, misses=entry is None)
+        stale = False
+        if entry is None:
+            with cache_metrics.timed(METRICS_NAME), verified_reads() as check:
+                response = build()
+                if response.status_code != 200:
+                    return response
+                body = request.accepted_renderer.render(
+                    response.data, request.accepted_media_type, {"request": request, "response": response}
+                )
+                variants = _compress(body)
+            entry = variants[encoding]
+            stale = check.stale
+            if stale:
+                # Built while another request reloads a value this version
+                # retired; stored or validated, it would outlive the edit
+                logger.debug(f"Not caching {request.path}: rendered from stale values")
+            else:
+                cache.set_many(
+                    {self.key(request, validators, name): variant for name, variant in variants.items()},
+                    self.timeout,
+                )
+                self.local.set(key, entry)
+                logger.debug(f"Rendered and cached {len(body)} bytes for {request.path}")
+
+        content_encoding, body = entry
+        http_response = RenderedResponse(body, content_type=request.accepted_renderer.media_type)
+        if content_encoding != IDENTITY:
+            http_response["Content-Encoding"] = content_encoding
+        patch_vary_headers(http_response, ("Accept-Encoding",))
+        if stale:
+            patch_cache_control(http_response, private=True, no_cache=True)
+            return http_response
+        return with_validators(http_response, validators)
+
+
+rendered_responses = RenderedResponseCache()
+
+
+def cached_response(*models, bumped_manually=()):
+    """
+    Cache a reference-data GET handler by the tables it reads::
+
+        @swagger_auto_schema(...)
+        @cached_response(AdditionalClause)
+        def get(self, request):
+            ...
+
+    Writes to ``models`` bump their table versions (see
+    deals.conditional.track_models), which changes both the ETag and the
+    keys of the stored bodies, so nothing has to be invalidated by hand.
+    Matching conditional requests get a 304, and repeat requests the stored
+    bytes, without the handler being called.
+
+    Bulk writes (``QuerySet.update()``, ``bulk_create()``) send no model
+    signals, so each of ``models`` must have a default manager built from
+    VersionedQuerySet; ImproperlyConfigured is raised otherwise. Models whose
+    bulk writes call bump_table_versions_on_commit() themselves go in
+    ``bumped_manually`` instead, e.g.
+    ``@cached_response(bumped_manually=(DealStatsBucket,))``.
+    """
+    for model in models:
+        if not isinstance(model._default_manager.get_queryset(), VersionedQuerySet):
+            raise ImproperlyConfigured(
+                f"cached_response() needs {model._meta.label}'s default manager to be built from "
+                f"VersionedQuerySet, or the model listed in bumped_manually"
+            )
+    models = tuple(dict.fromkeys(models + tuple(bumped_manually)))
+    track_models(*models)
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            validators = table_validators(request, *models)
+            response = not_modified(request, validators)
+            if response is not None:
+                return response
+            return rendered_responses.respond(
+                request, validators,
+                lambda: with_validators(method(view, request, *args, **kwargs), validators),
+            )
+        return wrapper
+    return decorator
@@ -1,6 +1,15 @@
 class ResponseMessages:
     NO_SUGGESTIONS_AVAILABLE = "No suggestions available for this field"
     MISSING_REQUIRED_PARAMETERS = "field_name and field_value are required parameters"
+    MISSING_SUGGESTION_FIELDS = "form or fields is required"
+    INVALID_EXPAND_FIELDS = "Unknown expand fields: {}"
+    INVALID_EXPORT_FORMAT = "export_format must be one of: {}"
+    INVALID_SPARSE_FIELDS = "Unknown fields: {}"
+    MISSING_SEARCH_QUERY = "q is a required parameter"
+    INVALID_SEARCH_TYPES = "Unknown search types: {}"
+    INVALID_COUNTERPARTY_ROLE = "role must be one of: {}"
+    INVALID_STATS_GROUP_BY = "group_by must be a comma-separated subset of: {}"
+    INVALID_MONTH = "{} must be in YYYY-MM format"
 
     DEAL_NOT_FOUND = "Deal not found"
     DEAL_ALREADY_SUBMITTED = "Deal already submitted"
@@ -13,6 +22,7 @@ class ResponseMessages:
     TASK_STATUS_NOT_IN_FAILED_STATE = "Task is not in failed state"
     TASK_STATUS_RETRIEVAL_FAILED = "Failed to retrieve task status"
     TASK_QUEUED_FOR_PROCESSING = "Task queued for processing"
+    TASK_CANCELLED = "Deal cancelled before processing started"
     TASK_STATUS_RETRIEVED_SUCCESSFULLY = "Task status retrieved successfully"
     TASK_STATUS_RETRIEVAL_FAILED = "Failed to retrieve task status"
     TASK_STATUS_RETRIEVAL_FAILED = "Failed to retrieve task status"
\ No newline at end of file
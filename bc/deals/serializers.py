@@ -1,10 +1,58 @@
+from django.db import transaction
 from rest_framework import serializers
 from .models import (NewBusinessConfirmation, DropdownOption, 
                      CommercialTerms, BusinessConfirmationDeal,
                      AdditionalClause, PaymentTerms)
+from .response_messages import ResponseMessages
 
 
-class NewBusinessConfirmationSerializer(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """
+    Lets callers restrict output to a subset of fields with ``fields=[...]``.
+
+    ``only_columns()`` gives the matching model columns so list views can
+    ``.only()`` the queryset and skip reading the rest from the database.
+    """
+    FIELDS_QUERY_PARAM = "fields"
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+    @classmethod
+    def fields_from_request(cls, request):
+        """
+        Parse ``?fields=a,b`` into a tuple of field names, or None when the
+        parameter is absent. Unknown names raise a 400.
+        """
+        raw = request.query_params.get(cls.FIELDS_QUERY_PARAM)
+        if raw is None:
+            return None
+        fields = tuple(name.strip() for name in raw.split(",") if name.strip())
+        unknown = [name for name in fields if name not in cls().fields]
+        if unknown:
+            raise serializers.ValidationError(
+                {cls.FIELDS_QUERY_PARAM: [ResponseMessages.INVALID_SPARSE_FIELDS.format(", ".join(unknown))]}
+            )
+        return fields
+
+    @classmethod
+    def only_columns(cls, fields, extra=()):
+        """Model columns backing ``fields``, plus the primary key and ``extra``."""
+        model = cls.Meta.model
+        concrete = {field.name for field in model._meta.concrete_fields}
+        serializer_fields = cls().fields
+        columns = {model._meta.pk.name, *extra}
+        for field_name in fields:
+            source = serializer_fields[field_name].source
+            if source in concrete:
+                columns.add(source)
+        return sorted(columns)
+
+
+class NewBusinessConfirmationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for New Business Confirmation
     """
@@ -13,7 +61,7 @@ class NewBusinessConfirmationSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class DropdownOptionSerializer(serializers.ModelSerializer):
+class DropdownOptionSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Dropdown Option
     """
@@ -22,16 +70,16 @@ class DropdownOptionSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class CommercialTermsSerializer(serializers.ModelSerializer):
+class CommercialTermsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Commercial Terms
     """
     class Meta:
         model = CommercialTerms
-        fields = "__all__"
+        exclude = ("search_vector",)
 
 
-class AdditionalClauseSerializer(serializers.ModelSerializer):
+class AdditionalClauseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Additional Clause
     """
@@ -40,19 +88,102 @@ class AdditionalClauseSerializer(serializers.ModelSerializer):
         fields = ("clause",)
 
 
-class PaymentTermsSerializer(serializers.ModelSerializer):
+class PaymentTermsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Payment Terms
     """
     class Meta:
         model = PaymentTerms
-        fields = "__all__"
+        exclude = ("search_vector",)
 
 
-class BusinessConfirmationDealSerializer(serializers.ModelSerializer):
+class BusinessConfirmationDealSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Business Confirmation Deal
+
+    Relations named in ``expand`` are rendered as nested objects instead of
+    primary keys. Callers are expected to ``select_related`` the same names.
     """
+    EXPANDABLE_FIELDS = {
+        "new_business_confirmation": NewBusinessConfirmationSerializer,
+        "commercial_terms": CommercialTermsSerializer,
+        "payment_terms": PaymentTermsSerializer,
+    }
+
     class Meta:
         model = BusinessConfirmationDeal
         fields = "__all__"
+
+    def __init__(self, *args, expand=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        for field_name in expand:
+            if field_name in self.fields:
+                self.fields[field_name] = self.EXPANDABLE_FIELDS[field_name](read_only=True)
+
+
+class CompositeDealSerializer(serializers.Serializer):
+    """
+    Serializer for creating a whole deal from one nested document: the new
+    business confirmation, commercial terms, payment terms and the deal
+    itself. All parts are validated together and create() inserts the four
+    rows in a single transaction, so a failure leaves no orphans.
+    """
+    new_business_confirmation = NewBusinessConfirmationSerializer()
+    commercial_terms = CommercialTermsSerializer()
+    payment_terms = PaymentTermsSerializer()
+    status = serializers.ChoiceField(
+        choices=BusinessConfirmationDeal.STATUS_CHOICES, default=BusinessConfirmationDeal.DRAFT
+    )
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            return BusinessConfirmationDeal.objects.create(
+                user=validated_data.get("user"),
+                status=validated_data["status"],
+                new_business_confirmation=NewBusinessConfirmation.objects.create(
+                    **validated_data["new_business_confirmation"]
+                ),
+                commercial_terms=CommercialTerms.objects.create(**validated_data["commercial_terms"]),
+                payment_terms=PaymentTerms.objects.create(**validated_data["payment_terms"]),
+            )
+
+    def to_representation(self, instance):
+        expand = tuple(BusinessConfirmationDealSerializer.EXPANDABLE_FIELDS)
+        return BusinessConfirmationDealSerializer(instance, expand=expand).data
+
+
+class SuggestionFieldSerializer(serializers.Serializer):
+    field_name = serializers.CharField()
+    field_value = serializers.CharField(allow_blank=True, allow_null=True)
+
+
+class AISuggestionsBatchSerializer(serializers.Serializer):
+    """
+    Request body of the batch AI suggestions endpoint: the in-progress form
+    as ``{field_name: value}``, or a list of ``fields``, plus the deal
+    context. Context missing from the top level is taken from the form.
+    """
+    CONTEXT_FIELDS = ("material", "delivery_term", "transport_mode")
+
+    form = serializers.DictField(required=False)
+    fields = SuggestionFieldSerializer(many=True, required=False)
+    material = serializers.CharField(required=False, allow_blank=True)
+    delivery_term = serializers.CharField(required=False, allow_blank=True)
+    transport_mode = serializers.CharField(required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        if not attrs.get("form") and not attrs.get("fields"):
+            raise serializers.ValidationError(ResponseMessages.MISSING_SUGGESTION_FIELDS)
+        form = attrs.get("form") or {}
+        for name in self.CONTEXT_FIELDS:
+            if not attrs.get(name) and isinstance(form.get(name), str):
+                attrs[name] = form[name]
+        return attrs
+
+    @property
+    def field_values(self):
+        """(field_name, field_value) pairs of the form followed by the listed fields."""
+        data = self.validated_data
+        return list((data.get("form") or {}).items()) + [
+            (field["field_name"], field["field_value"]) for field in data.get("fields") or []
+        ]
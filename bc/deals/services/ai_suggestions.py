@@ -1,13 +1,30 @@
-from typing import Dict, Optional, Any
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, Optional, Any, Tuple
+
+from deals.services import suggestion_benchmarks
 
 
 class AISuggestionsService:
     """
-    Singleton AI service that provides hardcoded suggestions for commercial terms fields
+    Singleton AI service that checks entered commercial and payment terms
+    against percentile bands of historical deals
     """
 
     _instance = None
 
+    # Field names used by the form -> benchmarked term
+    FIELD_ALIASES = {
+        'prepayment': 'prepayment_percentage',
+        'cost_sharing': 'buyer_cost_share_percentage',
+    }
+
+    LABELS = {
+        'treatment_charge': ('TC', '$', '/dmt'),
+        'refining_charge': ('RC', '$', ''),
+        'prepayment_percentage': ('prepayment', '', '%'),
+        'buyer_cost_share_percentage': ('buyer cost share', '', '%'),
+    }
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(AISuggestionsService, cls).__new__(cls)
@@ -29,53 +46,54 @@ class AISuggestionsService:
             field_value: Current value entered by user
             material: Material type for context (optional)
             transport_mode: Transport mode for context (optional)
+            delivery_term: Delivery term for context (optional)
 
         Returns:
-            Dictionary with suggestion data or None if no suggestion
+            Dictionary with suggestion data or None if no suggestion. Values
+            between the 10th and 90th percentile of comparable deals get the
+            typical range; values outside it get a warning with the median
+            as suggested value.
         """
+        return self.get_suggestions(
+            [(field_name, field_value)], material=material, transport_mode=transport_mode, delivery_term=delivery_term
+        ).get(field_name)
+
+    def get_suggestions(
+        self,
+        fields: Iterable[Tuple[str, Any]],
+        material: Optional[str] = None,
+        transport_mode: Optional[str] = None,
+        delivery_term: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get AI suggestions for several fields of one deal at once
+
+        Args:
+            fields: (field_name, field_value) pairs; a repeated field name keeps its last value
+            material, transport_mode, delivery_term: Deal context shared by all fields (optional)
+
+        Returns:
+            Suggestion per field name, like get_suggestion(); fields without
+            a suggestion are left out. Bands are looked up once for all fields.
+        """
+        values = dict(fields)
+        terms = {}
+        for field_name in values:
+            term = self.FIELD_ALIASES.get(field_name, field_name)
+            if term in suggestion_benchmarks.METRICS:
+                terms[field_name] = term
+        if not terms:
+            return {}
+
+        found = suggestion_benchmarks.lookup_many(set(terms.values()), material, delivery_term, transport_mode)
+        suggestions = {}
+        for field_name, term in terms.items():
+            if found[term] is not None:
+                suggestions[field_name] = self._suggest(
+                    term, values[field_name], *found[term], (material, delivery_term, transport_mode)
+                )
+        return suggestions
 
-        # Hardcoded suggestions for specific fields
-        suggestions = {
-            'prepayment': {
-                'type': 'info',
-                'message': 'Most deals use 20-40%',
-                'suggested_value': None,
-                'show_accept_button': False
-            },
-            'provisional_payment_terms': {
-                'type': 'info',
-                'message': 'Common for this route: 95% provisional on rail bill copy.',
-                'suggested_value': None,
-                'show_accept_button': False
-            },
-            'triggering_event': {
-                'type': 'info',
-                'message': 'Common timing for provisional payments is 3-5 days post RWB',
-                'suggested_value': None,
-                'show_accept_button': False
-            },
-            'cost_sharing': {
-                'type': 'info',
-                'message': 'Typical share is 50/50.',
-                'suggested_value': None,
-                'show_accept_button': False
-            },
-            'treatment_charge': {
-                'type': 'info',
-                'message': 'Industry average TC for Lead: $310-$325/dmt',
-                'suggested_value': None,
-                'show_accept_button': False
-            },
-            'refining_charge': {
-                'type': 'warning',
-                'message': 'Your RC is higher than average, adjust to $4.50?',
-                'suggested_value': 4.50,
-                'show_accept_button': True
-            }
-        }
-        
-        return suggestions.get(field_name)
-    
     def get_general_suggestion(
         self,
         field_name: str,
@@ -86,10 +104,67 @@ class AISuggestionsService:
     ) -> Optional[Dict[str, Any]]:
         """
         Get general suggestions that might apply to any field
-        This method is kept for compatibility but returns None since we use hardcoded suggestions
+        This method is kept for compatibility but returns None since suggestions are per field
         """
         return None
 
+    def _suggest(self, field: str, field_value: Any, band, context, entered_context) -> Dict[str, Any]:
+        label = self.LABELS[field][0]
+        where = self._describe_context(context, *entered_context)
+        value = self._parse(field_value)
+
+        if value is not None and not band.p10 <= value <= band.p90:
+            direction = 'lower' if value < band.p10 else 'higher'
+            median = round(band.p50, 2)
+            suggestion = {
+                'type': 'warning',
+                'message': f"Your {label} is {direction} than usual {where}, adjust to {self._format(field, median)}?",
+                'suggested_value': float(median),
+                'show_accept_button': True
+            }
+        else:
+            suggestion = {
+                'type': 'info',
+                'message': f"Typical {label} {where}: "
+                           f"{self._format(field, band.p25)}-{self._format(field, band.p75)}",
+                'suggested_value': None,
+                'show_accept_button': False
+            }
+
+        suggestion['benchmark'] = {
+            'material': context[0],
+            'delivery_term': context[1],
+            'transport_mode': context[2],
+            'sample_count': band.sample_count,
+            'p10': float(band.p10),
+            'p25': float(band.p25),
+            'p50': float(band.p50),
+            'p75': float(band.p75),
+            'p90': float(band.p90),
+        }
+        return suggestion
+
+    def _format(self, field: str, value: Decimal) -> str:
+        _, prefix, suffix = self.LABELS[field]
+        return f"{prefix}{round(value, 2).normalize():f}{suffix}"
+
+    @staticmethod
+    def _parse(field_value: Any) -> Optional[Decimal]:
+        try:
+            value = Decimal(str(field_value).strip().rstrip('%').lstrip('$'))
+        except (InvalidOperation, ValueError):
+            return None
+        return value if value.is_finite() else None
+
+    @staticmethod
+    def _describe_context(context, material, delivery_term, transport_mode) -> str:
+        """Human readable context of a band, using the values as the user entered them."""
+        parts = [
+            value.strip() for value, key in zip((material, delivery_term, transport_mode), context)
+            if key != suggestion_benchmarks.ANY
+        ]
+        return f"for {', '.join(parts)} deals" if parts else "across all deals"
+
 
 # Singleton instance
 ai_suggestions_service = AISuggestionsService()
@@ -0,0 +1,95 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Type
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers
+
+from deals.conditional import bump_table_versions_on_commit
+
+
+CREATED = "created"
+INVALID = "invalid"
+NOT_CREATED = "not_created"
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer that keeps each item's validated data even when other
+    items fail, so valid items can still be inserted in partial mode.
+    """
+
+    def to_internal_value(self, data):
+        # run_child_validation() is called once per item, in order
+        self.item_data = []
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        try:
+            validated = super().run_child_validation(data)
+        except serializers.ValidationError:
+            self.item_data.append(None)
+            raise
+        self.item_data.append(validated)
+        return validated
+
+
+@dataclass
+class BulkCreateResult:
+    created: int = 0
+    failed: int = 0
+    errors: Optional[Any] = None
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def bulk_create(
+    serializer_class: Type[serializers.ModelSerializer],
+    items: Any,
+    partial: bool = False,
+    batch_size: Optional[int] = None,
+) -> BulkCreateResult:
+    """
+    Validate ``items`` with ``serializer_class(many=True)`` and insert them
+    with one ``bulk_create()`` in a single transaction.
+
+    By default nothing is inserted unless every item is valid. With
+    ``partial=True`` the valid items are inserted and the invalid ones are
+    reported. ``results`` has one entry per input item, in input order.
+    A body that is not a list (or is empty / too long) sets ``errors``.
+    """
+    serializer = BulkListSerializer(
+        child=serializer_class(),
+        data=items,
+        allow_empty=False,
+        max_length=settings.BULK_CREATE_MAX_ITEMS,
+    )
+    serializer.is_valid()
+    if isinstance(serializer.errors, dict):
+        return BulkCreateResult(errors=serializer.errors)
+
+    item_errors = serializer.errors or [{}] * len(serializer.item_data)
+    valid = [data for data in serializer.item_data if data is not None]
+    failed = len(serializer.item_data) - len(valid)
+    insert = valid if (partial or not failed) else []
+
+    model = serializer_class.Meta.model
+    instances = []
+    if insert:
+        with transaction.atomic():
+            instances = model.objects.bulk_create(
+                [model(**data) for data in insert],
+                batch_size=batch_size or settings.BULK_CREATE_BATCH_SIZE,
+            )
+        # bulk_create() sends no post_save, so list ETags are bumped here
+        bump_table_versions_on_commit(model)
+
+    rendered = iter(serializer_class(instances, many=True).data)
+    results = []
+    for index, (data, errors) in enumerate(zip(serializer.item_data, item_errors)):
+        if data is None:
+            results.append({"index": index, "status": INVALID, "errors": errors})
+        elif insert:
+            results.append({"index": index, "status": CREATED, "data": next(rendered)})
+        else:
+            results.append({"index": index, "status": NOT_CREATED})
+    return BulkCreateResult(created=len(instances), failed=failed, results=results)
@@ -0,0 +1,172 @@
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Iterator, List, Sequence, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from deals.conditional import bump_table_versions_on_commit
+from deals.models import BusinessConfirmationDeal, DealBulkJob, TaskStatus
+from deals.response_messages import ResponseMessages
+from deals.services import deal_stats
+from deals.tasks.processing_tasks import process_business_confirmation_deal
+
+logger = logging.getLogger("deals")
+
+
+@dataclass(frozen=True)
+class BulkAction:
+    name: str
+    from_statuses: Tuple[str, ...]
+    to_status: str
+    # Create a TaskStatus and queue processing for every changed deal
+    enqueue_processing: bool
+
+
+ACTIONS = {
+    DealBulkJob.SUBMIT: BulkAction(
+        DealBulkJob.SUBMIT,
+        (BusinessConfirmationDeal.DRAFT, BusinessConfirmationDeal.CANCELLED),
+        BusinessConfirmationDeal.SUBMITTED,
+        enqueue_processing=True,
+    ),
+    DealBulkJob.CANCEL: BulkAction(
+        DealBulkJob.CANCEL,
+        (BusinessConfirmationDeal.DRAFT, BusinessConfirmationDeal.SUBMITTED),
+        BusinessConfirmationDeal.CANCELLED,
+        enqueue_processing=False,
+    ),
+    DealBulkJob.REPROCESS: BulkAction(
+        DealBulkJob.REPROCESS,
+        (
+            BusinessConfirmationDeal.SUBMITTED,
+            BusinessConfirmationDeal.PROCESSING,
+            BusinessConfirmationDeal.COMPLETED,
+        ),
+        BusinessConfirmationDeal.SUBMITTED,
+        enqueue_processing=True,
+    ),
+}
+
+
+def enqueue(action: str, queryset, user=None) -> DealBulkJob:
+    """
+    Record a bulk job for the deals in ``queryset`` and queue it for a
+    Celery worker once the current transaction commits.
+    """
+    # Imported here: the task module imports this one
+    from deals.tasks.bulk_tasks import run_deal_bulk_job
+
+    deal_ids = [str(pk) for pk in queryset.order_by().values_list("pk", flat=True)]
+    job = DealBulkJob.objects.create(
+        task_id=str(uuid.uuid4()),
+        action=action,
+        requested_by=user,
+        total=len(deal_ids),
+    )
+    transaction.on_commit(
+        lambda: run_deal_bulk_job.apply_async((str(job.pk), deal_ids), task_id=job.task_id)
+    )
+    logger.info(f"Queued bulk {action} of {len(deal_ids)} deals as job {job.pk}")
+    return job
+
+
+def keyset_chunks(deal_ids: Sequence[str], chunk_size: int) -> Iterator[List[str]]:
+    """The selected ids in primary key order, ``chunk_size`` at a time."""
+    ordered = sorted(deal_ids, key=uuid.UUID)
+    for start in range(0, len(ordered), chunk_size):
+        yield ordered[start:start + chunk_size]
+
+
+def apply_chunk(action: BulkAction, deal_ids: Sequence[str]) -> int:
+    """
+    Apply ``action`` to the eligible deals among ``deal_ids`` in one
+    transaction and return how many changed.
+
+    Eligible rows are locked (rows held by a running processing task are
+    skipped rather than waited on) and switched with one UPDATE ... WHERE
+    id IN (...). TaskStatus rows are bulk-created, and processing is queued
+    after commit. QuerySet.update() and bulk_create() bypass model
+    signals, so the stats rollup and table versions are adjusted here.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            BusinessConfirmationDeal.objects
+            .select_for_update(skip_locked=True, of=("self",))
+            .filter(pk__in=deal_ids, status__in=action.from_statuses)
+            .values_list(
+                "pk", "status", "created_at",
+                "new_business_confirmation__material", "new_business_confirmation__quantity",
+            )
+        )
+        if not rows:
+            return 0
+        changed_ids = [row[0] for row in rows]
+        BusinessConfirmationDeal.objects.filter(pk__in=changed_ids).update(
+            status=action.to_status, updated_at=now
+        )
+
+        if action.enqueue_processing:
+            task_statuses = TaskStatus.objects.bulk_create([
+                TaskStatus(
+                    task_id=str(uuid.uuid4()),
+                    deal_id=deal_id,
+                    status=TaskStatus.PENDING,
+                    message=ResponseMessages.TASK_QUEUED_FOR_PROCESSING,
+                )
+                for deal_id in changed_ids
+            ])
+            transaction.on_commit(lambda: _queue_processing(task_statuses))
+        else:
+            # Pending processing of cancelled deals must not run
+            TaskStatus.objects.filter(deal_id__in=changed_ids, status=TaskStatus.PENDING).update(
+                status=TaskStatus.FAILED,
+                message=ResponseMessages.TASK_CANCELLED,
+                completed_at=now,
+                updated_at=now,
+            )
+
+        deal_stats.apply_deltas(deal_stats.merge_deltas(
+            deal_stats.bucket_deltas(material, quantity, created_at, old_status, action.to_status)
+            for _, old_status, created_at, material, quantity in rows
+        ))
+        bump_table_versions_on_commit(BusinessConfirmationDeal, TaskStatus)
+    return len(changed_ids)
+
+
+def _queue_processing(task_statuses: List[TaskStatus]) -> None:
+    for task_status in task_statuses:
+        process_business_confirmation_deal.apply_async(
+            (str(task_status.deal_id), str(task_status.id)),
+            task_id=task_status.task_id,
+        )
+
+
+def run(job: DealBulkJob, deal_ids: Sequence[str], chunk_size: int = None) -> DealBulkJob:
+    """Work through ``deal_ids`` for ``job``, recording progress after every chunk."""
+    action = ACTIONS[job.action]
+    chunk_size = chunk_size or settings.DEAL_BULK_ACTION_CHUNK_SIZE
+    DealBulkJob.objects.filter(pk=job.pk).update(status=DealBulkJob.RUNNING, updated_at=timezone.now())
+    try:
+        for chunk in keyset_chunks(deal_ids, chunk_size):
+            changed = apply_chunk(action, chunk)
+            job.processed += len(chunk)
+            job.changed += changed
+            DealBulkJob.objects.filter(pk=job.pk).update(
+                processed=job.processed, changed=job.changed, updated_at=timezone.now()
+            )
+    except Exception as e:
+        logger.error(f"Bulk {job.action} job {job.pk} failed after {job.processed} deals: {str(e)}")
+        DealBulkJob.objects.filter(pk=job.pk).update(
+            status=DealBulkJob.FAILED, message=str(e), completed_at=timezone.now(), updated_at=timezone.now()
+        )
+        raise
+    DealBulkJob.objects.filter(pk=job.pk).update(
+        status=DealBulkJob.COMPLETED, completed_at=timezone.now(), updated_at=timezone.now()
+    )
+    logger.info(f"Bulk {job.action} job {job.pk} changed {job.changed} of {job.total} deals")
+    job.refresh_from_db()
+    return job
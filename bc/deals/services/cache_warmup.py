@@ -0,0 +1,165 @@
+"""
+Cache warm-up after deploys, Redis restarts and data loads.
+
+Each warmer fills one cached reference payload the way a client request
+would, so the first wave of users after a restart hits warm caches instead
+of all missing at once. Warmers run concurrently in a thread pool.
+
+Rendered responses are keyed by host and Accept header (see
+deals.response_cache), so they are warmed for every host in
+CACHE_WARMUP_HOSTS with the CACHE_WARMUP_ACCEPT header that clients send.
+
+Most payloads live in Redis, which every process shares. On start, only the
+worker that takes WARMUP_LOCK_KEY warms them; the others fill just their
+process-local state (LOCAL_WARMERS: the L1 copies and the schema).
+"""
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from deals.services import deal_stats, dropdown_cache, suggestion_benchmarks
+
+logger = logging.getLogger("deals")
+
+
+WARMUP_USERNAME = "cache-warmup"
+WARMUP_LOCK_KEY = "lock:cache_warmup"
+
+
+def _get(path, params=None):
+    """
+    Request ``path`` as an authenticated, unthrottled client on every
+    warm-up host and return the status codes. The user is never saved.
+    """
+    match = resolve(path)
+    # Warm-up requests must not use up a throttle bucket
+    view = match.func.cls.as_view(**{**match.func.initkwargs, "throttle_classes": []})
+    user = get_user_model()(username=WARMUP_USERNAME)
+    statuses = []
+    for host in settings.CACHE_WARMUP_HOSTS:
+        request = RequestFactory().get(path, params or {}, HTTP_HOST=host, HTTP_ACCEPT=settings.CACHE_WARMUP_ACCEPT)
+        # Honoured by rest_framework.request.Request, bypassing authentication
+        request._force_auth_user = user
+        response = view(request, *match.args, **match.kwargs)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} on {host} returned {response.status_code}")
+        statuses.append(response.status_code)
+    return statuses
+
+
+def warm_dropdown_partitions():
+    """Every dropdown partition, into Redis and this process's L1."""
+    return f"{len(dropdown_cache.get_options())} options"
+
+
+def warm_dropdown_options():
+    """Every dropdown partition, plus the rendered full list."""
+    result = warm_dropdown_partitions()
+    _get(reverse("deals:dropdown"))
+    return result
+
+
+def warm_additional_clauses():
+    _get(reverse("deals:additional-clauses"))
+    return "rendered"
+
+
+def warm_deal_stats():
+    """The default rollup and one per grouping field."""
+    _get(reverse("deals:deal-stats"))
+    for field in deal_stats.GROUP_BY_FIELDS:
+        _get(reverse("deals:deal-stats"), {"group_by": field})
+    return f"{len(deal_stats.GROUP_BY_FIELDS) + 1} rollups"
+
+
+def warm_suggestion_benchmarks():
+    """The percentile bands read by every AI suggestion."""
+    return f"{len(suggestion_benchmarks.bands())} bands"
+
+
+def warm_schema():
+    """The OpenAPI schema; cached per process (see bc.schema)."""
+    _get(reverse("schema-json", kwargs={"format": ".json"}))
+    return "generated"
+
+
+WARMERS = {
+    "dropdown_options": warm_dropdown_options,
+    "additional_clauses": warm_additional_clauses,
+    "deal_stats": warm_deal_stats,
+    "suggestion_benchmarks": warm_suggestion_benchmarks,
+    "schema": warm_schema,
+}
+
+
+# Per-process state, filled by every worker: the L1 copies of the tiered
+# caches (from Redis once it is warm) and the OpenAPI schema
+LOCAL_WARMERS = {
+    "dropdown_options": warm_dropdown_partitions,
+    "suggestion_benchmarks": warm_suggestion_benchmarks,
+    "schema": warm_schema,
+}
+
+
+def _run(warmer):
+    name, function = warmer
+    started = time.monotonic()
+    try:
+        return name, function(), None, time.monotonic() - started
+    except Exception as e:
+        logger.exception(f"Cache warm-up of {name} failed")
+        return name, None, e, time.monotonic() - started
+    finally:
+        # Each pool thread opened its own connection
+        connections.close_all()
+
+
+def warm(names=None, workers=None, local=False):
+    """
+    Run the warmers in ``names`` (all when None) concurrently; ``local``
+    selects LOCAL_WARMERS instead of WARMERS. Returns
+    ``{name: (result, error, seconds)}``; one failing warmer does not stop
+    the others.
+    """
+    warmers = LOCAL_WARMERS if local else WARMERS
+    names = list(warmers) if names is None else list(names)
+    workers = workers or settings.CACHE_WARMUP_WORKERS
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cache-warmup") as pool:
+        results = {
+            name: (result, error, seconds)
+            for name, result, error, seconds in pool.map(_run, [(name, warmers[name]) for name in names])
+        }
+    failed = [name for name, (_, error, _) in results.items() if error is not None]
+    logger.info(
+        f"Warmed {len(names) - len(failed)}/{len(names)} caches in {time.monotonic() - started:.2f}s"
+        + (f", failed: {', '.join(failed)}" if failed else "")
+    )
+    return results
+
+
+def warm_on_start(source):
+    """
+    Deploy hook for gunicorn and Celery workers; never raises. The first
+    worker to take WARMUP_LOCK_KEY warms everything; the lock is kept for
+    CACHE_WARMUP_LOCK_TIMEOUT seconds, and workers starting meanwhile only
+    warm their own process-local state, so a deploy warms Redis once.
+    """
+    if not settings.CACHE_WARMUP_ON_START:
+        return
+    try:
+        if cache.add(WARMUP_LOCK_KEY, f"{source} {os.getpid()}", settings.CACHE_WARMUP_LOCK_TIMEOUT):
+            logger.info(f"Cache warm-up on {source} start: warming shared and local caches")
+            warm()
+        else:
+            warm(local=True)
+    except Exception:
+        logger.exception(f"Cache warm-up on {source} start failed")
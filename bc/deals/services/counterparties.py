@@ -0,0 +1,73 @@
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q
+
+from deals import cache_metrics
+from deals.caching import LocalCache
+from deals.models import NewBusinessConfirmation
+
+
+ROLES = ("buyer", "seller")
+
+
+# Typeahead traffic is dominated by a few short prefixes ("a", "gl", "tra"),
+# which are also the least selective queries, so those are served from
+# memory. Entries expire after COUNTERPARTY_PREFIX_CACHE_TTL seconds, which
+# bounds how long a new counterparty can be missing from suggestions.
+prefix_cache = LocalCache(settings.COUNTERPARTY_PREFIX_CACHE_SIZE, settings.COUNTERPARTY_PREFIX_CACHE_TTL)
+PREFIX_CACHE_METRICS_NAME = "counterparty_prefixes"
+
+
+def _matches(role: str, term: str, limit: int) -> List[Dict[str, Any]]:
+    """
+    Distinct ``role`` names containing ``term``, names starting with it
+    first, then by number of confirmations. ``icontains`` compiles to
+    ``UPPER(col) LIKE UPPER('%term%')``, which the trigram GIN index on
+    ``UPPER(col)`` serves.
+    """
+    rows = (
+        NewBusinessConfirmation.objects
+        .filter(**{f"{role}__icontains": term})
+        .values(role)
+        .annotate(
+            confirmations=Count("pk"),
+            is_prefix=ExpressionWrapper(Q(**{f"{role}__istartswith": term}), output_field=BooleanField()),
+        )
+        .order_by("-is_prefix", "-confirmations", role)[:limit]
+    )
+    return [
+        {"name": row[role], "role": role, "confirmations": row["confirmations"], "is_prefix": row["is_prefix"]}
+        for row in rows
+    ]
+
+
+def suggest(term: str, role: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Buyer and/or seller names matching ``term`` for a typeahead. Short
+    prefixes are answered from the in-process prefix cache when possible.
+    """
+    limit = limit or settings.COUNTERPARTY_TYPEAHEAD_LIMIT
+    roles = (role,) if role else ROLES
+    cacheable = len(term) <= settings.COUNTERPARTY_HOT_PREFIX_LENGTH
+    key = (roles, term.upper(), limit)
+    if not cacheable:
+        return _suggest(term, roles, limit)
+
+    cached = prefix_cache.get(key)
+    cache_metrics.record(PREFIX_CACHE_METRICS_NAME, hits=cached is not None, misses=cached is None)
+    if cached is not None:
+        return cached
+    with cache_metrics.timed(PREFIX_CACHE_METRICS_NAME):
+        results = _suggest(term, roles, limit)
+    prefix_cache.set(key, results)
+    return results
+
+
+def _suggest(term: str, roles, limit: int) -> List[Dict[str, Any]]:
+    matches = [match for name in roles for match in _matches(name, term, limit)]
+    matches.sort(key=lambda match: (not match["is_prefix"], -match["confirmations"], match["name"]))
+    return [
+        {"name": match["name"], "role": match["role"], "confirmations": match["confirmations"]}
+        for match in matches[:limit]
+    ]
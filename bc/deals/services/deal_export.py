@@ -0,0 +1,137 @@
+import csv
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet
+from rest_framework.utils.encoders import JSONEncoder
+
+from deals.models import BusinessConfirmationDeal
+from deals.serializers import BusinessConfirmationDealSerializer
+
+
+NDJSON = "ndjson"
+CSV = "csv"
+EXPORT_FORMATS = (NDJSON, CSV)
+
+CONTENT_TYPES = {
+    NDJSON: "application/x-ndjson",
+    CSV: "text/csv",
+}
+
+EXPAND = tuple(BusinessConfirmationDealSerializer.EXPANDABLE_FIELDS)
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the caller."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_queryset(queryset: Optional[QuerySet] = None) -> QuerySet:
+    """
+    Deals joined with their confirmation and terms, in a stable order.
+    """
+    if queryset is None:
+        queryset = BusinessConfirmationDeal.objects.all()
+    return queryset.select_related(*EXPAND).order_by("created_at", "pk")
+
+
+def csv_columns() -> List[str]:
+    """
+    Flat CSV header: deal fields, then ``relation.field`` for each nested
+    relation, in serializer field order.
+    """
+    serializer = BusinessConfirmationDealSerializer(expand=EXPAND)
+    columns = []
+    for name, field in serializer.fields.items():
+        if name in EXPAND:
+            columns.extend(f"{name}.{nested}" for nested in field.fields)
+        else:
+            columns.append(name)
+    return columns
+
+
+def _flatten(row: Dict[str, Any]) -> Dict[str, Any]:
+    flat = {}
+    for name, value in row.items():
+        if name in EXPAND:
+            for nested_name, nested_value in (value or {}).items():
+                flat[f"{name}.{nested_name}"] = nested_value
+        else:
+            flat[name] = value
+    for name, value in flat.items():
+        if isinstance(value, (list, dict)):
+            flat[name] = json.dumps(value, cls=JSONEncoder)
+    return flat
+
+
+def iter_rows(queryset: QuerySet, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one serialized deal at a time. ``iterator()`` streams rows through
+    a server-side cursor so only ``chunk_size`` model instances are alive.
+    """
+    serializer = BusinessConfirmationDealSerializer(expand=EXPAND)
+    for deal in queryset.iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(deal)
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, cls=JSONEncoder) + "\n"
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    columns = csv_columns()
+    writer = csv.DictWriter(_Echo(), fieldnames=columns, extrasaction="ignore")
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(_flatten(row))
+
+
+def _batched(lines: Iterable[str], batch_size: int) -> Iterator[bytes]:
+    """Group lines so each network write carries a reasonable amount of data."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= batch_size:
+            yield "".join(batch).encode("utf-8")
+            batch = []
+    if batch:
+        yield "".join(batch).encode("utf-8")
+
+
+def _gzipped(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_export(
+    export_format: str = NDJSON,
+    gzip: bool = False,
+    queryset: Optional[QuerySet] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Stream every deal with its commercial and payment terms as NDJSON or
+    CSV bytes, optionally gzip-compressed. Memory use is bounded by
+    ``chunk_size`` regardless of the number of deals.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    chunk_size = chunk_size or settings.DEAL_EXPORT_CHUNK_SIZE
+
+    rows = iter_rows(export_queryset(queryset), chunk_size)
+    lines = iter_ndjson(rows) if export_format == NDJSON else iter_csv(rows)
+    chunks = _batched(lines, chunk_size)
+    return _gzipped(chunks) if gzip else chunks
+
+
+def export_filename(export_format: str, gzip: bool = False) -> str:
+    return f"deals.{export_format}" + (".gz" if gzip else "")
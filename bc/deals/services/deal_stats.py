@@ -0,0 +1,251 @@
+import logging
+from collections import namedtuple
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Count, DateField, F, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+from django.utils import timezone
+
+from deals.conditional import bump_table_versions_on_commit
+from deals.models import BusinessConfirmationDeal, DealStatsBucket, NewBusinessConfirmation
+
+logger = logging.getLogger("deals")
+
+
+GROUP_BY_FIELDS = ("status", "material", "month")
+
+BucketKey = namedtuple("BucketKey", GROUP_BY_FIELDS)
+
+ZERO = Decimal("0")
+
+
+def month_of(value) -> date:
+    """First day of the month ``value`` falls in, in the current time zone (as TruncMonth)."""
+    return timezone.localtime(value).date().replace(day=1)
+
+
+def _confirmation_terms(confirmation_id) -> Tuple[str, Decimal]:
+    if confirmation_id is None:
+        return "", ZERO
+    row = (
+        NewBusinessConfirmation.objects
+        .filter(pk=confirmation_id)
+        .values_list("material", "quantity")
+        .first()
+    )
+    return row or ("", ZERO)
+
+
+def _material_and_quantity(deal: BusinessConfirmationDeal) -> Tuple[str, Decimal]:
+    cached = BusinessConfirmationDeal.new_business_confirmation.is_cached(deal)
+    if deal.new_business_confirmation_id is not None and cached:
+        confirmation = deal.new_business_confirmation
+        return confirmation.material, confirmation.quantity
+    return _confirmation_terms(deal.new_business_confirmation_id)
+
+
+def deal_deltas(deal: BusinessConfirmationDeal, old_status: Optional[str], new_status: Optional[str]):
+    """
+    Bucket adjustments for ``deal`` moving from ``old_status`` to
+    ``new_status``; ``None`` stands for "not counted" (before create, after
+    delete).
+    """
+    if old_status == new_status:
+        return {}
+    material, quantity = _material_and_quantity(deal)
+    return bucket_deltas(material, quantity, deal.created_at, old_status, new_status)
+
+
+def deal_change_deltas(deal: BusinessConfirmationDeal, old_status: Optional[str], old_confirmation_id):
+    """
+    Bucket adjustments for a saved ``deal`` that had ``old_status`` and the
+    confirmation ``old_confirmation_id`` before the save. A new confirmation
+    moves the deal out of the old confirmation's material bucket.
+    """
+    if old_confirmation_id == deal.new_business_confirmation_id:
+        return deal_deltas(deal, old_status, deal.status)
+    old_material, old_quantity = _confirmation_terms(old_confirmation_id)
+    material, quantity = _material_and_quantity(deal)
+    return merge_deltas([
+        bucket_deltas(old_material, old_quantity, deal.created_at, old_status, None),
+        bucket_deltas(material, quantity, deal.created_at, None, deal.status),
+    ])
+
+
+def confirmation_deltas(confirmation_id, old_terms, new_terms):
+    """
+    Bucket adjustments for the deal of a confirmation whose ``(material,
+    quantity)`` changed from ``old_terms`` to ``new_terms``: the deal leaves
+    its bucket under the old terms and enters the one under the new.
+    """
+    old_material, old_quantity = old_terms
+    material, quantity = new_terms[0], Decimal(str(new_terms[1]))
+    if (old_material, old_quantity) == (material, quantity):
+        return {}
+    deals = (
+        BusinessConfirmationDeal.objects
+        .filter(new_business_confirmation_id=confirmation_id)
+        .values_list("status", "created_at")
+    )
+    return merge_deltas(
+        delta
+        for status, created_at in deals
+        for delta in (
+            bucket_deltas(old_material, old_quantity, created_at, status, None),
+            bucket_deltas(material, quantity, created_at, None, status),
+        )
+    )
+
+
+def bucket_deltas(material, quantity, created_at, old_status, new_status):
+    """
+    Bucket adjustments for a deal known by its confirmation ``material`` and
+    ``quantity`` (None when it has no confirmation) and ``created_at``, for
+    callers that already loaded them, such as bulk status updates.
+    """
+    if old_status == new_status:
+        return {}
+    material, quantity = material or "", quantity or ZERO
+    month = month_of(created_at)
+    deltas = {}
+    if old_status is not None:
+        deltas[BucketKey(old_status, material, month)] = (-1, -quantity)
+    if new_status is not None:
+        deltas[BucketKey(new_status, material, month)] = (1, quantity)
+    return deltas
+
+
+def apply_deltas(deltas: Dict[BucketKey, Tuple[int, Decimal]]) -> None:
+    """
+    Add ``(deal_count, total_quantity)`` deltas to their buckets in a single
+    ``INSERT ... ON CONFLICT DO UPDATE``, so concurrent writers never lose an
+    increment and missing buckets are created on the fly.
+    """
+    rows = [
+        (key.status, key.material, key.month, count, quantity)
+        for key, (count, quantity) in deltas.items()
+        if count or quantity
+    ]
+    if not rows:
+        return
+    table = connection.ops.quote_name(DealStatsBucket._meta.db_table)
+    values = ", ".join(["(%s, %s, %s, %s, %s, NOW())"] * len(rows))
+    sql = (
+        f"INSERT INTO {table} (status, material, month, deal_count, total_quantity, updated_at) "
+        f"VALUES {values} "
+        f"ON CONFLICT (status, material, month) DO UPDATE SET "
+        f"deal_count = {table}.deal_count + EXCLUDED.deal_count, "
+        f"total_quantity = {table}.total_quantity + EXCLUDED.total_quantity, "
+        f"updated_at = EXCLUDED.updated_at"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [value for row in rows for value in row])
+    bump_table_versions_on_commit(DealStatsBucket)
+
+
+def merge_deltas(deltas: Iterable[Dict[BucketKey, Tuple[int, Decimal]]]) -> Dict[BucketKey, Tuple[int, Decimal]]:
+    """Sum several delta dicts, e.g. to apply a bulk status change in one statement."""
+    merged = {}
+    for delta in deltas:
+        for key, (count, quantity) in delta.items():
+            total_count, total_quantity = merged.get(key, (0, ZERO))
+            merged[key] = (total_count + count, total_quantity + quantity)
+    return merged
+
+
+def _actual_buckets() -> Dict[BucketKey, Tuple[int, Decimal]]:
+    rows = (
+        BusinessConfirmationDeal.objects
+        .values(
+            "status",
+            material=Coalesce(F("new_business_confirmation__material"), Value("")),
+            month=TruncMonth("created_at", output_field=DateField()),
+        )
+        .annotate(
+            deal_count=Count("pk"),
+            total_quantity=Coalesce(Sum("new_business_confirmation__quantity"), Value(ZERO)),
+        )
+        .order_by()
+    )
+    return {
+        BucketKey(row["status"], row["material"], row["month"]): (row["deal_count"], row["total_quantity"])
+        for row in rows
+    }
+
+
+def reconcile() -> int:
+    """
+    Rebuild the rollup from the source tables and return the number of
+    buckets that had drifted (updated, created or removed).
+
+    Incremental maintenance misses writes that bypass model signals
+    (``QuerySet.update()``, fixture loads, a nulled-out confirmation), so
+    this runs periodically. The table is locked against concurrent
+    increments for the duration, which is one GROUP BY over the deals.
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {connection.ops.quote_name(DealStatsBucket._meta.db_table)} IN SHARE ROW EXCLUSIVE MODE"
+            )
+        actual = _actual_buckets()
+        existing = {
+            BucketKey(bucket.status, bucket.material, bucket.month): bucket
+            for bucket in DealStatsBucket.objects.all()
+        }
+
+        stale = [bucket.pk for key, bucket in existing.items() if key not in actual]
+        missing: List[DealStatsBucket] = []
+        changed: List[DealStatsBucket] = []
+        for key, (count, quantity) in actual.items():
+            bucket = existing.get(key)
+            if bucket is None:
+                missing.append(DealStatsBucket(**key._asdict(), deal_count=count, total_quantity=quantity))
+            elif (bucket.deal_count, bucket.total_quantity) != (count, quantity):
+                bucket.deal_count, bucket.total_quantity = count, quantity
+                bucket.updated_at = timezone.now()
+                changed.append(bucket)
+
+        if stale:
+            DealStatsBucket.objects.filter(pk__in=stale).delete()
+        if missing:
+            DealStatsBucket.objects.bulk_create(missing)
+        if changed:
+            DealStatsBucket.objects.bulk_update(changed, ["deal_count", "total_quantity", "updated_at"])
+
+    drifted = len(stale) + len(missing) + len(changed)
+    if drifted:
+        bump_table_versions_on_commit(DealStatsBucket)
+        logger.warning(f"Deal stats reconciliation corrected {drifted} buckets")
+    return drifted
+
+
+def summarize(group_by=GROUP_BY_FIELDS, status=None, material=None, month_from=None, month_to=None):
+    """
+    Aggregate the rollup by ``group_by``. Reads only bucket rows, so the cost
+    is proportional to the number of buckets, not deals.
+    """
+    buckets = DealStatsBucket.objects.filter(deal_count__gt=0)
+    if status:
+        buckets = buckets.filter(status=status)
+    if material:
+        buckets = buckets.filter(material=material)
+    if month_from:
+        buckets = buckets.filter(month__gte=month_from)
+    if month_to:
+        buckets = buckets.filter(month__lte=month_to)
+
+    rows = (
+        buckets.values(*group_by)
+        .annotate(deal_count=Sum("deal_count"), total_quantity=Sum("total_quantity"))
+        .order_by(*group_by)
+    )
+    results = []
+    for row in rows:
+        if "month" in row:
+            row["month"] = f"{row['month']:%Y-%m}"
+        results.append(row)
+    return results
@@ -0,0 +1,100 @@
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from deals import invalidation
+from deals.caching import TieredCache
+from deals.models import DropdownOption
+from deals.serializers import DropdownOptionSerializer
+
+logger = logging.getLogger("deals")
+
+
+CACHE_TIMEOUT = 3600
+# Sorted list of field_names that have active options
+FIELDS_CACHE_KEY = "fields"
+PARTITION_CACHE_KEY = "field:{}"
+
+# Options change a few times a week, so every worker keeps its own copy in
+# front of Redis (see TieredCache)
+options_cache = TieredCache("dropdown_options", timeout=CACHE_TIMEOUT)
+
+
+def partition_key(field_name: str) -> str:
+    return PARTITION_CACHE_KEY.format(field_name)
+
+
+def field_names() -> List[str]:
+    """All field_names with active options, cached alongside the partitions."""
+    return options_cache.get_or_set(
+        FIELDS_CACHE_KEY,
+        lambda: sorted(set(
+            DropdownOption.objects.filter(is_active=True).values_list("field_name", flat=True)
+        )),
+    )
+
+
+def _load_partitions(names: Iterable[str]) -> Dict[str, list]:
+    partitions = {name: [] for name in names}
+    options = (
+        DropdownOption.objects
+        .filter(is_active=True, field_name__in=list(partitions))
+        .order_by("field_name", "display_order")
+    )
+    for option in DropdownOptionSerializer(options, many=True).data:
+        partitions[option["field_name"]].append(option)
+    return partitions
+
+
+def get_options(names: Optional[Iterable[str]] = None) -> list:
+    """
+    Serialized active options for ``names`` (every field when None), ordered
+    by field_name and display_order. Each field is cached separately, and
+    missing partitions are loaded together in one query. Concurrent misses
+    are collapsed: one request reloads a field while the others are served
+    its previous options.
+    """
+    names = field_names() if names is None else sorted(set(names))
+    keys = {partition_key(name): name for name in names}
+
+    def load(missing_keys):
+        logger.debug(f"Dropdown cache miss for fields: {', '.join(keys[key] for key in missing_keys)}")
+        loaded = _load_partitions(keys[key] for key in missing_keys)
+        return {partition_key(name): options for name, options in loaded.items()}
+
+    partitions = options_cache.get_or_set_many(keys, load)
+    return [option for name in names for option in partitions[partition_key(name)]]
+
+
+def invalidate(names: Iterable[str], fields_changed: bool = False) -> None:
+    """
+    Mark the cached partitions for ``names`` stale in Redis and drop them
+    from every worker's in-process copy. ``fields_changed`` also marks the
+    field list stale, for changes that can add or remove a field_name.
+    Runs after the current transaction commits, merged with the other
+    invalidations of that transaction (see deals.invalidation).
+    """
+    keys = [partition_key(name) for name in set(names)]
+    if fields_changed:
+        keys.append(FIELDS_CACHE_KEY)
+    invalidation.invalidate(_invalidate_keys, keys)
+
+
+def invalidate_all() -> None:
+    """
+    Invalidate every partition and the field list, including partitions of
+    fields not in the cached field list (e.g. cached empty after a
+    ``?field_name=`` request). For writes that do not say which fields they
+    touched. Runs after the current transaction commits.
+    """
+    invalidation.invalidate(_invalidate_namespace, [options_cache.namespace])
+
+
+def _invalidate_namespace(namespaces) -> None:
+    options_cache.invalidate_all()
+    logger.info("Dropdown options cache invalidated for all fields")
+
+
+def _invalidate_keys(keys) -> None:
+    keys = sorted(keys)
+    options_cache.invalidate(keys)
+    logger.info(f"Dropdown options cache invalidated for keys: {', '.join(keys)}")
@@ -0,0 +1,97 @@
+import html
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Type
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db import models
+from django.db.models import F
+
+from deals.models import AdditionalClause, CommercialTerms, PaymentTerms
+from deals.models.search import SEARCH_CONFIG, JSONStrings
+
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+# ts_headline() does not escape the text it returns, so matches are marked
+# with control characters and the HTML is built after escaping the text
+_START_SEL = "\x02"
+_STOP_SEL = "\x03"
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """A model with a ``search_vector`` column and the text fields it covers."""
+    model: Type[models.Model]
+    # Output name -> expression producing the text to highlight
+    highlight_fields: Dict[str, Any]
+
+
+TARGETS = {
+    "additional_clauses": SearchTarget(AdditionalClause, {"clause": F("clause")}),
+    "commercial_terms": SearchTarget(CommercialTerms, {"clauses": JSONStrings("clauses")}),
+    "payment_terms": SearchTarget(PaymentTerms, {
+        "provisional_payment_terms": F("provisional_payment_terms"),
+        "final_payment_terms": F("final_payment_terms"),
+    }),
+}
+
+
+def _headline(expression, query):
+    return SearchHeadline(
+        expression,
+        query,
+        config=SEARCH_CONFIG,
+        start_sel=_START_SEL,
+        stop_sel=_STOP_SEL,
+        max_fragments=2,
+    )
+
+
+def _highlight(headline):
+    """Escaped ``headline`` with its matches wrapped in ``<mark>``; None without a match."""
+    if not headline or _START_SEL not in headline:
+        return None
+    return html.escape(headline).replace(_START_SEL, HIGHLIGHT_START).replace(_STOP_SEL, HIGHLIGHT_STOP)
+
+
+def search_target(name: str, query: SearchQuery, limit: int) -> List[Dict[str, Any]]:
+    """
+    Top ``limit`` rows of one target by rank. The ``@@`` match runs on the
+    GIN index; ranking and ts_headline only run for the rows returned.
+    """
+    target = TARGETS[name]
+    headlines = {
+        f"headline_{field}": _headline(expression, query)
+        for field, expression in target.highlight_fields.items()
+    }
+    rows = (
+        target.model.objects
+        .filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query), **headlines)
+        .order_by("-rank", "pk")
+        .values("pk", "rank", *headlines)[:limit]
+    )
+    results = []
+    for row in rows:
+        highlights = {}
+        for field in target.highlight_fields:
+            highlight = _highlight(row[f"headline_{field}"])
+            if highlight is not None:
+                highlights[field] = highlight
+        results.append({"type": name, "id": row["pk"], "rank": row["rank"], "highlights": highlights})
+    return results
+
+
+def search(text: str, types: Iterable[str], limit: int) -> List[Dict[str, Any]]:
+    """
+    Full-text search over clauses and payment term text. ``text`` uses web
+    search syntax ("quoted phrases", OR, -exclusions). Results from every
+    requested type are merged by rank.
+    """
+    query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+    results = []
+    for name in types:
+        results.extend(search_target(name, query, limit))
+    results.sort(key=lambda result: -result["rank"])
+    return results[:limit]
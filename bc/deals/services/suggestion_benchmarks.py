@@ -0,0 +1,172 @@
+"""
+Percentile bands of deal terms, computed from historical deals.
+
+refresh() aggregates the numeric commercial and payment terms of every
+non-draft, non-cancelled deal into p10/p25/p50/p75/p90 bands per
+(material, delivery_term, transport_mode). Each band is also rolled up per
+(material, delivery_term), per material and overall, and the bands are
+stored in the SuggestionBenchmark table. The whole table is small, so it is
+cached as one dict; a lookup is a few dict gets, falling back to broader
+contexts until one has at least SUGGESTION_MIN_SAMPLES deals.
+"""
+import logging
+import re
+from collections import namedtuple
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from deals import invalidation
+from deals.caching import TieredCache
+from deals.models import (
+    BusinessConfirmationDeal, CommercialTerms, NewBusinessConfirmation, PaymentTerms, SuggestionBenchmark
+)
+
+logger = logging.getLogger("deals")
+
+
+# Benchmarked term -> column in the history query
+METRICS = {
+    "treatment_charge": "c.treatment_charge",
+    "refining_charge": "c.refining_charge",
+    "prepayment_percentage": "p.prepayment_percentage",
+    "buyer_cost_share_percentage": "p.buyer_cost_share_percentage",
+}
+
+HISTORY_STATUSES = (
+    BusinessConfirmationDeal.SUBMITTED, BusinessConfirmationDeal.PROCESSING, BusinessConfirmationDeal.COMPLETED
+)
+
+PERCENTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+ANY = SuggestionBenchmark.ANY
+
+Band = namedtuple("Band", ["sample_count", "p10", "p25", "p50", "p75", "p90"])
+
+BANDS_CACHE_KEY = "bands"
+
+# The table only changes on refresh(), so every worker keeps its own copy
+bands_cache = TieredCache("suggestion_benchmarks", timeout=settings.SUGGESTION_BENCHMARK_REFRESH_INTERVAL)
+
+
+def normalize(value: Optional[str]) -> str:
+    """Context value as stored in SuggestionBenchmark: lower case, runs of spaces and dashes as one underscore."""
+    return re.sub(r"[\s\-]+", "_", (value or "").strip().lower())
+
+
+def _normalized_sql(column: str) -> str:
+    # Same as normalize()
+    return f"LOWER(REGEXP_REPLACE(TRIM(COALESCE({column}, '')), '[[:space:]-]+', '_', 'g'))"
+
+
+def _history_sql(column: str) -> str:
+    quote = connection.ops.quote_name
+    return (
+        f"SELECT "
+        f"CASE WHEN GROUPING(m) = 1 THEN %s ELSE m END, "
+        f"CASE WHEN GROUPING(dt) = 1 THEN %s ELSE dt END, "
+        f"CASE WHEN GROUPING(tm) = 1 THEN %s ELSE tm END, "
+        f"COUNT(*), "
+        f"percentile_cont(%s::float8[]) WITHIN GROUP (ORDER BY x) "
+        f"FROM ("
+        f"SELECT {_normalized_sql('n.material')} AS m, {_normalized_sql('c.delivery_term')} AS dt, "
+        f"{_normalized_sql('c.transport_mode')} AS tm, {column} AS x "
+        f"FROM {quote(BusinessConfirmationDeal._meta.db_table)} d "
+        f"LEFT JOIN {quote(NewBusinessConfirmation._meta.db_table)} n ON n.id = d.new_business_confirmation_id "
+        f"LEFT JOIN {quote(CommercialTerms._meta.db_table)} c ON c.id = d.commercial_terms_id "
+        f"LEFT JOIN {quote(PaymentTerms._meta.db_table)} p ON p.id = d.payment_terms_id "
+        f"WHERE d.status = ANY(%s) AND {column} IS NOT NULL"
+        f") history "
+        f"GROUP BY GROUPING SETS ((m, dt, tm), (m, dt), (m), ()) "
+        # The empty grouping set yields a row even without history
+        f"HAVING COUNT(*) > 0"
+    )
+
+
+def compute():
+    """Unsaved SuggestionBenchmark rows for the current deal history."""
+    rows = []
+    with connection.cursor() as cursor:
+        for field, column in METRICS.items():
+            cursor.execute(_history_sql(column), [ANY, ANY, ANY, list(PERCENTILES), list(HISTORY_STATUSES)])
+            for material, delivery_term, transport_mode, count, percentiles in cursor.fetchall():
+                p10, p25, p50, p75, p90 = (round(Decimal(value), 4) for value in percentiles)
+                rows.append(SuggestionBenchmark(
+                    field=field, material=material, delivery_term=delivery_term, transport_mode=transport_mode,
+                    sample_count=count, p10=p10, p25=p25, p50=p50, p75=p75, p90=p90,
+                ))
+    return rows
+
+
+def refresh() -> int:
+    """Rebuild the benchmark table from the deals tables; returns the number of bands."""
+    with transaction.atomic():
+        # Serialise concurrent refreshes; readers keep the old bands until commit
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {connection.ops.quote_name(SuggestionBenchmark._meta.db_table)} IN SHARE ROW EXCLUSIVE MODE"
+            )
+        rows = compute()
+        SuggestionBenchmark.objects.all().delete()
+        SuggestionBenchmark.objects.bulk_create(rows)
+        invalidation.invalidate(bands_cache.invalidate, [BANDS_CACHE_KEY])
+    logger.info(f"Suggestion benchmarks refreshed: {len(rows)} bands")
+    return len(rows)
+
+
+def _load_bands():
+    return {
+        (row.field, row.material, row.delivery_term, row.transport_mode): Band(
+            row.sample_count, row.p10, row.p25, row.p50, row.p75, row.p90
+        )
+        for row in SuggestionBenchmark.objects.all()
+    }
+
+
+def bands():
+    """Every band keyed by ``(field, material, delivery_term, transport_mode)``."""
+    return bands_cache.get_or_set(BANDS_CACHE_KEY, _load_bands)
+
+
+def context_keys(material=None, delivery_term=None, transport_mode=None):
+    """
+    The contexts to try, most specific first. Levels that need a value the
+    caller did not give are skipped.
+    """
+    material, delivery_term, transport_mode = normalize(material), normalize(delivery_term), normalize(transport_mode)
+    keys = []
+    if material and delivery_term and transport_mode:
+        keys.append((material, delivery_term, transport_mode))
+    if material and delivery_term:
+        keys.append((material, delivery_term, ANY))
+    if material:
+        keys.append((material, ANY, ANY))
+    keys.append((ANY, ANY, ANY))
+    return keys
+
+
+def lookup_many(fields, material=None, delivery_term=None, transport_mode=None):
+    """
+    The most specific band with at least SUGGESTION_MIN_SAMPLES deals, with
+    the context it was found for, for each of ``fields`` in one context;
+    None for fields without history. The table and the contexts are
+    resolved once for all fields.
+    """
+    table = bands()
+    keys = context_keys(material, delivery_term, transport_mode)
+    found = {}
+    for field in fields:
+        found[field] = None
+        for key in keys:
+            band = table.get((field,) + key)
+            if band is not None and band.sample_count >= settings.SUGGESTION_MIN_SAMPLES:
+                found[field] = (band, key)
+                break
+    return found
+
+
+def lookup(field: str, material=None, delivery_term=None, transport_mode=None) -> Optional[Tuple[Band, tuple]]:
+    """lookup_many() for one field."""
+    return lookup_many([field], material, delivery_term, transport_mode)[field]
@@ -1,39 +1,162 @@
 import logging
-from django.db.models.signals import post_save, post_delete
+from django.db import connections
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
-from deals.models import DropdownOption
-from deals.views.dropdown_views import DropdownOptionView
+from deals.models import (
+    AdditionalClause, BusinessConfirmationDeal, CommercialTerms, DropdownOption,
+    NewBusinessConfirmation, PaymentTerms, TaskStatus
+)
+from deals.conditional import bulk_changed, track_models
+from deals.services import deal_stats, dropdown_cache
 
 logger = logging.getLogger("deals")
 
 
+# Deal fields that decide its stats bucket, besides the confirmation's own
+STATS_DEAL_FIELDS = {"status", "new_business_confirmation", "new_business_confirmation_id"}
+
+
+@receiver(pre_save, sender=DropdownOption)
+def remember_dropdown_partition(sender, instance, raw=False, **kwargs):
+    """
+    Remember the stored field_name and is_active of an existing option, so
+    post_save can also invalidate the field it is moved away from.
+    """
+    instance._cache_previous = None
+    if raw or instance._state.adding:
+        return
+    instance._cache_previous = (
+        sender.objects.filter(pk=instance.pk).values_list("field_name", "is_active").first()
+    )
+
+
 @receiver(post_save, sender=DropdownOption)
-def invalidate_dropdown_cache_on_save(sender, instance, **kwargs):
+def invalidate_dropdown_cache_on_save(sender, instance, created, **kwargs):
     """
-    Invalidate dropdown options cache when a DropdownOption is saved (created or updated).
+    Invalidate the cached partition of the saved DropdownOption's field (and
+    of its previous field if it moved). The field list is only dropped when
+    the set of fields with active options may have changed.
     
     Args:
         sender: The model class that sent the signal
         instance: The actual instance being saved
+        created: Whether a new row was inserted
         **kwargs: Additional keyword arguments
     """
-    cache_key = DropdownOptionView.CACHE_KEY
-    from django.core.cache import cache
-    cache.delete(cache_key)
-    logger.info(f"Dropdown options cache invalidated due to save of {instance}")
+    previous = getattr(instance, "_cache_previous", None)
+    field_names = {instance.field_name}
+    if previous is not None:
+        field_names.add(previous[0])
+    fields_changed = created or previous is None or previous != (instance.field_name, instance.is_active)
+    dropdown_cache.invalidate(field_names, fields_changed=fields_changed)
 
 
 @receiver(post_delete, sender=DropdownOption)
 def invalidate_dropdown_cache_on_delete(sender, instance, **kwargs):
     """
-    Invalidate dropdown options cache when a DropdownOption is deleted.
+    Invalidate the cached partition of the deleted DropdownOption's field.
     
     Args:
         sender: The model class that sent the signal
         instance: The actual instance being deleted
         **kwargs: Additional keyword arguments
     """
-    cache_key = DropdownOptionView.CACHE_KEY
-    from django.core.cache import cache
-    cache.delete(cache_key)
-    logger.info(f"Dropdown options cache invalidated due to deletion of {instance}")
\ No newline at end of file
+    dropdown_cache.invalidate({instance.field_name}, fields_changed=True)
+
+
+@receiver(bulk_changed, sender=DropdownOption)
+def invalidate_dropdown_cache_on_bulk_change(sender, **kwargs):
+    """
+    Invalidate the whole dropdown namespace after a bulk write, which does
+    not say which fields it touched. The cached field list cannot be used
+    here: it is the pre-write list and misses fields cached empty.
+    """
+    dropdown_cache.invalidate_all()
+
+
+# Cached views register their own models through cached_response(); these
+# back the other list ETags
+TABLE_VERSIONED_MODELS = (
+    AdditionalClause, BusinessConfirmationDeal, CommercialTerms, DropdownOption,
+    NewBusinessConfirmation, PaymentTerms, TaskStatus
+)
+
+track_models(*TABLE_VERSIONED_MODELS)
+
+
+def create_postgres_extensions(sender, using, **kwargs):
+    """
+    Create the Postgres extensions the deals indexes rely on (pg_trgm for
+    the buyer/seller/material trigram indexes) before deals migrations run.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+@receiver(pre_save, sender=BusinessConfirmationDeal)
+def remember_deal_status(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Remember the stored status and confirmation of an existing deal so
+    post_save can move it between deal stats buckets. Saves that cannot
+    change either are skipped.
+    """
+    instance._stats_previous = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not STATS_DEAL_FIELDS & set(update_fields):
+        instance._stats_previous = (instance.status, instance.new_business_confirmation_id)
+        return
+    instance._stats_previous = (
+        sender.objects.filter(pk=instance.pk).values_list("status", "new_business_confirmation_id").first()
+    )
+
+
+@receiver(post_save, sender=BusinessConfirmationDeal)
+def update_deal_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    """
+    Count a new deal in its stats bucket, or move it between buckets when
+    its status or confirmation changed.
+    """
+    if raw:
+        return
+    previous = None if created else getattr(instance, "_stats_previous", None)
+    if previous is None:
+        deal_stats.apply_deltas(deal_stats.deal_deltas(instance, None, instance.status))
+        return
+    deal_stats.apply_deltas(deal_stats.deal_change_deltas(instance, *previous))
+
+
+@receiver(pre_save, sender=NewBusinessConfirmation)
+def remember_confirmation_terms(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Remember the stored material and quantity of an existing confirmation,
+    which decide the stats bucket of its deal.
+    """
+    instance._stats_previous_terms = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not {"material", "quantity"} & set(update_fields):
+        return
+    instance._stats_previous_terms = (
+        sender.objects.filter(pk=instance.pk).values_list("material", "quantity").first()
+    )
+
+
+@receiver(post_save, sender=NewBusinessConfirmation)
+def update_deal_stats_on_confirmation_save(sender, instance, created, raw=False, **kwargs):
+    """Move the confirmation's deal between stats buckets when its material or quantity changed."""
+    previous = getattr(instance, "_stats_previous_terms", None)
+    if raw or created or previous is None:
+        return
+    deal_stats.apply_deltas(
+        deal_stats.confirmation_deltas(instance.pk, previous, (instance.material, instance.quantity))
+    )
+
+
+@receiver(post_delete, sender=BusinessConfirmationDeal)
+def update_deal_stats_on_delete(sender, instance, **kwargs):
+    """Remove a deleted deal from its stats bucket."""
+    deal_stats.apply_deltas(deal_stats.deal_deltas(instance, instance.status, None))
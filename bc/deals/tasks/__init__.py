@@ -1 +1,7 @@
 # Tasks package
+from .processing_tasks import process_business_confirmation_deal
+from .stats_tasks import reconcile_deal_stats, refresh_suggestion_benchmarks
+from .bulk_tasks import run_deal_bulk_job
+
+__all__ = ["process_business_confirmation_deal", "reconcile_deal_stats", "refresh_suggestion_benchmarks",
+           "run_deal_bulk_job"]
@@ -0,0 +1,23 @@
+import logging
+from celery import shared_task
+from deals.models import DealBulkJob
+from deals.services import bulk_deal_actions
+
+logger = logging.getLogger("deals")
+
+
+@shared_task
+def run_deal_bulk_job(job_id, deal_ids):
+    """
+    Run a bulk submit/cancel/reprocess job queued from the deals admin,
+    in primary key ordered chunks.
+    """
+    try:
+        job = DealBulkJob.objects.get(id=job_id)
+    except DealBulkJob.DoesNotExist:
+        logger.warning(f"Bulk job {job_id} no longer exists")
+        return
+    if job.status != DealBulkJob.PENDING:
+        logger.warning(f"Bulk job {job_id} is not in pending state (current: {job.status})")
+        return
+    bulk_deal_actions.run(job, deal_ids)
@@ -0,0 +1,22 @@
+import logging
+from celery import shared_task
+from deals.services import deal_stats, suggestion_benchmarks
+
+logger = logging.getLogger("deals")
+
+
+@shared_task
+def reconcile_deal_stats():
+    """
+    Periodic rebuild of the deal stats rollup from the deals tables,
+    correcting drift from writes that bypassed the incremental updates.
+    """
+    drifted = deal_stats.reconcile()
+    logger.info(f"Deal stats reconciled, {drifted} buckets corrected")
+    return drifted
+
+
+@shared_task
+def refresh_suggestion_benchmarks():
+    """Periodic rebuild of the AI suggestion percentile bands from the deals history."""
+    return suggestion_benchmarks.refresh()
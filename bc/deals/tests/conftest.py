@@ -0,0 +1,28 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import Client
+from rest_framework.test import APIClient
+from deals.tests.factories import UserFactory
+
+
+@pytest.fixture
+def api_client():
+    """Create API client for testing"""
+    return APIClient()
+
+
+@pytest.fixture
+def authenticated_user(api_client):
+    """Create and authenticate a user"""
+    user = UserFactory()
+    api_client.force_authenticate(user=user)
+    return user
+
+
+@pytest.fixture
+def admin_client_logged_in():
+    """Create a superuser and log them in to the admin"""
+    get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+    client = Client()
+    client.login(username='admin', password='password')
+    return client
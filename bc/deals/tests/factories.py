@@ -1,7 +1,7 @@
 import factory
 from django.contrib.auth import get_user_model
 from decimal import Decimal
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from deals.models import (
     NewBusinessConfirmation, BusinessConfirmationDeal, 
     CommercialTerms, PaymentTerms, DropdownOption,
@@ -42,7 +42,7 @@ class CommercialTermsFactory(factory.django.DjangoModelFactory):
     transport_mode = factory.Iterator(['Rail', 'Ship', 'Truck'])
     inland_freight_buyer = factory.Faker('boolean')
     shipment_start_date = factory.LazyFunction(lambda: date.today())
-    shipment_end_date = factory.LazyFunction(lambda: date.today().replace(day=date.today().day + 30))
+    shipment_end_date = factory.LazyFunction(lambda: date.today() + timedelta(days=30))
     shipment_evenly_distributed = factory.Faker('boolean')
     treatment_charge = factory.LazyFunction(lambda: Decimal('50.00'))
     treatment_charge_unit = 'dmt'
@@ -54,16 +54,15 @@ class PaymentTermsFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = PaymentTerms
 
-    payment_stage_1_percentage = factory.LazyFunction(lambda: Decimal('30.00'))
-    payment_stage_1_days = 30
-    payment_stage_2_percentage = factory.LazyFunction(lambda: Decimal('40.00'))
-    payment_stage_2_days = 60
-    payment_stage_3_percentage = factory.LazyFunction(lambda: Decimal('30.00'))
-    payment_stage_3_days = 90
+    prepayment_percentage = factory.LazyFunction(lambda: Decimal('30.00'))
+    prepayment_trigger = 'Contract signing'
+    provisional_payment_terms = factory.Faker('paragraph')
+    final_payment_terms = factory.Faker('paragraph')
     currency = factory.Iterator(['USD', 'EUR', 'GBP'])
     payment_method = factory.Iterator(['Bank Transfer', 'Letter of Credit', 'Cash'])
-    credit_terms_days = 30
-    guarantee_required = factory.Faker('boolean')
+    buyer_cost_share_percentage = factory.LazyFunction(lambda: Decimal('50.00'))
+    seller_cost_share_percentage = factory.LazyFunction(lambda: Decimal('50.00'))
+    surveyor_notes = factory.Faker('sentence')
 
 
 class DropdownOptionFactory(factory.django.DjangoModelFactory):
@@ -85,8 +84,7 @@ class AdditionalClauseFactory(factory.django.DjangoModelFactory):
         model = AdditionalClause
 
     clause = factory.Faker('sentence')
-    clause_type = factory.Iterator(['standard', 'custom', 'regulatory'])
-    is_active = True
+    display_order = factory.Sequence(lambda n: n)
 
 
 class BusinessConfirmationDealFactory(factory.django.DjangoModelFactory):
@@ -0,0 +1,108 @@
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from deals.models import BusinessConfirmationDeal, DealBulkJob, DealStatsBucket, TaskStatus
+from deals.services import bulk_deal_actions
+from deals.tasks import bulk_tasks
+from deals.tests.factories import BusinessConfirmationDealFactory, NewBusinessConfirmationFactory
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    """Record Celery messages instead of sending them to the broker"""
+    calls = []
+    monkeypatch.setattr(
+        bulk_deal_actions.process_business_confirmation_deal, 'apply_async',
+        lambda args, task_id: calls.append(('process', args, task_id)),
+    )
+    monkeypatch.setattr(
+        bulk_tasks.run_deal_bulk_job, 'apply_async',
+        lambda args, task_id: calls.append(('bulk', args, task_id)),
+    )
+    return calls
+
+
+def _job(action, deals):
+    return DealBulkJob.objects.create(task_id=f'job-{action}', action=action, total=len(deals))
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDealBulkActions:
+    """Test cases for the bulk submit/cancel/reprocess admin actions"""
+
+    def test_admin_action_queues_job(self, admin_client_logged_in, queued):
+        """Test that the admin action only records and queues a job"""
+        deals = BusinessConfirmationDealFactory.create_batch(3, status=BusinessConfirmationDeal.DRAFT)
+
+        response = admin_client_logged_in.post(
+            reverse('admin:deals_businessconfirmationdeal_changelist'),
+            {'action': 'submit_selected_deals', '_selected_action': [str(deal.pk) for deal in deals]},
+            follow=True,
+        )
+
+        job = DealBulkJob.objects.get()
+        assert job.action == DealBulkJob.SUBMIT
+        assert job.total == 3
+        assert job.status == DealBulkJob.PENDING
+        [(kind, (job_id, deal_ids), task_id)] = queued
+        assert (kind, job_id, task_id) == ('bulk', str(job.pk), job.task_id)
+        assert sorted(deal_ids) == sorted(str(deal.pk) for deal in deals)
+        assert reverse('admin:deals_dealbulkjob_change', args=[job.pk]) in response.content.decode()
+        assert BusinessConfirmationDeal.objects.filter(status=BusinessConfirmationDeal.DRAFT).count() == 3
+
+    def test_submit_in_chunks(self, queued):
+        """Test submitting eligible deals chunk by chunk with bulk-created task statuses"""
+        drafts = BusinessConfirmationDealFactory.create_batch(5, status=BusinessConfirmationDeal.DRAFT)
+        completed = BusinessConfirmationDealFactory(status=BusinessConfirmationDeal.COMPLETED)
+        deals = drafts + [completed]
+        job = _job(DealBulkJob.SUBMIT, deals)
+
+        job = bulk_deal_actions.run(job, [str(deal.pk) for deal in deals], chunk_size=2)
+
+        assert (job.status, job.processed, job.changed, job.skipped) == (DealBulkJob.COMPLETED, 6, 5, 1)
+        assert BusinessConfirmationDeal.objects.filter(status=BusinessConfirmationDeal.SUBMITTED).count() == 5
+        completed.refresh_from_db()
+        assert completed.status == BusinessConfirmationDeal.COMPLETED
+        task_statuses = TaskStatus.objects.filter(status=TaskStatus.PENDING)
+        assert task_statuses.count() == 5
+        assert sorted(call[2] for call in queued) == sorted(task_statuses.values_list('task_id', flat=True))
+
+    def test_chunk_is_single_update(self, queued):
+        """Test that a chunk changes its deals with one UPDATE statement"""
+        deals = BusinessConfirmationDealFactory.create_batch(4, status=BusinessConfirmationDeal.DRAFT)
+
+        with CaptureQueriesContext(connection) as queries:
+            bulk_deal_actions.apply_chunk(
+                bulk_deal_actions.ACTIONS[DealBulkJob.CANCEL], [str(deal.pk) for deal in deals]
+            )
+
+        deal_updates = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('UPDATE "deals_businessconfirmationdeal"')
+        ]
+        assert len(deal_updates) == 1
+        assert BusinessConfirmationDeal.objects.filter(status=BusinessConfirmationDeal.CANCELLED).count() == 4
+
+    def test_cancel_fails_pending_tasks_and_keeps_stats(self, queued):
+        """Test that cancelling stops pending processing and moves stats buckets"""
+        deal = BusinessConfirmationDealFactory(
+            status=BusinessConfirmationDeal.DRAFT,
+            new_business_confirmation=NewBusinessConfirmationFactory(material='Akzhal', quantity=Decimal('5.00')),
+        )
+        bulk_deal_actions.run(_job(DealBulkJob.SUBMIT, [deal]), [str(deal.pk)])
+
+        bulk_deal_actions.run(_job(DealBulkJob.CANCEL, [deal]), [str(deal.pk)])
+
+        assert TaskStatus.objects.get(deal=deal).status == TaskStatus.FAILED
+        buckets = DealStatsBucket.objects.filter(material='Akzhal', deal_count__gt=0)
+        assert [(bucket.status, bucket.deal_count) for bucket in buckets] == [('cancelled', 1)]
+
+    def test_job_progress_in_admin(self, admin_client_logged_in):
+        """Test that the job changelist shows progress"""
+        DealBulkJob.objects.create(task_id='job', action=DealBulkJob.CANCEL, total=8, processed=2)
+
+        response = admin_client_logged_in.get(reverse('admin:deals_dealbulkjob_changelist'))
+
+        assert '2/8 (25%)' in response.content.decode()
@@ -0,0 +1,85 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from deals.models import BusinessConfirmationDeal, TaskStatus
+from deals.pagination import EstimatedCountPaginator, estimated_count
+from deals.tests.factories import BusinessConfirmationDealFactory, TaskStatusFactory
+
+
+def _changelist_queries(client, url, **params):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, params)
+    assert response.status_code == 200
+    return len(queries.captured_queries)
+
+
+@pytest.mark.django_db
+class TestAdminChangelistQueryBudget:
+    """Test cases for admin changelist query counts"""
+
+    # session, user, planner estimate, exact COUNT(*) (below threshold), page rows
+    BUDGET = 5
+
+    @pytest.mark.parametrize('model,factory', [
+        (BusinessConfirmationDeal, BusinessConfirmationDealFactory),
+        (TaskStatus, TaskStatusFactory),
+    ])
+    def test_changelist_within_budget(self, admin_client_logged_in, model, factory):
+        """Test that the changelist query count is bounded and independent of rows shown"""
+        url = reverse(f'admin:deals_{model._meta.model_name}_changelist')
+        factory.create_batch(2)
+        few = _changelist_queries(admin_client_logged_in, url)
+        factory.create_batch(8)
+        many = _changelist_queries(admin_client_logged_in, url)
+
+        assert few == many
+        assert many <= self.BUDGET
+
+    @pytest.mark.parametrize('model,factory', [
+        (BusinessConfirmationDeal, BusinessConfirmationDealFactory),
+        (TaskStatus, TaskStatusFactory),
+    ])
+    def test_filtered_search_within_budget(self, admin_client_logged_in, model, factory):
+        """Test that filtering and searching do not add a full-table count"""
+        url = reverse(f'admin:deals_{model._meta.model_name}_changelist')
+        factory.create_batch(5)
+
+        assert _changelist_queries(admin_client_logged_in, url, status='completed', q='user') <= self.BUDGET
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    """Test cases for planner-estimated changelist counts"""
+
+    def test_uses_reltuples_above_threshold(self, settings):
+        """Test that an unfiltered count comes from pg_class once analyzed"""
+        settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 1
+        BusinessConfirmationDealFactory.create_batch(3)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE deals_businessconfirmationdeal')
+
+        paginator = EstimatedCountPaginator(BusinessConfirmationDeal.objects.order_by('-created_at'), 100)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert paginator.count == 3
+        assert 'pg_class' in queries.captured_queries[0]['sql']
+        assert 'COUNT(' not in ' '.join(query['sql'] for query in queries.captured_queries)
+
+    def test_filtered_estimate_from_explain(self):
+        """Test that filtered querysets are estimated from the query plan"""
+        BusinessConfirmationDealFactory.create_batch(3)
+
+        estimate = estimated_count(BusinessConfirmationDeal.objects.filter(status='draft'))
+
+        assert isinstance(estimate, int)
+
+    def test_exact_count_below_threshold(self, settings):
+        """Test that small tables are counted exactly"""
+        settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 10000
+        BusinessConfirmationDealFactory(status='draft')
+        BusinessConfirmationDealFactory.create_batch(2, status='completed')
+
+        paginator = EstimatedCountPaginator(BusinessConfirmationDeal.objects.filter(status='draft'), 100)
+
+        assert paginator.count == 1
@@ -0,0 +1,251 @@
+import pytest
+from decimal import Decimal
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from deals.models import SuggestionBenchmark
+from deals.services import suggestion_benchmarks
+from deals.services.ai_suggestions import ai_suggestions_service
+from deals.tests.factories import (
+    BusinessConfirmationDealFactory, NewBusinessConfirmationFactory, CommercialTermsFactory,
+    PaymentTermsFactory
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(settings):
+    settings.SUGGESTION_MIN_SAMPLES = 5
+    cache.clear()
+    suggestion_benchmarks.bands_cache.clear_local()
+    yield
+    cache.clear()
+    suggestion_benchmarks.bands_cache.clear_local()
+
+
+def create_deal(material='Lead concentrate', delivery_term='DAP', transport_mode='Rail', treatment_charge='300',
+                status='completed'):
+    return BusinessConfirmationDealFactory(
+        status=status,
+        new_business_confirmation=NewBusinessConfirmationFactory(material=material),
+        commercial_terms=CommercialTermsFactory(
+            delivery_term=delivery_term, transport_mode=transport_mode, treatment_charge=Decimal(treatment_charge)
+        ),
+        payment_terms=PaymentTermsFactory(),
+    )
+
+
+@pytest.fixture
+def lead_history():
+    """Ten lead deals by rail with TC 300 to 390, and five copper deals"""
+    for treatment_charge in range(300, 400, 10):
+        create_deal(treatment_charge=str(treatment_charge))
+    for _ in range(5):
+        create_deal(material='Copper ore', delivery_term='FOB', transport_mode='Ship', treatment_charge='80')
+    suggestion_benchmarks.refresh()
+
+
+@pytest.mark.django_db
+class TestSuggestionBenchmarks:
+    """Test cases for the suggestion benchmark table"""
+
+    def test_refresh_computes_percentiles_per_context(self, lead_history):
+        """Test that bands are computed per context and rolled up"""
+        band = SuggestionBenchmark.objects.get(
+            field='treatment_charge', material='lead_concentrate', delivery_term='dap', transport_mode='rail'
+        )
+        assert band.sample_count == 10
+        assert band.p10 == Decimal('309.0000')
+        assert band.p50 == Decimal('345.0000')
+        assert band.p90 == Decimal('381.0000')
+
+        overall = SuggestionBenchmark.objects.get(field='treatment_charge', material='*', delivery_term='*',
+                                                  transport_mode='*')
+        assert overall.sample_count == 15
+        assert SuggestionBenchmark.objects.filter(field='prepayment_percentage').count() == 7
+
+    def test_refresh_ignores_drafts_and_cancelled_deals(self, lead_history):
+        """Test that only submitted, processing and completed deals are benchmarked"""
+        create_deal(treatment_charge='1000', status='draft')
+        create_deal(treatment_charge='1000', status='cancelled')
+        suggestion_benchmarks.refresh()
+
+        band = SuggestionBenchmark.objects.get(
+            field='treatment_charge', material='lead_concentrate', delivery_term='dap', transport_mode='rail'
+        )
+        assert band.sample_count == 10
+
+    def test_lookup_falls_back_to_broader_context(self, lead_history):
+        """Test that contexts with too few deals use the next broader band"""
+        band, context = suggestion_benchmarks.lookup('treatment_charge', 'Lead Concentrate', 'DAP', 'Truck')
+        assert context == ('lead_concentrate', 'dap', '*')
+        assert band.sample_count == 10
+
+        band, context = suggestion_benchmarks.lookup('treatment_charge', 'Zinc concentrate', 'DAP', 'Rail')
+        assert context == ('*', '*', '*')
+
+    def test_lookup_without_history(self):
+        """Test that there is no band without historical deals"""
+        suggestion_benchmarks.refresh()
+        assert suggestion_benchmarks.lookup('treatment_charge', 'Lead concentrate', 'DAP', 'Rail') is None
+
+    def test_refresh_invalidates_cached_bands(self, lead_history):
+        """Test that cached bands are replaced after a refresh"""
+        assert suggestion_benchmarks.lookup('refining_charge')[0].p50 == Decimal('25.0000')
+        create_deal(treatment_charge='300')
+        suggestion_benchmarks.refresh()
+        assert suggestion_benchmarks.lookup('treatment_charge')[0].sample_count == 16
+
+    def test_warm_suggestion_stays_in_process(self, lead_history, monkeypatch):
+        """Test that a suggestion with the bands in L1 makes no Redis round trip"""
+        suggestion_benchmarks.refresh()
+        ai_suggestions_service.get_suggestion('treatment_charge', '450', material='Lead concentrate')
+        monkeypatch.setattr(cache, 'get_many', lambda *args, **kwargs: pytest.fail('Redis read'))
+        monkeypatch.setattr(cache, 'get', lambda *args, **kwargs: pytest.fail('Redis read'))
+
+        suggestion = ai_suggestions_service.get_suggestion('treatment_charge', '460', material='Lead concentrate')
+        assert suggestion['type'] == 'warning'
+
+    def test_refresh_command(self, lead_history):
+        """Test that the management command rebuilds the table"""
+        SuggestionBenchmark.objects.all().delete()
+        call_command('refresh_suggestion_benchmarks')
+        assert SuggestionBenchmark.objects.filter(field='treatment_charge').count() == 7
+
+
+@pytest.mark.django_db
+class TestAISuggestionsView:
+    """Test cases for the AI suggestions GET endpoint"""
+
+    def get(self, api_client, **params):
+        return api_client.get(reverse('deals:ai-suggestions'), params)
+
+    def test_value_within_band(self, api_client, authenticated_user, lead_history):
+        """Test that a typical value gets the typical range and no suggested value"""
+        response = self.get(api_client, field_name='treatment_charge', field_value='340', material='Lead concentrate',
+                            delivery_term='DAP', transport_mode='Rail')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['type'] == 'info'
+        assert response.data['suggested_value'] is None
+        assert response.data['show_accept_button'] is False
+        assert response.data['message'] == 'Typical TC for Lead concentrate, DAP, Rail deals: $322.5/dmt-$367.5/dmt'
+        assert response.data['benchmark']['sample_count'] == 10
+
+    def test_value_outside_band(self, api_client, authenticated_user, lead_history):
+        """Test that an unusual value gets a warning with the median as suggestion"""
+        response = self.get(api_client, field_name='treatment_charge', field_value='450', material='Lead concentrate',
+                            delivery_term='DAP', transport_mode='Rail')
+
+        assert response.data['type'] == 'warning'
+        assert response.data['suggested_value'] == 345.0
+        assert response.data['show_accept_button'] is True
+        assert 'higher than usual' in response.data['message']
+
+    def test_context_changes_band(self, api_client, authenticated_user, lead_history):
+        """Test that the same value is checked against the deal's own context"""
+        response = self.get(api_client, field_name='treatment_charge', field_value='340', material='Copper ore',
+                            delivery_term='FOB', transport_mode='Ship')
+
+        assert response.data['type'] == 'warning'
+        assert response.data['suggested_value'] == 80.0
+
+    def test_form_field_aliases(self, api_client, authenticated_user, lead_history):
+        """Test that form field names are mapped to the benchmarked terms"""
+        response = self.get(api_client, field_name='prepayment', field_value='30')
+
+        assert response.data['type'] == 'info'
+        assert response.data['message'] == 'Typical prepayment across all deals: 30%-30%'
+
+    def test_no_history(self, api_client, authenticated_user):
+        """Test that no suggestion is returned without comparable deals"""
+        response = self.get(api_client, field_name='treatment_charge', field_value='340')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'message' in response.data
+        assert 'type' not in response.data
+
+    def test_missing_parameters(self, api_client, authenticated_user):
+        """Test that field_name and field_value are required"""
+        response = self.get(api_client, field_name='treatment_charge')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestAISuggestionsBatchView:
+    """Test cases for the AI suggestions POST endpoint"""
+
+    def post(self, api_client, data):
+        return api_client.post(reverse('deals:ai-suggestions'), data, format='json')
+
+    def test_whole_form(self, api_client, authenticated_user, lead_history):
+        """Test that every field of the form gets its suggestion in one response"""
+        response = self.post(api_client, {
+            'form': {
+                'material': 'Lead concentrate',
+                'delivery_term': 'DAP',
+                'transport_mode': 'Rail',
+                'treatment_charge': 450,
+                'refining_charge': '25',
+                'prepayment': '30',
+                'packaging': 'Bulk',
+            }
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        suggestions = response.data['suggestions']
+        assert set(suggestions) == {'treatment_charge', 'refining_charge', 'prepayment'}
+        assert suggestions['treatment_charge']['type'] == 'warning'
+        assert suggestions['treatment_charge']['suggested_value'] == 345.0
+        assert suggestions['treatment_charge']['benchmark']['material'] == 'lead_concentrate'
+        assert suggestions['refining_charge']['type'] == 'info'
+
+    def test_field_list_with_context(self, api_client, authenticated_user, lead_history):
+        """Test that listed fields are checked against the given context"""
+        response = self.post(api_client, {
+            'material': 'Copper ore',
+            'delivery_term': 'FOB',
+            'transport_mode': 'Ship',
+            'fields': [
+                {'field_name': 'treatment_charge', 'field_value': '80'},
+                {'field_name': 'cost_sharing', 'field_value': '90'},
+            ]
+        })
+
+        suggestions = response.data['suggestions']
+        assert suggestions['treatment_charge']['type'] == 'info'
+        assert suggestions['cost_sharing']['type'] == 'warning'
+        assert suggestions['cost_sharing']['suggested_value'] == 50.0
+
+    def test_bands_loaded_once(self, api_client, authenticated_user, lead_history, monkeypatch):
+        """Test that all fields share one lookup of the bands"""
+        calls = []
+        bands = suggestion_benchmarks.bands
+        monkeypatch.setattr(suggestion_benchmarks, 'bands', lambda: calls.append(1) or bands())
+
+        response = self.post(api_client, {'form': {
+            'treatment_charge': '340', 'refining_charge': '25', 'prepayment': '30', 'cost_sharing': '50'
+        }})
+
+        assert len(response.data['suggestions']) == 4
+        assert len(calls) == 1
+
+    def test_no_history(self, api_client, authenticated_user):
+        """Test that fields without comparable deals are left out"""
+        response = self.post(api_client, {'form': {'treatment_charge': '340'}})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['suggestions'] == {}
+
+    def test_missing_fields(self, api_client, authenticated_user):
+        """Test that a form or a field list is required"""
+        response = self.post(api_client, {'material': 'Lead concentrate'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_requires_authentication(self, api_client):
+        """Test that anonymous users cannot request suggestions"""
+        response = self.post(api_client, {'form': {'treatment_charge': '340'}})
+
+        assert response.status_code in [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN]
@@ -3,7 +3,6 @@ from decimal import Decimal
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from rest_framework import status
-from rest_framework.test import APIClient
 from deals.models import BusinessConfirmationDeal
 from deals.tests.factories import (
     UserFactory, NewBusinessConfirmationFactory,
@@ -15,20 +14,6 @@ from deals.tests.factories import (
 User = get_user_model()
 
 
-@pytest.fixture
-def api_client():
-    """Create API client for testing"""
-    return APIClient()
-
-
-@pytest.fixture
-def authenticated_user(api_client):
-    """Create and authenticate a user"""
-    user = UserFactory()
-    api_client.force_authenticate(user=user)
-    return user
-
-
 @pytest.mark.django_db
 class TestNewBusinessConfirmationAPI:
     """Test cases for NewBusinessConfirmation API endpoints"""
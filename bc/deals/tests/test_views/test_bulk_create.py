@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from deals.models import CommercialTerms, NewBusinessConfirmation, PaymentTerms
+
+
+def confirmation(**overrides):
+    data = {'seller': 'Seller Ltd', 'buyer': 'Buyer Inc', 'material': 'Copper ore', 'quantity': '1000.50'}
+    data.update(overrides)
+    return data
+
+
+@pytest.mark.django_db
+class TestBulkCreate:
+    """Test cases for the bulk create endpoints"""
+
+    def test_creates_all_items_in_one_insert(self, api_client, authenticated_user, django_assert_max_num_queries):
+        """Test that a valid array is inserted with a single INSERT"""
+        items = [confirmation(seller=f'Seller {i}') for i in range(50)]
+
+        with django_assert_max_num_queries(3):  # SAVEPOINT, INSERT, RELEASE
+            response = api_client.post(reverse('deals:new-business-confirmation-bulk'), items, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['created'] == 50
+        assert response.data['failed'] == 0
+        assert [row['index'] for row in response.data['results']] == list(range(50))
+        assert response.data['results'][3]['data']['seller'] == 'Seller 3'
+        assert response.data['results'][3]['data']['id'] is not None
+        assert NewBusinessConfirmation.objects.count() == 50
+
+    def test_invalid_item_rolls_back_everything(self, api_client, authenticated_user):
+        """Test that by default one invalid item means nothing is created"""
+        items = [confirmation(), confirmation(quantity='not a number'), confirmation()]
+
+        response = api_client.post(reverse('deals:new-business-confirmation-bulk'), items, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['created'] == 0
+        assert [row['status'] for row in response.data['results']] == ['not_created', 'invalid', 'not_created']
+        assert 'quantity' in response.data['results'][1]['errors']
+        assert NewBusinessConfirmation.objects.count() == 0
+
+    def test_partial_creates_valid_items(self, api_client, authenticated_user):
+        """Test that ?partial=true inserts the valid items and reports the rest"""
+        items = [
+            {'currency': 'USD', 'payment_method': 'Cash'},
+            {'prepayment_percentage': 'abc'},
+            {'currency': 'EUR'},
+        ]
+
+        response = api_client.post(
+            reverse('deals:payment-terms-bulk') + '?partial=true', items, format='json'
+        )
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert [row['status'] for row in response.data['results']] == ['created', 'invalid', 'created']
+        assert response.data['results'][2]['data']['currency'] == 'EUR'
+        assert PaymentTerms.objects.count() == 2
+
+    def test_ndjson_body(self, api_client, authenticated_user):
+        """Test that newline-delimited JSON is accepted"""
+        body = '\n'.join(json.dumps({'delivery_term': term}) for term in ('FOB', 'CIF')) + '\n'
+
+        response = api_client.post(
+            reverse('deals:commercial-terms-bulk'), body, content_type='application/x-ndjson'
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert set(CommercialTerms.objects.values_list('delivery_term', flat=True)) == {'FOB', 'CIF'}
+
+    def test_malformed_ndjson_line(self, api_client, authenticated_user):
+        """Test that a broken NDJSON line is reported with its number"""
+        body = '{"delivery_term": "FOB"}\n{oops\n'
+
+        response = api_client.post(
+            reverse('deals:commercial-terms-bulk'), body, content_type='application/x-ndjson'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'line 2' in response.data['detail']
+
+    @pytest.mark.parametrize('body', [{'seller': 'x'}, []])
+    def test_body_must_be_non_empty_list(self, api_client, authenticated_user, body):
+        """Test that objects and empty arrays are rejected"""
+        response = api_client.post(reverse('deals:new-business-confirmation-bulk'), body, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'non_field_errors' in response.data
+
+    def test_max_items(self, api_client, authenticated_user, settings):
+        """Test that BULK_CREATE_MAX_ITEMS is enforced"""
+        settings.BULK_CREATE_MAX_ITEMS = 2
+
+        response = api_client.post(
+            reverse('deals:new-business-confirmation-bulk'), [confirmation()] * 3, format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert NewBusinessConfirmation.objects.count() == 0
+
+    def test_list_etag_changes_after_bulk_create(self, api_client, authenticated_user):
+        """Test that bulk inserts invalidate list ETags despite sending no signals"""
+        url = reverse('deals:new-business-confirmation')
+        etag = api_client.get(url)['ETag']
+
+        api_client.post(reverse('deals:new-business-confirmation-bulk'), [confirmation()], format='json')
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_requires_authentication(self, api_client):
+        """Test that bulk create requires authentication"""
+        response = api_client.post(reverse('deals:payment-terms-bulk'), [{}], format='json')
+
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
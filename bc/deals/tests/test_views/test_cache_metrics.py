@@ -0,0 +1,113 @@
+import pytest
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from deals import cache_metrics, response_cache
+from deals.caching import SingleFlightCache, _redis_client
+from deals.services import dropdown_cache
+from deals.tests.factories import UserFactory, DropdownOptionFactory
+
+
+@pytest.fixture(autouse=True)
+def empty_metrics():
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+    response_cache.rendered_responses.local.clear()
+    cache_metrics.reset()
+    yield
+    cache_metrics.reset()
+
+
+def _stats(name):
+    return next(row for row in cache_metrics.report() if row['cache'] == name)
+
+
+class TestCacheMetrics:
+    """Test cases for cache hit/miss/latency metrics"""
+
+    @pytest.fixture
+    def flight(self):
+        flight = SingleFlightCache('test_metrics', timeout=60)
+        yield flight
+        cache.delete_many([flight.key(key) for key in 'abc'] + [flight.fresh_key(key) for key in 'abc'])
+
+    def test_hits_misses_and_stale(self, flight):
+        """Test that get_or_set_many counts each key once"""
+        flight.get_or_set_many(['a', 'b'], lambda keys: {key: 1 for key in keys})
+        flight.get_or_set_many(['a', 'b', 'c'], lambda keys: {key: 2 for key in keys})
+        flight.invalidate(['a'])
+        cache.add(flight.lock_key('a'), 'other-worker', 10)
+        flight.get_or_set('a', lambda: 3)
+
+        stats = _stats('test_metrics')
+        assert (stats['hits'], stats['misses'], stats['stale']) == (2, 3, 1)
+        assert stats['hit_ratio'] == round(2 / 6, 4)
+        assert stats['recomputes'] == 2
+        cache.delete(flight.lock_key('a'))
+
+    def test_percentiles_from_buckets(self):
+        """Test that p50/p95 come from the latency histogram"""
+        for seconds in [0.003] * 18 + [0.2, 3]:
+            cache_metrics.record_recompute('test_latency', seconds)
+
+        stats = _stats('test_latency')
+        assert stats['recomputes'] == 20
+        assert stats['recompute_p50_ms'] == 5
+        assert stats['recompute_p95_ms'] == 250
+
+    def test_buffered_until_interval(self, settings):
+        """Test that counts reach Redis only once the flush interval has passed"""
+        settings.CACHE_METRICS_FLUSH_INTERVAL = 3600
+        cache_metrics.flush()
+        cache_metrics.record('test_buffered', hits=1)
+
+        assert not _redis_client().exists(cache_metrics.METRICS_KEY.format('test_buffered'))
+        cache_metrics.flush()
+        assert _redis_client().hget(cache_metrics.METRICS_KEY.format('test_buffered'), 'hits') == b'1'
+
+    def test_disabled(self, settings):
+        """Test that nothing is recorded when metrics are disabled"""
+        settings.CACHE_METRICS_ENABLED = False
+        cache_metrics.record('test_disabled', hits=1)
+
+        assert 'test_disabled' not in [row['cache'] for row in cache_metrics.report()]
+
+
+@pytest.mark.django_db
+class TestCacheStatsReporting:
+    """Test cases for the cache stats endpoint and command"""
+
+    def test_staff_only(self, api_client, authenticated_user):
+        """Test that non-staff users are refused"""
+        response = api_client.get(reverse('deals:cache-stats'))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_endpoint_reports_dropdown_and_rendered_caches(self, api_client):
+        """Test that endpoint traffic shows up per logical cache"""
+        api_client.force_authenticate(user=UserFactory(is_staff=True))
+        DropdownOptionFactory(field_name='material')
+        url = reverse('deals:dropdown')
+        api_client.get(url)
+        api_client.get(url)
+
+        response = api_client.get(reverse('deals:cache-stats'))
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = {row['cache']: row for row in response.data['results']}
+        assert (rows['rendered_responses']['hits'], rows['rendered_responses']['misses']) == (1, 1)
+        assert rows['dropdown_options']['misses'] == 2  # field list and the material partition
+        assert rows['dropdown_options']['recompute_p50_ms'] is not None
+
+    def test_command(self):
+        """Test the cache_stats command output and reset"""
+        cache_metrics.record('test_command', hits=3, misses=1)
+        cache_metrics.record_recompute('test_command', 0.004)
+        out = StringIO()
+
+        call_command('cache_stats', '--reset', stdout=out)
+
+        assert 'test_command' in out.getvalue()
+        assert '75.0%' in out.getvalue()
+        assert cache_metrics.report() == []
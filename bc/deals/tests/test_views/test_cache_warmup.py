@@ -0,0 +1,105 @@
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.throttling import UserRateThrottle
+from bc.schema import CachedSchemaGenerator
+from deals import response_cache
+from deals.services import cache_warmup, dropdown_cache
+from deals.tests.factories import DropdownOptionFactory, AdditionalClauseFactory
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(settings):
+    settings.CACHE_WARMUP_HOSTS = ['testserver']
+    settings.CACHE_WARMUP_ACCEPT = 'application/json'
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+    response_cache.rendered_responses.local.clear()
+    CachedSchemaGenerator.schemas.clear()
+    yield
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+    response_cache.rendered_responses.local.clear()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestWarmCaches:
+    """Test cases for the warm_caches command"""
+
+    def test_requests_after_warmup_hit(self, api_client, authenticated_user, monkeypatch):
+        """Test that reference responses are served from the cache after warming"""
+        DropdownOptionFactory(field_name='material', option_values={'value': 'akzhal'})
+        AdditionalClauseFactory()
+        call_command('warm_caches')
+
+        renders = []
+        render = JSONRenderer.render
+        monkeypatch.setattr(
+            JSONRenderer, 'render', lambda self, *args, **kwargs: renders.append(1) or render(self, *args, **kwargs)
+        )
+        for name in ('deals:dropdown', 'deals:additional-clauses', 'deals:deal-stats'):
+            response = api_client.get(reverse(name), HTTP_ACCEPT='application/json')
+            assert response.status_code == 200
+
+        assert renders == []
+        assert len(CachedSchemaGenerator.schemas._entries) == 1
+
+    def test_warmup_ignores_throttling(self, monkeypatch):
+        """Test that warm-up requests are not throttled"""
+        monkeypatch.setattr(UserRateThrottle, 'allow_request', lambda self, request, view: False)
+
+        results = cache_warmup.warm(['deal_stats'])
+
+        assert results['deal_stats'][1] is None
+
+    def test_failure_reported_after_others_ran(self, monkeypatch):
+        """Test that one failing warmer fails the command without stopping the rest"""
+        def broken():
+            raise RuntimeError('boom')
+
+        monkeypatch.setitem(cache_warmup.WARMERS, 'schema', broken)
+
+        with pytest.raises(CommandError, match='schema'):
+            call_command('warm_caches')
+        assert cache.get(dropdown_cache.options_cache.fresh_key(dropdown_cache.FIELDS_CACHE_KEY)) is not None
+
+    def test_warm_on_start_never_raises(self, settings, monkeypatch):
+        """Test that the deploy hook respects the setting and swallows errors"""
+        calls = []
+        monkeypatch.setattr(cache_warmup, 'warm', lambda **kwargs: calls.append(1) or 1 / 0)
+
+        settings.CACHE_WARMUP_ON_START = False
+        cache_warmup.warm_on_start('test')
+        settings.CACHE_WARMUP_ON_START = True
+        cache_warmup.warm_on_start('test')
+
+        assert calls == [1]
+
+    def test_shared_caches_warmed_once_per_deploy(self, monkeypatch):
+        """Test that only the first worker to start warms Redis and the rest warm their own process"""
+        calls = []
+        monkeypatch.setattr(cache_warmup, 'warm', lambda **kwargs: calls.append(kwargs))
+
+        for _ in range(4):
+            cache_warmup.warm_on_start('gunicorn worker')
+
+        assert calls == [{}] + [{'local': True}] * 3
+
+    def test_local_warmup_skips_shared_payloads(self, monkeypatch):
+        """Test that a process-local warm-up fills L1 and the schema without rendering responses"""
+        DropdownOptionFactory(field_name='material', option_values={'value': 'akzhal'})
+        cache_warmup.warm(['dropdown_options'])
+        dropdown_cache.options_cache.clear_local()
+        response_cache.rendered_responses.local.clear()
+        renders = []
+        monkeypatch.setattr(response_cache.RenderedResponseCache, 'respond', lambda *args: renders.append(1))
+
+        results = cache_warmup.warm(local=True)
+
+        assert all(error is None for _, error, _ in results.values())
+        assert renders == []
+        assert dropdown_cache.options_cache.local.get(dropdown_cache.FIELDS_CACHE_KEY) is not None
+        assert len(CachedSchemaGenerator.schemas._entries) == 1
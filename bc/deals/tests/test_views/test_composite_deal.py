@@ -0,0 +1,82 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from deals.models import (
+    BusinessConfirmationDeal, CommercialTerms, NewBusinessConfirmation, PaymentTerms
+)
+
+
+@pytest.fixture
+def document():
+    return {
+        'new_business_confirmation': {
+            'seller': 'Seller Ltd', 'buyer': 'Buyer Inc', 'material': 'Copper ore', 'quantity': '1000.50'
+        },
+        'commercial_terms': {
+            'delivery_term': 'FOB', 'transport_mode': 'Ship', 'treatment_charge': '50.00',
+            'shipment_start_date': '2025-01-01', 'shipment_end_date': '2025-02-01'
+        },
+        'payment_terms': {'currency': 'USD', 'payment_method': 'Cash', 'prepayment_percentage': '30.00'},
+    }
+
+
+@pytest.mark.django_db
+class TestCompositeDealCreate:
+    """Test cases for creating a deal and its parts in one request"""
+
+    def test_creates_all_four_rows(self, api_client, authenticated_user, document, django_assert_max_num_queries):
+        """Test that one request inserts every part and returns the nested deal"""
+        url = reverse('deals:business-confirmation-deals-composite')
+
+        with django_assert_max_num_queries(7):  # SAVEPOINT, 4 INSERTs, deal stats upsert, RELEASE
+            response = api_client.post(url, document, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['status'] == BusinessConfirmationDeal.DRAFT
+        assert response.data['user'] == authenticated_user.id
+        assert response.data['new_business_confirmation']['material'] == 'Copper ore'
+        assert response.data['commercial_terms']['delivery_term'] == 'FOB'
+        assert response.data['payment_terms']['currency'] == 'USD'
+
+        deal = BusinessConfirmationDeal.objects.get(id=response.data['id'])
+        assert deal.new_business_confirmation_id == response.data['new_business_confirmation']['id']
+        assert deal.commercial_terms_id == response.data['commercial_terms']['id']
+        assert deal.payment_terms_id == response.data['payment_terms']['id']
+
+    def test_invalid_part_creates_nothing(self, api_client, authenticated_user, document):
+        """Test that errors in one part are reported under that part and nothing is saved"""
+        document['payment_terms']['prepayment_percentage'] = 'abc'
+        document['commercial_terms']['treatment_charge'] = 'xyz'
+
+        response = api_client.post(reverse('deals:business-confirmation-deals-composite'), document, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'prepayment_percentage' in response.data['payment_terms']
+        assert 'treatment_charge' in response.data['commercial_terms']
+        assert NewBusinessConfirmation.objects.count() == 0
+        assert CommercialTerms.objects.count() == 0
+        assert PaymentTerms.objects.count() == 0
+
+    def test_missing_part(self, api_client, authenticated_user, document):
+        """Test that every part is required"""
+        del document['commercial_terms']
+
+        response = api_client.post(reverse('deals:business-confirmation-deals-composite'), document, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'commercial_terms' in response.data
+        assert BusinessConfirmationDeal.objects.count() == 0
+
+    def test_database_error_rolls_back(self, api_client, authenticated_user, document, monkeypatch):
+        """Test that a failure on the last insert leaves no orphaned parts"""
+        def fail(*args, **kwargs):
+            raise RuntimeError("insert failed")
+        monkeypatch.setattr(BusinessConfirmationDeal.objects, 'create', fail)
+        api_client.raise_request_exception = False
+
+        response = api_client.post(reverse('deals:business-confirmation-deals-composite'), document, format='json')
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert NewBusinessConfirmation.objects.count() == 0
+        assert CommercialTerms.objects.count() == 0
+        assert PaymentTerms.objects.count() == 0
@@ -0,0 +1,154 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from deals.models import TaskStatus
+from deals.tests.factories import (
+    AdditionalClauseFactory, CommercialTermsFactory,
+    DropdownOptionFactory, BusinessConfirmationDealFactory
+)
+
+
+@pytest.mark.django_db
+class TestConditionalListGet:
+    """Test ETag / Last-Modified on list endpoints"""
+
+    def test_if_none_match_returns_304_without_queries(self, api_client, authenticated_user):
+        """Test that a matching ETag is answered from the table version alone"""
+        AdditionalClauseFactory.create_batch(3)
+        url = reverse('deals:additional-clauses')
+        first = api_client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+        assert first['ETag']
+        assert first['Last-Modified']
+
+        with CaptureQueriesContext(connection) as queries:
+            second = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second.content == b''
+        assert second['ETag'] == first['ETag']
+        assert len(queries.captured_queries) == 0
+
+    def test_if_modified_since(self, api_client, authenticated_user):
+        """Test that Last-Modified is honored on its own"""
+        AdditionalClauseFactory()
+        url = reverse('deals:additional-clauses')
+        first = api_client.get(url)
+
+        second = api_client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_update_and_delete_change_etag(self, api_client, authenticated_user, django_capture_on_commit_callbacks):
+        """Test that edits and deletions invalidate the ETag"""
+        clauses = AdditionalClauseFactory.create_batch(2)
+        url = reverse('deals:additional-clauses')
+        etag = api_client.get(url)['ETag']
+
+        clauses[0].clause = 'Amended'
+        clauses[0].save()
+        updated = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert updated.status_code == status.HTTP_200_OK
+        assert updated['ETag'] != etag
+
+        with django_capture_on_commit_callbacks(execute=True):
+            clauses[1].delete()
+        deleted = api_client.get(url, HTTP_IF_NONE_MATCH=updated['ETag'])
+        assert deleted.status_code == status.HTTP_200_OK
+        assert len(deleted.data) == 1
+
+    def test_etag_varies_with_query(self, api_client, authenticated_user):
+        """Test that fields, pages and filters get their own ETag"""
+        CommercialTermsFactory.create_batch(3)
+        url = reverse('deals:commercial-terms')
+        etag = api_client.get(url)['ETag']
+
+        sparse = api_client.get(url, {'fields': 'id'}, HTTP_IF_NONE_MATCH=etag)
+        paged = api_client.get(url, {'page_size': 1}, HTTP_IF_NONE_MATCH=etag)
+
+        assert sparse.status_code == status.HTTP_200_OK
+        assert paged.status_code == status.HTTP_200_OK
+        assert len({etag, sparse['ETag'], paged['ETag']}) == 3
+
+    def test_expanded_relation_change_invalidates_deal_list(self, api_client, authenticated_user):
+        """Test that nested terms count towards the deal list ETag"""
+        deal = BusinessConfirmationDealFactory(user=authenticated_user)
+        url = reverse('deals:business-confirmation-deals')
+        etag = api_client.get(url, {'expand': 'commercial_terms'})['ETag']
+
+        deal.commercial_terms.delivery_point = 'Rotterdam'
+        deal.commercial_terms.save()
+        response = api_client.get(url, {'expand': 'commercial_terms'}, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]['commercial_terms']['delivery_point'] == 'Rotterdam'
+
+    def test_filtered_relation_change_invalidates_deal_list(self, api_client, authenticated_user):
+        """Test that models joined by filters count towards the deal list ETag"""
+        deal = BusinessConfirmationDealFactory(user=authenticated_user)
+        deal.new_business_confirmation.material = 'Akzhal'
+        deal.new_business_confirmation.save()
+        url = reverse('deals:business-confirmation-deals')
+        first = api_client.get(url, {'material': 'Akzhal'})
+        assert len(first.data) == 1
+
+        deal.new_business_confirmation.material = 'Copper ore'
+        deal.new_business_confirmation.save()
+        response = api_client.get(url, {'material': 'Akzhal'}, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
+
+
+@pytest.mark.django_db
+class TestConditionalDetailGet:
+    """Test ETag support on single-object and reference endpoints"""
+
+    def test_dropdowns_use_table_version(self, api_client, authenticated_user):
+        """Test that saving a dropdown option bumps the dropdown ETag"""
+        DropdownOptionFactory()
+        url = reverse('deals:dropdown')
+        etag = api_client.get(url)['ETag']
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+        DropdownOptionFactory()
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_deal_detail(self, api_client, authenticated_user):
+        """Test 304 on the deal detail endpoint and no ETag on 404"""
+        deal = BusinessConfirmationDealFactory(user=authenticated_user)
+        url = reverse('deals:business-confirmation-deal-detail', kwargs={'deal_id': deal.id})
+        etag = api_client.get(url)['ETag']
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+        deal.payment_terms.currency = 'CHF'
+        deal.payment_terms.save()
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+        missing = api_client.get(
+            reverse('deals:business-confirmation-deal-detail', kwargs={'deal_id': '00000000-0000-0000-0000-000000000000'})
+        )
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+        assert not missing.has_header('ETag')
+
+    def test_task_status(self, api_client, authenticated_user):
+        """Test 304 on the task status endpoint"""
+        deal = BusinessConfirmationDealFactory(user=authenticated_user)
+        task_status = TaskStatus.objects.create(deal=deal, status=TaskStatus.PENDING)
+        url = reverse('deals:task-status', kwargs={'task_status_id': task_status.id})
+        etag = api_client.get(url)['ETag']
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_export(self, api_client, authenticated_user):
+        """Test 304 on the streaming export"""
+        BusinessConfirmationDealFactory(user=authenticated_user)
+        url = reverse('deals:business-confirmation-deals-export')
+        response = api_client.get(url)
+        b''.join(response.streaming_content)
+
+        repeat = api_client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        assert repeat.status_code == status.HTTP_304_NOT_MODIFIED
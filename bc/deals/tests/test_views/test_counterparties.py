@@ -0,0 +1,123 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from deals.caching import LocalCache
+from deals.services.counterparties import prefix_cache
+from deals.tests.factories import NewBusinessConfirmationFactory
+
+
+@pytest.fixture(autouse=True)
+def empty_prefix_cache():
+    prefix_cache.clear()
+    yield
+    prefix_cache.clear()
+
+
+@pytest.mark.django_db
+class TestCounterpartyTypeahead:
+    """Test cases for the buyer/seller typeahead"""
+
+    def test_prefix_matches_rank_first_then_by_usage(self, api_client, authenticated_user):
+        """Test ordering: prefix matches, then confirmation count, then name"""
+        NewBusinessConfirmationFactory.create_batch(3, buyer='Trafigura', seller='Open Mineral')
+        NewBusinessConfirmationFactory(buyer='Transamine', seller='Open Mineral')
+        NewBusinessConfirmationFactory.create_batch(5, buyer='Glencore Trading', seller='Open Mineral')
+
+        response = api_client.get(reverse('deals:counterparties'), {'q': 'tra', 'role': 'buyer'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'] == [
+            {'name': 'Trafigura', 'role': 'buyer', 'confirmations': 3},
+            {'name': 'Transamine', 'role': 'buyer', 'confirmations': 1},
+            {'name': 'Glencore Trading', 'role': 'buyer', 'confirmations': 5},
+        ]
+
+    def test_both_roles_and_case_insensitive(self, api_client, authenticated_user):
+        """Test that buyers and sellers are both suggested regardless of case"""
+        NewBusinessConfirmationFactory(buyer='Mercuria', seller='MERCURY Metals')
+
+        response = api_client.get(reverse('deals:counterparties'), {'q': 'merc'})
+
+        assert {(row['name'], row['role']) for row in response.data['results']} == {
+            ('Mercuria', 'buyer'), ('MERCURY Metals', 'seller')
+        }
+
+    def test_like_wildcards_are_literal(self, api_client, authenticated_user):
+        """Test that % and _ in the typed text do not act as wildcards"""
+        NewBusinessConfirmationFactory(buyer='Alpha', seller='Beta')
+
+        response = api_client.get(reverse('deals:counterparties'), {'q': '%'})
+
+        assert response.data['results'] == []
+
+    def test_hot_prefixes_served_from_memory(self, api_client, authenticated_user):
+        """Test that short prefixes hit the in-process cache on repeat"""
+        NewBusinessConfirmationFactory(buyer='Gunvor', seller='Open Mineral')
+        url = reverse('deals:counterparties')
+        api_client.get(url, {'q': 'gu'})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {'q': 'GU'})
+
+        assert response.data['results'][0]['name'] == 'Gunvor'
+        assert len(queries.captured_queries) == 0
+        assert prefix_cache.hits == 1
+
+    def test_long_prefixes_not_cached(self, api_client, authenticated_user, settings):
+        """Test that selective prefixes go to the index every time"""
+        settings.COUNTERPARTY_HOT_PREFIX_LENGTH = 2
+        NewBusinessConfirmationFactory(buyer='Gunvor', seller='Open Mineral')
+
+        api_client.get(reverse('deals:counterparties'), {'q': 'gunv'})
+
+        assert prefix_cache.get((('buyer', 'seller'), 'GUNV', 10)) is None
+
+    def test_validation(self, api_client, authenticated_user):
+        """Test that q is required and role is checked"""
+        url = reverse('deals:counterparties')
+        assert api_client.get(url).status_code == status.HTTP_400_BAD_REQUEST
+        assert api_client.get(url, {'q': 'a', 'role': 'broker'}).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_admin_search_uses_indexed_expression(self, authenticated_user):
+        """Test that admin search compares UPPER(buyer), the trigram index expression"""
+        from django.contrib.admin.sites import site
+        from django.test import RequestFactory
+        from deals.models import NewBusinessConfirmation
+
+        model_admin = site._registry[NewBusinessConfirmation]
+        request = RequestFactory().get('/')
+        queryset, _ = model_admin.get_search_results(request, NewBusinessConfirmation.objects.all(), 'glen')
+
+        assert 'UPPER("deals_newbusinessconfirmation"."buyer"::text) LIKE UPPER(' in str(queryset.query)
+
+
+class TestLocalCache:
+    """Test cases for the in-process LRU cache"""
+
+    def test_evicts_least_recently_used(self):
+        """Test LRU eviction once max_entries is exceeded"""
+        cache = LocalCache(max_entries=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+
+    def test_entries_expire(self):
+        """Test that entries older than ttl are dropped"""
+        cache = LocalCache(max_entries=2, ttl=-1)
+        cache.set('a', 1)
+
+        assert cache.get('a') is None
+
+    def test_no_ttl_keeps_entries(self):
+        """Test that entries without a ttl only leave by eviction"""
+        cache = LocalCache(max_entries=1)
+        cache.set('a', 1)
+
+        assert cache.get('a') == 1
@@ -0,0 +1,89 @@
+import uuid
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from deals.tests.factories import BusinessConfirmationDealFactory
+
+
+@pytest.mark.django_db
+class TestDealExpand:
+    """Test cases for ?expand= on the deal list and the deal detail endpoint"""
+
+    def test_list_without_expand_returns_ids(self, api_client, authenticated_user):
+        """Test that relations stay as primary keys by default"""
+        deal = BusinessConfirmationDealFactory()
+
+        response = api_client.get(reverse('deals:business-confirmation-deals'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]['commercial_terms'] == deal.commercial_terms_id
+
+    def test_list_expand_nests_relations(self, api_client, authenticated_user):
+        """Test that expanded relations are rendered as nested objects"""
+        deal = BusinessConfirmationDealFactory()
+
+        response = api_client.get(
+            reverse('deals:business-confirmation-deals'),
+            {'expand': 'new_business_confirmation,payment_terms'}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        row = response.data[0]
+        assert row['new_business_confirmation']['material'] == deal.new_business_confirmation.material
+        assert row['payment_terms']['id'] == deal.payment_terms_id
+        assert row['commercial_terms'] == deal.commercial_terms_id
+
+    @pytest.mark.parametrize('deal_count', [1, 10])
+    def test_list_expand_query_count_is_constant(
+        self, api_client, authenticated_user, django_assert_num_queries, deal_count
+    ):
+        """Test that expanding every relation costs one query regardless of page size"""
+        BusinessConfirmationDealFactory.create_batch(deal_count)
+
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse('deals:business-confirmation-deals'), {'expand': 'all'})
+
+        assert len(response.data) == deal_count
+        assert all(isinstance(row['commercial_terms'], dict) for row in response.data)
+
+    def test_paginated_expand_query_count(self, api_client, authenticated_user, django_assert_num_queries):
+        """Test that a paginated expanded page costs one query"""
+        BusinessConfirmationDealFactory.create_batch(5)
+
+        with django_assert_num_queries(1):
+            response = api_client.get(
+                reverse('deals:business-confirmation-deals'),
+                {'expand': 'all', 'page_size': 3}
+            )
+
+        assert len(response.data['results']) == 3
+
+    def test_list_expand_unknown_field(self, api_client, authenticated_user):
+        """Test that unknown relation names are rejected"""
+        response = api_client.get(reverse('deals:business-confirmation-deals'), {'expand': 'user'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'expand' in response.data
+
+    def test_detail_nests_relations(self, api_client, authenticated_user, django_assert_num_queries):
+        """Test that the detail endpoint returns the deal graph in one query"""
+        deal = BusinessConfirmationDealFactory()
+        url = reverse('deals:business-confirmation-deal-detail', kwargs={'deal_id': deal.id})
+
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['id'] == str(deal.id)
+        assert response.data['new_business_confirmation']['id'] == deal.new_business_confirmation_id
+        assert response.data['commercial_terms']['delivery_term'] == deal.commercial_terms.delivery_term
+        assert response.data['payment_terms']['currency'] == deal.payment_terms.currency
+
+    def test_detail_not_found(self, api_client, authenticated_user):
+        """Test GET request for a non-existent deal"""
+        url = reverse('deals:business-confirmation-deal-detail', kwargs={'deal_id': uuid.uuid4()})
+
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
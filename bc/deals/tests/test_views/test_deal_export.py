@@ -0,0 +1,106 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from deals.models import BusinessConfirmationDeal
+from deals.tests.factories import BusinessConfirmationDealFactory
+
+
+def read_body(response):
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+class TestDealExportAPI:
+    """Test cases for the streaming deal export endpoint"""
+
+    url = reverse('deals:business-confirmation-deals-export')
+
+    def test_ndjson_export(self, api_client, authenticated_user):
+        """Test that every deal is written as one JSON line with nested terms"""
+        deals = BusinessConfirmationDealFactory.create_batch(3)
+
+        response = api_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'] == 'application/x-ndjson'
+        rows = [json.loads(line) for line in read_body(response).decode().splitlines()]
+        assert [row['id'] for row in rows] == [str(deal.id) for deal in deals]
+        assert rows[0]['commercial_terms']['delivery_term'] == deals[0].commercial_terms.delivery_term
+        assert rows[0]['payment_terms']['currency'] == deals[0].payment_terms.currency
+
+    def test_csv_export(self, api_client, authenticated_user):
+        """Test that CSV output flattens nested terms into dotted columns"""
+        deal = BusinessConfirmationDealFactory()
+
+        response = api_client.get(self.url, {'export_format': 'csv'})
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = list(csv.DictReader(io.StringIO(read_body(response).decode())))
+        assert len(rows) == 1
+        assert rows[0]['id'] == str(deal.id)
+        assert rows[0]['new_business_confirmation.material'] == deal.new_business_confirmation.material
+        assert rows[0]['commercial_terms.clauses'] == '[]'
+
+    def test_gzip_export(self, api_client, authenticated_user):
+        """Test that gzip output decompresses to the plain export"""
+        BusinessConfirmationDealFactory.create_batch(2)
+
+        response = api_client.get(self.url, {'gzip': 'true'})
+
+        assert response['Content-Type'] == 'application/gzip'
+        assert 'deals.ndjson.gz' in response['Content-Disposition']
+        lines = gzip.decompress(read_body(response)).decode().splitlines()
+        assert len(lines) == 2
+
+    def test_export_applies_filters(self, api_client, authenticated_user):
+        """Test that deal list filters also narrow the export"""
+        draft = BusinessConfirmationDealFactory(status=BusinessConfirmationDeal.DRAFT)
+        BusinessConfirmationDealFactory(status=BusinessConfirmationDeal.COMPLETED)
+
+        response = api_client.get(self.url, {'status': 'draft'})
+
+        rows = [json.loads(line) for line in read_body(response).decode().splitlines()]
+        assert [row['id'] for row in rows] == [str(draft.id)]
+
+    def test_export_reads_in_chunks(self, api_client, authenticated_user, settings):
+        """Test that rows are fetched through a cursor without per-row queries"""
+        settings.DEAL_EXPORT_CHUNK_SIZE = 2
+        BusinessConfirmationDealFactory.create_batch(5)
+
+        response = api_client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            body = read_body(response)
+
+        assert len(body.decode().splitlines()) == 5
+        assert len(queries.captured_queries) <= 1
+
+    def test_invalid_export_format(self, api_client, authenticated_user):
+        """Test that unknown formats are rejected"""
+        response = api_client.get(self.url, {'export_format': 'xlsx'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestExportDealsCommand:
+    """Test cases for the export_deals management command"""
+
+    def test_command_writes_file(self, tmp_path):
+        """Test that the command streams the export to a file"""
+        BusinessConfirmationDealFactory.create_batch(3)
+        output = tmp_path / 'deals.csv.gz'
+
+        call_command('export_deals', '--format', 'csv', '--gzip', '--output', str(output), '--chunk-size', '2',
+                     stderr=io.StringIO())
+
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(output.read_bytes()).decode())))
+        assert len(rows) == 3
@@ -0,0 +1,120 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from deals.models import BusinessConfirmationDeal
+from deals.tests.factories import (
+    NewBusinessConfirmationFactory,
+    CommercialTermsFactory, BusinessConfirmationDealFactory
+)
+
+
+def deal_ids(response):
+    rows = response.data['results'] if isinstance(response.data, dict) else response.data
+    return {row['id'] for row in rows}
+
+
+@pytest.mark.django_db
+class TestDealFilters:
+    """Test cases for filtering and ordering the deal list"""
+
+    url = reverse('deals:business-confirmation-deals')
+
+    def test_filter_by_status(self, api_client, authenticated_user):
+        """Test filtering by one or several statuses"""
+        draft = BusinessConfirmationDealFactory(status=BusinessConfirmationDeal.DRAFT)
+        submitted = BusinessConfirmationDealFactory(status=BusinessConfirmationDeal.SUBMITTED)
+        BusinessConfirmationDealFactory(status=BusinessConfirmationDeal.COMPLETED)
+
+        response = api_client.get(self.url, {'status': 'draft'})
+        assert deal_ids(response) == {str(draft.id)}
+
+        response = api_client.get(self.url, {'status': 'draft,submitted'})
+        assert deal_ids(response) == {str(draft.id), str(submitted.id)}
+
+    def test_filter_by_invalid_status(self, api_client, authenticated_user):
+        """Test that unknown statuses are rejected"""
+        response = api_client.get(self.url, {'status': 'archived'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'status' in response.data
+
+    def test_filter_by_user(self, api_client, authenticated_user):
+        """Test filtering by deal owner"""
+        mine = BusinessConfirmationDealFactory(user=authenticated_user)
+        BusinessConfirmationDealFactory()
+
+        response = api_client.get(self.url, {'user': authenticated_user.id})
+
+        assert deal_ids(response) == {str(mine.id)}
+
+    def test_filter_by_created_range(self, api_client, authenticated_user):
+        """Test filtering by created_at range"""
+        old = BusinessConfirmationDealFactory()
+        new = BusinessConfirmationDealFactory()
+        now = timezone.now()
+        BusinessConfirmationDeal.objects.filter(id=old.id).update(created_at=now - timedelta(days=10))
+
+        response = api_client.get(self.url, {'created_after': (now - timedelta(days=1)).isoformat()})
+        assert deal_ids(response) == {str(new.id)}
+
+        response = api_client.get(self.url, {'created_before': (now - timedelta(days=1)).isoformat()})
+        assert deal_ids(response) == {str(old.id)}
+
+    def test_filter_by_confirmation_and_terms(self, api_client, authenticated_user):
+        """Test filtering by material, buyer, seller and delivery term"""
+        match = BusinessConfirmationDealFactory(
+            new_business_confirmation=NewBusinessConfirmationFactory(
+                material='Akzhal', buyer='Buyer A', seller='Seller A'
+            ),
+            commercial_terms=CommercialTermsFactory(delivery_term='FOB'),
+        )
+        BusinessConfirmationDealFactory(
+            new_business_confirmation=NewBusinessConfirmationFactory(
+                material='Akzhal', buyer='Buyer B', seller='Seller A'
+            ),
+            commercial_terms=CommercialTermsFactory(delivery_term='DAP'),
+        )
+
+        response = api_client.get(self.url, {
+            'material': 'Akzhal', 'buyer': 'Buyer A', 'seller': 'Seller A', 'delivery_term': 'FOB'
+        })
+
+        assert deal_ids(response) == {str(match.id)}
+
+    def test_ordering(self, api_client, authenticated_user):
+        """Test ordering by an allow-listed field"""
+        first = BusinessConfirmationDealFactory(status=BusinessConfirmationDeal.SUBMITTED)
+        second = BusinessConfirmationDealFactory(status=BusinessConfirmationDeal.DRAFT)
+
+        response = api_client.get(self.url, {'ordering': 'status'})
+        assert [row['id'] for row in response.data] == [str(second.id), str(first.id)]
+
+        response = api_client.get(self.url, {'ordering': '-created_at'})
+        assert [row['id'] for row in response.data] == [str(second.id), str(first.id)]
+
+    def test_ordering_not_allowed(self, api_client, authenticated_user):
+        """Test that ordering by a non allow-listed field is rejected"""
+        response = api_client.get(self.url, {'ordering': 'payment_terms__surveyor_notes'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'ordering' in response.data
+
+    def test_paginated_ordering_by_updated_at(self, api_client, authenticated_user):
+        """Test that cursor pages follow the requested ordering"""
+        deals = BusinessConfirmationDealFactory.create_batch(5, status=BusinessConfirmationDeal.DRAFT)
+        now = timezone.now()
+        for offset, deal in enumerate(deals):
+            BusinessConfirmationDeal.objects.filter(id=deal.id).update(updated_at=now - timedelta(minutes=offset))
+
+        ids = []
+        response = api_client.get(self.url, {'ordering': 'updated_at', 'page_size': 2, 'status': 'draft'})
+        while True:
+            ids.extend(row['id'] for row in response.data['results'])
+            if response.data['next'] is None:
+                break
+            response = api_client.get(response.data['next'])
+
+        assert ids == [str(deal.id) for deal in reversed(deals)]
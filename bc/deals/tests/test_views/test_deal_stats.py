@@ -0,0 +1,177 @@
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from deals.models import BusinessConfirmationDeal, DealStatsBucket
+from deals.services import deal_stats
+from deals.tests.factories import (
+    BusinessConfirmationDealFactory, NewBusinessConfirmationFactory
+)
+
+
+def _buckets():
+    return {
+        (bucket.status, bucket.material): (bucket.deal_count, bucket.total_quantity)
+        for bucket in DealStatsBucket.objects.filter(deal_count__gt=0)
+    }
+
+
+def _deal(status, material, quantity):
+    return BusinessConfirmationDealFactory(
+        status=status,
+        new_business_confirmation=NewBusinessConfirmationFactory(material=material, quantity=Decimal(quantity)),
+    )
+
+
+@pytest.mark.django_db
+class TestDealStatsRollup:
+    """Test cases for incremental maintenance of the deal stats rollup"""
+
+    def test_create_and_status_change(self):
+        """Test that deals are counted on create and moved on status change"""
+        first = _deal('draft', 'Copper ore', '100.00')
+        _deal('draft', 'Copper ore', '50.50')
+        _deal('draft', 'Akzhal', '10.00')
+
+        first.status = BusinessConfirmationDeal.SUBMITTED
+        first.save()
+
+        assert _buckets() == {
+            ('draft', 'Copper ore'): (1, Decimal('50.50')),
+            ('submitted', 'Copper ore'): (1, Decimal('100.00')),
+            ('draft', 'Akzhal'): (1, Decimal('10.00')),
+        }
+
+    def test_save_without_status_change_is_free(self):
+        """Test that saving an unchanged status does not touch the rollup"""
+        deal = _deal('draft', 'Copper ore', '100.00')
+        deal.refresh_from_db()
+
+        with CaptureQueriesContext(connection) as queries:
+            deal.save(update_fields=['updated_at'])
+
+        assert len(queries.captured_queries) == 1
+        assert _buckets() == {('draft', 'Copper ore'): (1, Decimal('100.00'))}
+
+    def test_delete(self):
+        """Test that deleted deals leave their bucket"""
+        deal = _deal('draft', 'Copper ore', '100.00')
+        deal.delete()
+
+        assert _buckets() == {}
+
+    def test_month_bucket(self):
+        """Test that deals are bucketed by the month they were created in"""
+        deal = _deal('draft', 'Copper ore', '100.00')
+
+        bucket = DealStatsBucket.objects.get()
+        assert bucket.month == timezone.localtime(deal.created_at).date().replace(day=1)
+
+    def test_confirmation_change_moves_deal(self):
+        """Test that pointing a deal at another confirmation moves it to that material's bucket"""
+        deal = _deal('draft', 'Copper ore', '100.00')
+        deal.new_business_confirmation = NewBusinessConfirmationFactory(material='Akzhal', quantity=Decimal('10.00'))
+        deal.save()
+        assert _buckets() == {('draft', 'Akzhal'): (1, Decimal('10.00'))}
+
+        deal.status = BusinessConfirmationDeal.SUBMITTED
+        deal.save()
+        assert _buckets() == {('submitted', 'Akzhal'): (1, Decimal('10.00'))}
+        deal_stats.reconcile()
+        assert _buckets() == {('submitted', 'Akzhal'): (1, Decimal('10.00'))}
+
+    def test_confirmation_edit_moves_its_deal(self):
+        """Test that editing a confirmation's material or quantity moves its deal"""
+        deal = _deal('draft', 'Copper ore', '100.00')
+        _deal('draft', 'Copper ore', '5.00')
+
+        confirmation = deal.new_business_confirmation
+        confirmation.material = 'Akzhal'
+        confirmation.quantity = Decimal('40.00')
+        confirmation.save()
+        assert _buckets() == {
+            ('draft', 'Copper ore'): (1, Decimal('5.00')),
+            ('draft', 'Akzhal'): (1, Decimal('40.00')),
+        }
+
+        deal.refresh_from_db()
+        deal.status = BusinessConfirmationDeal.SUBMITTED
+        deal.save()
+        expected = {
+            ('draft', 'Copper ore'): (1, Decimal('5.00')),
+            ('submitted', 'Akzhal'): (1, Decimal('40.00')),
+        }
+        assert _buckets() == expected
+        deal_stats.reconcile()
+        assert _buckets() == expected
+
+    def test_reconcile_corrects_drift(self):
+        """Test that reconciliation repairs writes that bypassed signals"""
+        deal = _deal('draft', 'Copper ore', '100.00')
+        _deal('completed', 'Akzhal', '10.00')
+        BusinessConfirmationDeal.objects.filter(pk=deal.pk).update(status=BusinessConfirmationDeal.CANCELLED)
+        expected = {
+            ('cancelled', 'Copper ore'): (1, Decimal('100.00')),
+            ('completed', 'Akzhal'): (1, Decimal('10.00')),
+        }
+
+        assert _buckets() != expected
+        assert deal_stats.reconcile() == 2
+        assert _buckets() == expected
+        assert deal_stats.reconcile() == 0
+
+
+@pytest.mark.django_db
+class TestDealStatsView:
+    """Test cases for the deal stats endpoint"""
+
+    def test_grouping_and_filters(self, api_client, authenticated_user):
+        """Test group_by and filters over the rollup"""
+        _deal('draft', 'Copper ore', '100.00')
+        _deal('completed', 'Copper ore', '50.00')
+        _deal('completed', 'Akzhal', '10.00')
+        url = reverse('deals:deal-stats')
+
+        response = api_client.get(url, {'group_by': 'material'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'] == [
+            {'material': 'Akzhal', 'deal_count': 1, 'total_quantity': Decimal('10.00')},
+            {'material': 'Copper ore', 'deal_count': 2, 'total_quantity': Decimal('150.00')},
+        ]
+
+        response = api_client.get(url, {'group_by': 'status,month', 'status': 'completed'})
+        month = f"{timezone.localtime():%Y-%m}"
+        assert response.data['results'] == [
+            {'status': 'completed', 'month': month, 'deal_count': 2, 'total_quantity': Decimal('60.00')},
+        ]
+
+    def test_reads_buckets_not_deals(self, api_client, authenticated_user):
+        """Test that the endpoint queries only the rollup table"""
+        for _ in range(5):
+            _deal('draft', 'Copper ore', '1.00')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(reverse('deals:deal-stats'))
+
+        assert response.data['results'][0]['deal_count'] == 5
+        assert all('deals_businessconfirmationdeal' not in query['sql'] for query in queries.captured_queries)
+
+    def test_conditional_get(self, api_client, authenticated_user):
+        """Test that the ETag changes when the rollup does"""
+        _deal('draft', 'Copper ore', '1.00')
+        url = reverse('deals:deal-stats')
+        etag = api_client.get(url)['ETag']
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+        _deal('draft', 'Copper ore', '1.00')
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_validation(self, api_client, authenticated_user):
+        """Test that group_by and months are checked"""
+        url = reverse('deals:deal-stats')
+        assert api_client.get(url, {'group_by': 'buyer'}).status_code == status.HTTP_400_BAD_REQUEST
+        assert api_client.get(url, {'month_from': '2025-13'}).status_code == status.HTTP_400_BAD_REQUEST
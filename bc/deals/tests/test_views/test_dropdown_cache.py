@@ -0,0 +1,244 @@
+import threading
+import time
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from deals import caching
+from deals.caching import SingleFlightCache, TieredCache
+from deals.models import DropdownOption
+from deals.services import dropdown_cache
+from deals.tests.factories import DropdownOptionFactory
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+    yield
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+
+
+def _fresh(key):
+    return cache.get(dropdown_cache.options_cache.fresh_key(key)) is not None
+
+
+def _options(field_name, *values):
+    return [
+        DropdownOptionFactory(field_name=field_name, option_values={'value': value}, display_order=order)
+        for order, value in enumerate(values)
+    ]
+
+
+@pytest.mark.django_db
+class TestDropdownPartitions:
+    """Test cases for the per-field dropdown cache"""
+
+    def test_field_name_filter(self, api_client, authenticated_user):
+        """Test that ?field_name= returns only the requested fields"""
+        _options('material', 'akzhal', 'lead')
+        _options('packaging', 'bulk')
+        _options('transport_mode', 'rail')
+        url = reverse('deals:dropdown')
+
+        response = api_client.get(url, {'field_name': 'material'})
+        assert response.status_code == status.HTTP_200_OK
+        assert [row['option_values']['value'] for row in response.data] == ['akzhal', 'lead']
+
+        response = api_client.get(url, {'field_name': 'transport_mode,packaging'})
+        assert [row['field_name'] for row in response.data] == ['packaging', 'transport_mode']
+
+    def test_all_fields_assembled_from_partitions(self, api_client, authenticated_user):
+        """Test that the full response reuses partitions cached by filtered requests"""
+        _options('material', 'akzhal')
+        _options('packaging', 'bulk')
+        url = reverse('deals:dropdown')
+        api_client.get(url, {'field_name': 'material'})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url)
+
+        assert [row['field_name'] for row in response.data] == ['material', 'packaging']
+        option_queries = [q for q in queries.captured_queries if 'deals_dropdownoption' in q['sql']]
+        # the field list, then only the packaging partition
+        assert len(option_queries) == 2
+        assert "'packaging'" in option_queries[1]['sql'] and "'material'" not in option_queries[1]['sql']
+
+    def test_save_invalidates_only_its_field(self, api_client, authenticated_user):
+        """Test that editing a material option keeps other fields cached"""
+        material, = _options('material', 'akzhal')
+        _options('packaging', 'bulk')
+        api_client.get(reverse('deals:dropdown'))
+
+        material.tooltip_text = 'Updated'
+        material.save()
+
+        assert not _fresh(dropdown_cache.partition_key('material'))
+        assert _fresh(dropdown_cache.partition_key('packaging'))
+        assert _fresh(dropdown_cache.FIELDS_CACHE_KEY)
+        response = api_client.get(reverse('deals:dropdown'), {'field_name': 'material'})
+        assert response.data[0]['tooltip_text'] == 'Updated'
+
+    def test_new_field_and_moved_option(self, api_client, authenticated_user):
+        """Test that new fields appear and moved options leave their old field"""
+        _options('material', 'akzhal')
+        moved, = _options('packaging', 'drums')
+        url = reverse('deals:dropdown')
+        api_client.get(url)
+
+        _options('currency', 'usd')
+        moved.field_name = 'material'
+        moved.save()
+
+        response = api_client.get(url)
+        assert [(row['field_name'], row['option_values']['value']) for row in response.data] == [
+            ('currency', 'usd'), ('material', 'akzhal'), ('material', 'drums'),
+        ]
+
+    def test_deactivated_option_disappears(self, api_client, authenticated_user, django_capture_on_commit_callbacks):
+        """Test that deactivating and deleting options invalidate the field"""
+        first, second = _options('material', 'akzhal', 'lead')
+        url = reverse('deals:dropdown')
+        api_client.get(url)
+
+        first.is_active = False
+        first.save()
+        assert [row['id'] for row in api_client.get(url).data] == [second.id]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            second.delete()
+        assert api_client.get(url, {'field_name': 'material'}).data == []
+
+    def test_bulk_create_refreshes_field_cached_empty(self, api_client, authenticated_user,
+                                                      django_capture_on_commit_callbacks):
+        """Test that a bulk write invalidates fields missing from the cached field list"""
+        _options('material', 'akzhal')
+        url = reverse('deals:dropdown')
+        api_client.get(url)
+        assert api_client.get(url, {'field_name': 'currency'}).data == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            DropdownOption.objects.bulk_create([DropdownOption(field_name='currency', option_values={'value': 'usd'})])
+
+        assert [row['option_values']['value'] for row in api_client.get(url, {'field_name': 'currency'}).data] == ['usd']
+        assert [row['field_name'] for row in api_client.get(url).data] == ['currency', 'material']
+
+
+class TestTieredCache:
+    """Test cases for the in-process L1 in front of Redis"""
+
+    @pytest.fixture
+    def tiered(self):
+        tiered = TieredCache('test_tiered', timeout=60)
+        yield tiered
+        tiered.invalidate(['a'])
+
+    def test_l1_serves_without_redis(self, tiered):
+        """Test that L1 hits do not read Redis until the version changes"""
+        tiered.set('a', [1, 2])
+        cache.delete(tiered.key('a'))
+
+        assert tiered.get('a') == [1, 2]
+
+    def test_version_change_from_other_process(self, tiered, settings):
+        """Test that a bumped version stamp drops L1 after the check interval"""
+        settings.REFERENCE_CACHE_VERSION_CHECK_INTERVAL = 0
+        tiered.set('a', [1, 2])
+        cache.delete(tiered.fresh_key('a'))
+        cache.set(tiered.version_key, 1, None)
+
+        assert tiered.get('a') is None
+
+    def test_invalidate_all_drops_every_key(self, tiered):
+        """Test that invalidate_all() leaves neither fresh nor stale values behind"""
+        tiered.set('a', [1, 2])
+        tiered.set('b', [3])
+
+        tiered.invalidate_all()
+
+        assert tiered.get('a') is None
+        assert tiered.get_or_set('b', lambda: [4]) == [4]
+
+    def test_pubsub_broadcast_drops_l1(self, tiered):
+        """Test that a broadcast invalidation clears L1 without waiting for the interval"""
+        tiered.set('a', [1, 2])
+        tiered.version()  # starts the listener
+        time.sleep(0.2)
+        cache.delete(tiered.key('a'))
+        caching._publish('test_tiered')
+
+        deadline = time.monotonic() + 2
+        while tiered.local.get('a') is not None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert tiered.local.get('a') is None
+
+
+class TestSingleFlightCache:
+    """Test cases for stampede protection and stale-while-revalidate"""
+
+    @pytest.fixture
+    def flight(self):
+        flight = SingleFlightCache('test_flight', timeout=60)
+        yield flight
+        cache.delete_many([flight.key('a'), flight.fresh_key('a'), flight.lock_key('a')])
+
+    def test_stale_served_while_locked(self, flight):
+        """Test that others get the previous value while one caller recomputes"""
+        flight.set('a', 'old')
+        flight.invalidate(['a'])
+        cache.add(flight.lock_key('a'), 'other-worker', 10)
+
+        def compute():
+            raise AssertionError('recomputed while another caller holds the lock')
+
+        assert flight.get('a') is None
+        assert flight.get_or_set('a', compute) == 'old'
+
+    def test_lock_winner_recomputes(self, flight):
+        """Test that a stale key is recomputed once and released"""
+        flight.set('a', 'old')
+        flight.invalidate(['a'])
+
+        assert flight.get_or_set('a', lambda: 'new') == 'new'
+        assert flight.get('a') == 'new'
+        assert cache.get(flight.lock_key('a')) is None
+
+    def test_concurrent_cold_misses_compute_once(self, flight):
+        """Test that concurrent misses with nothing cached collapse into one computation"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.3)
+            return 'value'
+
+        def read():
+            results.append(flight.get_or_set('a', compute))
+
+        results = []
+        threads = [threading.Thread(target=read) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ['value'] * 5
+        assert len(calls) == 1
+
+    def test_batch_computes_only_missing(self, flight):
+        """Test that get_or_set_many passes only missing keys to one compute call"""
+        flight.set('a', 1)
+        calls = []
+
+        def compute(keys):
+            calls.append(keys)
+            return {key: 2 for key in keys}
+
+        try:
+            assert flight.get_or_set_many(['a', 'b'], compute) == {'a': 1, 'b': 2}
+            assert calls == [['b']]
+        finally:
+            cache.delete_many([flight.key('b'), flight.fresh_key('b')])
@@ -0,0 +1,199 @@
+import logging
+import time
+import pytest
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from deals.fast_serializers import get_fast_reader
+from deals.models import (
+    AdditionalClause, BusinessConfirmationDeal, CommercialTerms,
+    NewBusinessConfirmation, PaymentTerms
+)
+from deals.serializers import (
+    AdditionalClauseSerializer, BusinessConfirmationDealSerializer, CommercialTermsSerializer,
+    NewBusinessConfirmationSerializer, PaymentTermsSerializer
+)
+from deals.tests.factories import (
+    NewBusinessConfirmationFactory, CommercialTermsFactory,
+    PaymentTermsFactory, AdditionalClauseFactory, BusinessConfirmationDealFactory
+)
+
+logger = logging.getLogger("deals")
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Keep uploaded assay files out of the real MEDIA_ROOT"""
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+def render_both(queryset, serializer_class, **serializer_kwargs):
+    """JSON bytes from the DRF serializer and from the fast reader."""
+    queryset = queryset.order_by("created_at", "pk")
+    reader = get_fast_reader(serializer_class, key_columns=("created_at", "pk"), **serializer_kwargs)
+    assert reader is not None
+    slow = JSONRenderer().render(serializer_class(queryset, many=True, **serializer_kwargs).data)
+    fast = JSONRenderer().render(reader.render(reader.queryset(queryset)))
+    return slow, fast
+
+
+@pytest.mark.django_db
+class TestFastListReader:
+    """Test that the values() fast path renders byte-identical JSON"""
+
+    def test_commercial_terms_identical(self):
+        """Test dates, decimals, JSON, nulls and file URLs"""
+        terms = CommercialTermsFactory(clauses=[{"title": "Force majeure", "text": "ü"}])
+        terms.assay_file.save("assay.pdf", ContentFile(b"%PDF"), save=True)
+        CommercialTermsFactory(treatment_charge=None, shipment_end_date=None, clauses=None)
+
+        slow, fast = render_both(CommercialTerms.objects.all(), CommercialTermsSerializer)
+
+        assert b"assay" in fast
+        assert slow == fast
+
+    def test_payment_terms_identical(self):
+        """Test payment terms with optional decimals left empty"""
+        PaymentTermsFactory()
+        PaymentTermsFactory(prepayment_percentage=None, surveyor_notes="")
+
+        slow, fast = render_both(PaymentTerms.objects.all(), PaymentTermsSerializer)
+
+        assert slow == fast
+
+    def test_new_business_confirmation_and_clauses_identical(self):
+        """Test the remaining list serializers"""
+        NewBusinessConfirmationFactory.create_batch(3)
+        AdditionalClauseFactory.create_batch(3)
+
+        assert len(set(render_both(NewBusinessConfirmation.objects.all(), NewBusinessConfirmationSerializer))) == 1
+        assert len(set(render_both(AdditionalClause.objects.all(), AdditionalClauseSerializer))) == 1
+
+    def test_deal_with_expansions_identical(self):
+        """Test UUID keys, foreign keys and nested relations, including missing ones"""
+        BusinessConfirmationDealFactory()
+        BusinessConfirmationDealFactory(commercial_terms=None, payment_terms=None)
+        expand = tuple(BusinessConfirmationDealSerializer.EXPANDABLE_FIELDS)
+
+        assert len(set(render_both(BusinessConfirmationDeal.objects.all(), BusinessConfirmationDealSerializer))) == 1
+        slow, fast = render_both(
+            BusinessConfirmationDeal.objects.all(), BusinessConfirmationDealSerializer, expand=expand
+        )
+        assert b"null" in fast
+        assert slow == fast
+
+    def test_sparse_fields_identical(self):
+        """Test that the reader only renders and reads the requested fields"""
+        PaymentTermsFactory.create_batch(2)
+        fields = ("id", "currency", "prepayment_percentage")
+        reader = get_fast_reader(PaymentTermsSerializer, key_columns=("created_at", "pk"), fields=fields)
+
+        slow, fast = render_both(PaymentTerms.objects.all(), PaymentTermsSerializer, fields=fields)
+
+        assert slow == fast
+        assert reader.columns == ["created_at", "pk", "id", "prepayment_percentage", "currency"]
+
+    def test_disabled_by_setting(self, settings):
+        """Test that FAST_LIST_SERIALIZATION=False returns no reader"""
+        settings.FAST_LIST_SERIALIZATION = False
+
+        assert get_fast_reader(PaymentTermsSerializer) is None
+
+
+@pytest.mark.django_db
+class TestFastListEndpoints:
+    """Test list endpoints served by the fast path"""
+
+    def test_expanded_deal_list_single_query(self, api_client, authenticated_user):
+        """Test that an expanded deal page is one joined query"""
+        BusinessConfirmationDealFactory.create_batch(3, user=authenticated_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(
+                reverse('deals:business-confirmation-deals'), {'expand': 'all', 'page_size': 2}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries.captured_queries) == 1
+        assert response.data['results'][0]['commercial_terms']['delivery_term']
+        assert response.data['next'] is not None
+
+    def test_cursor_walk_matches_serializer(self, api_client, authenticated_user, settings):
+        """Test that paginating tuples yields the same pages as model instances"""
+        CommercialTermsFactory.create_batch(5)
+
+        def walk():
+            response = api_client.get(reverse('deals:commercial-terms'), {'page_size': 2})
+            pages = [response.content]
+            while response.data['next']:
+                response = api_client.get(response.data['next'])
+                pages.append(response.content)
+            return pages
+
+        fast_pages = walk()
+        settings.FAST_LIST_SERIALIZATION = False
+        assert walk() == fast_pages
+        assert len(fast_pages) == 3
+
+
+@pytest.mark.django_db
+class TestFastListLargeQueryset:
+    """Test the fast path against DRF serialization on a large table"""
+
+    ROWS = 10_000
+
+    @pytest.fixture
+    def queryset(self):
+        template = CommercialTermsFactory.build()
+        CommercialTerms.objects.bulk_create(
+            [CommercialTerms(**{
+                field.attname: getattr(template, field.attname)
+                for field in CommercialTerms._meta.concrete_fields
+                if not field.primary_key and not field.generated
+            }) for _ in range(self.ROWS)],
+            batch_size=2000,
+        )
+        return CommercialTerms.objects.order_by("created_at", "pk")
+
+    def test_ten_thousand_commercial_terms(self, queryset):
+        """Test that 10k rows render identically from a single query"""
+        reader = get_fast_reader(CommercialTermsSerializer, key_columns=("created_at", "pk"))
+
+        slow = CommercialTermsSerializer(queryset, many=True).data
+        with CaptureQueriesContext(connection) as queries:
+            fast = reader.render(reader.queryset(queryset))
+
+        assert len(queries.captured_queries) == 1
+        assert len(fast) == self.ROWS
+        assert JSONRenderer().render(slow) == JSONRenderer().render(fast)
+
+    @pytest.mark.slow
+    def test_speedup_benchmark(self, queryset):
+        """
+        Benchmark rendering 10k rows through DRF and through the fast path.
+        Timings are logged rather than asserted; see them with
+        ``pytest -m slow --log-cli-level=INFO``.
+        """
+        reader = get_fast_reader(CommercialTermsSerializer, key_columns=("created_at", "pk"))
+        renderers = {
+            "drf": lambda: JSONRenderer().render(CommercialTermsSerializer(queryset, many=True).data),
+            "fast": lambda: JSONRenderer().render(reader.render(reader.queryset(queryset))),
+        }
+
+        timings, bodies = {}, {}
+        for name, render in renderers.items():
+            runs = []
+            for _ in range(3):
+                started = time.perf_counter()
+                bodies[name] = render()
+                runs.append(time.perf_counter() - started)
+            timings[name] = min(runs)
+
+        logger.info(
+            f"{self.ROWS} commercial terms: DRF {timings['drf'] * 1000:.0f} ms, "
+            f"fast {timings['fast'] * 1000:.0f} ms ({timings['drf'] / timings['fast']:.1f}x)"
+        )
+        assert bodies["fast"] == bodies["drf"]
@@ -0,0 +1,164 @@
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from deals import conditional, invalidation
+from deals.invalidation import bulk_invalidation
+from deals.models import DealStatsBucket, DropdownOption
+from deals.services import deal_stats, dropdown_cache
+from deals.tests.factories import DropdownOptionFactory
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+    yield
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+
+
+@pytest.fixture
+def invalidations(monkeypatch):
+    """Record dropdown cache invalidations"""
+    calls = []
+    monkeypatch.setattr(dropdown_cache.options_cache, 'invalidate', lambda keys: calls.append(sorted(keys)))
+    return calls
+
+
+@pytest.fixture
+def bumps(monkeypatch):
+    """Record table version bumps"""
+    calls = []
+    bump = conditional.bump_table_version
+    monkeypatch.setattr(conditional, 'bump_table_version', lambda model: calls.append(model) or bump(model))
+    return calls
+
+
+def _save_options(field_name, count):
+    for order in range(count):
+        DropdownOption.objects.create(field_name=field_name, option_values={'value': order}, display_order=order)
+
+
+@pytest.mark.django_db
+class TestDeferredInvalidation:
+    """Test cases for transaction-aware, coalesced cache invalidation"""
+
+    def test_deferred_until_commit_and_deduplicated(self, invalidations, bumps, django_capture_on_commit_callbacks):
+        """Test that a transaction's saves invalidate once, after commit"""
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                _save_options('material', 5)
+                _save_options('packaging', 5)
+                assert invalidations == []
+                assert bumps == []
+
+        assert len(callbacks) == 1
+        assert invalidations == [['field:material', 'field:packaging', 'fields']]
+        assert bumps == [DropdownOption]
+
+    def test_rolled_back_savepoint_keeps_later_invalidations(self, invalidations, django_capture_on_commit_callbacks):
+        """Test that invalidations after a rolled-back savepoint still run on commit"""
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        _save_options('material', 1)
+                        raise ValueError('rollback')
+                except ValueError:
+                    pass
+                _save_options('packaging', 1)
+
+        assert len(invalidations) == 1
+        assert 'field:packaging' in invalidations[0]
+
+    def test_autocommit_invalidates_immediately(self, invalidations):
+        """Test that saves outside a transaction invalidate right away"""
+        DropdownOptionFactory(field_name='material')
+
+        assert invalidations == [['field:material', 'fields']]
+
+    def test_bulk_invalidation_emits_once(self, invalidations, bumps):
+        """Test that a bulk load invalidates each key once, at the end"""
+        with bulk_invalidation():
+            _save_options('material', 10)
+            with bulk_invalidation():
+                _save_options('currency', 3)
+            assert invalidations == []
+
+        assert invalidations == [['field:currency', 'field:material', 'fields']]
+        assert bumps == [DropdownOption]
+
+    def test_table_versions_bumped_last(self, monkeypatch, django_capture_on_commit_callbacks):
+        """Test that table versions change only after the caches written in the same transaction"""
+        calls = []
+        monkeypatch.setattr(dropdown_cache.options_cache, 'invalidate', lambda keys: calls.append('dropdown'))
+        monkeypatch.setattr(conditional, 'bump_table_version', lambda model: calls.append(model))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                conditional.bump_table_versions_on_commit(DealStatsBucket)
+                _save_options('material', 1)
+
+        assert calls[0] == 'dropdown'
+        assert set(calls[1:]) == {DealStatsBucket, DropdownOption}
+
+    def test_failing_handler_does_not_block_others(self, monkeypatch, bumps):
+        """Test that a failing invalidation is logged and the rest still run"""
+        def broken(keys):
+            raise ConnectionError('redis down')
+
+        monkeypatch.setattr(dropdown_cache.options_cache, 'invalidate', broken)
+
+        DropdownOptionFactory(field_name='material')
+
+        assert bumps == [DropdownOption]
+
+
+@pytest.mark.django_db
+class TestDeferredTableVersions:
+    """Test cases for table version bumps of writes that bypass model signals"""
+
+    def _stamp(self):
+        return cache.get(conditional.TABLE_VERSION_KEY.format(DealStatsBucket._meta.label_lower))
+
+    def _apply(self):
+        deal_stats.apply_deltas(deal_stats.bucket_deltas('Akzhal', 10, timezone.now(), None, 'draft'))
+
+    def test_rollback_keeps_stamp(self):
+        """Test that a rolled-back write leaves the table version unchanged"""
+        stamp = conditional.bump_table_version(DealStatsBucket)
+        try:
+            with transaction.atomic():
+                self._apply()
+                raise ValueError('rollback')
+        except ValueError:
+            pass
+
+        assert self._stamp() == stamp
+        assert not DealStatsBucket.objects.exists()
+
+    def test_rolled_back_bump_does_not_fire_later(self):
+        """Test that a rolled-back transaction's bumps are discarded, not run by a later flush"""
+        stamp = conditional.bump_table_version(DealStatsBucket)
+        try:
+            with transaction.atomic():
+                self._apply()
+                raise ValueError('rollback')
+        except ValueError:
+            pass
+
+        DropdownOptionFactory(field_name='material')
+
+        assert self._stamp() == stamp
+        assert not invalidation._state().pending
+
+    def test_bumped_after_commit(self, django_capture_on_commit_callbacks):
+        """Test that the table version changes only once the write commits"""
+        stamp = conditional.bump_table_version(DealStatsBucket)
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                self._apply()
+                assert self._stamp() == stamp
+
+        assert self._stamp() != stamp
@@ -0,0 +1,106 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from deals.models import BusinessConfirmationDeal
+from deals.tests.factories import (
+    NewBusinessConfirmationFactory,
+    CommercialTermsFactory, PaymentTermsFactory,
+    AdditionalClauseFactory, BusinessConfirmationDealFactory
+)
+
+
+def walk_pages(api_client, url, params):
+    """Follow next links until exhausted and return every page's results"""
+    pages = []
+    response = api_client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data['results'])
+        if response.data['next'] is None:
+            return pages
+        response = api_client.get(response.data['next'])
+
+
+@pytest.mark.django_db
+class TestKeysetCursorPagination:
+    """Test cases for cursor pagination on list endpoints"""
+
+    @pytest.mark.parametrize('url_name, factory', [
+        ('deals:new-business-confirmation', NewBusinessConfirmationFactory),
+        ('deals:commercial-terms', CommercialTermsFactory),
+        ('deals:payment-terms', PaymentTermsFactory),
+        ('deals:additional-clauses', AdditionalClauseFactory),
+        ('deals:business-confirmation-deals', BusinessConfirmationDealFactory),
+    ])
+    def test_pages_cover_all_rows_once(self, api_client, authenticated_user, url_name, factory):
+        """Test that walking next links returns every row across full and partial pages"""
+        factory.create_batch(5)
+
+        pages = walk_pages(api_client, reverse(url_name), {'page_size': 2})
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+
+    def test_unpaginated_request_returns_plain_list(self, api_client, authenticated_user):
+        """Test that clients not asking for a page still get the full list"""
+        BusinessConfirmationDealFactory.create_batch(3)
+
+        response = api_client.get(reverse('deals:business-confirmation-deals'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response.data, list)
+        assert len(response.data) == 3
+
+    def test_order_is_stable_for_identical_timestamps(self, api_client, authenticated_user):
+        """Test that rows sharing created_at are split by id without gaps or repeats"""
+        deals = BusinessConfirmationDealFactory.create_batch(6)
+        created_at = deals[0].created_at
+        BusinessConfirmationDeal.objects.update(created_at=created_at)
+
+        pages = walk_pages(api_client, reverse('deals:business-confirmation-deals'), {'page_size': 4})
+
+        ids = [row['id'] for page in pages for row in page]
+        expected = sorted((str(deal.id) for deal in deals), reverse=True)
+        assert ids == expected
+
+    def test_previous_link_returns_previous_page(self, api_client, authenticated_user):
+        """Test that following previous from page two returns page one"""
+        BusinessConfirmationDealFactory.create_batch(5)
+        url = reverse('deals:business-confirmation-deals')
+
+        first = api_client.get(url, {'page_size': 2})
+        second = api_client.get(first.data['next'])
+        back = api_client.get(second.data['previous'])
+
+        assert first.data['previous'] is None
+        assert back.data['results'] == first.data['results']
+        assert back.data['previous'] is None
+
+    def test_page_size_is_capped(self, api_client, authenticated_user, settings):
+        """Test that page_size above the configured maximum is clamped"""
+        settings.CURSOR_PAGINATION_MAX_PAGE_SIZE = 3
+        BusinessConfirmationDealFactory.create_batch(5)
+
+        response = api_client.get(reverse('deals:business-confirmation-deals'), {'page_size': 1000})
+
+        assert len(response.data['results']) == 3
+        assert response.data['next'] is not None
+
+    def test_invalid_cursor(self, api_client, authenticated_user):
+        """Test that a malformed cursor is rejected"""
+        response = api_client.get(reverse('deals:business-confirmation-deals'), {'cursor': 'not-a-cursor'})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_no_count_or_offset_query(self, api_client, authenticated_user):
+        """Test that a page is served without COUNT(*) or OFFSET queries"""
+        BusinessConfirmationDealFactory.create_batch(3)
+        url = reverse('deals:business-confirmation-deals')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {'page_size': 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any('COUNT(' in query['sql'].upper() for query in queries.captured_queries)
+        assert not any('OFFSET' in query['sql'].upper() for query in queries.captured_queries)
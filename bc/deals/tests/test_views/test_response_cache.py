@@ -0,0 +1,273 @@
+import gzip
+import json
+import time
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_save
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+from deals import caching, response_cache
+from deals.models import AdditionalClause, DropdownOption, PaymentTerms
+from deals.response_cache import cached_response
+from deals.services import dropdown_cache
+from deals.tests.factories import UserFactory, DropdownOptionFactory, AdditionalClauseFactory
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(settings):
+    settings.RENDERED_CACHE_MIN_COMPRESS_SIZE = 0
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+    response_cache.rendered_responses.local.clear()
+    yield
+    cache.clear()
+    dropdown_cache.options_cache.clear_local()
+    response_cache.rendered_responses.local.clear()
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """Count JSON renderings"""
+    calls = []
+    render = JSONRenderer.render
+
+    def counting_render(self, *args, **kwargs):
+        calls.append(1)
+        return render(self, *args, **kwargs)
+
+    monkeypatch.setattr(JSONRenderer, 'render', counting_render)
+    return calls
+
+
+def _options(*values):
+    return [
+        DropdownOptionFactory(field_name='material', option_values={'value': value}, display_order=order)
+        for order, value in enumerate(values)
+    ]
+
+
+@pytest.mark.django_db
+class TestRenderedResponseCache:
+    """Test cases for the pre-rendered, pre-compressed response cache"""
+
+    def test_gzip_variant(self, api_client, authenticated_user):
+        """Test that gzip clients get the compressed body with Vary set"""
+        _options('akzhal', 'lead')
+
+        response = api_client.get(reverse('deals:dropdown'), HTTP_ACCEPT_ENCODING='gzip, deflate')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response['Vary']
+        assert response['ETag']
+        rows = json.loads(gzip.decompress(response.content))
+        assert [row['option_values']['value'] for row in rows] == ['akzhal', 'lead']
+
+    def test_identity_variant(self, api_client, authenticated_user):
+        """Test that clients without Accept-Encoding get the plain body"""
+        _options('akzhal')
+
+        response = api_client.get(reverse('deals:dropdown'))
+
+        assert not response.has_header('Content-Encoding')
+        assert json.loads(response.content)[0]['option_values']['value'] == 'akzhal'
+
+    def test_gzip_refused(self, api_client, authenticated_user):
+        """Test that q=0 disables an encoding"""
+        _options('akzhal')
+
+        response = api_client.get(reverse('deals:dropdown'), HTTP_ACCEPT_ENCODING='gzip;q=0, *;q=0')
+
+        assert not response.has_header('Content-Encoding')
+
+    def test_hit_skips_rendering(self, api_client, authenticated_user, render_calls):
+        """Test that a hit returns stored bytes for any encoding without rendering"""
+        _options('akzhal')
+        url = reverse('deals:dropdown')
+
+        first = api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        second = api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        plain = api_client.get(url)
+
+        assert len(render_calls) == 1
+        assert second.content == first.content
+        assert json.loads(gzip.decompress(second.content)) == json.loads(plain.content)
+
+    def test_hit_from_redis(self, api_client, authenticated_user, render_calls):
+        """Test that another process's rendering is reused from Redis"""
+        _options('akzhal')
+        url = reverse('deals:dropdown')
+        api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        response_cache.rendered_responses.local.clear()
+
+        api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+
+        assert len(render_calls) == 1
+
+    def test_change_serves_new_bytes(self, api_client, authenticated_user):
+        """Test that a new table version is rendered again"""
+        option, = _options('akzhal')
+        url = reverse('deals:dropdown')
+        api_client.get(url)
+
+        option.option_values = {'value': 'lead'}
+        option.save()
+
+        response = api_client.get(url)
+        assert json.loads(response.content)[0]['option_values']['value'] == 'lead'
+
+    def test_edit_while_stale_partition_in_l1(self, api_client, authenticated_user, monkeypatch):
+        """Test that an L1 copy another worker has not dropped yet is not stored under the new ETag"""
+        option, = _options('akzhal')
+        url = reverse('deals:dropdown')
+        api_client.get(url)
+        options_cache = dropdown_cache.options_cache
+        unheard = (list(options_cache.local._entries.items()), options_cache._version)
+        # This worker misses the broadcast and has checked the stamp just now
+        monkeypatch.setattr(caching, '_publish', lambda namespace: None)
+
+        option.option_values = {'value': 'lead'}
+        option.save()
+        options_cache.local._entries.update(unheard[0])
+        options_cache._version, options_cache._version_checked_at = unheard[1], time.monotonic()
+
+        response = api_client.get(url)
+        assert response.data[0]['option_values']['value'] == 'lead'
+        revalidated = api_client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_stale_partition_not_stored(self, api_client, authenticated_user, render_calls):
+        """Test that a body built from a stale partition is served without being stored or validated"""
+        option, = _options('akzhal')
+        url = reverse('deals:dropdown')
+        lock_key = dropdown_cache.options_cache.lock_key(dropdown_cache.partition_key('material'))
+        api_client.get(url)
+        option.option_values = {'value': 'lead'}
+        option.save()
+        cache.add(lock_key, 'other-worker', 10)
+
+        stale = api_client.get(url)
+        assert stale.data[0]['option_values']['value'] == 'akzhal'
+        assert not stale.has_header('ETag')
+
+        cache.delete(lock_key)
+        response = api_client.get(url)
+        assert response.data[0]['option_values']['value'] == 'lead'
+        assert len(render_calls) == 3
+
+    def test_browsable_api_bypasses_cache(self, api_client, authenticated_user):
+        """Test that HTML renderings are neither served from nor stored in the cache"""
+        _options('akzhal')
+        url = reverse('deals:dropdown')
+        api_client.get(url)
+
+        response = api_client.get(url, HTTP_ACCEPT='text/html')
+
+        assert response['Content-Type'].startswith('text/html')
+
+    def test_additional_clauses_cached(self, api_client, authenticated_user, render_calls):
+        """Test that the additional clauses response is cached"""
+        AdditionalClauseFactory.create_batch(2)
+        url = reverse('deals:additional-clauses')
+
+        first = api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        second = api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+
+        assert len(render_calls) == 1
+        assert second.content == first.content
+        assert len(json.loads(gzip.decompress(second.content))) == 2
+
+    def test_brotli_variant(self, api_client, authenticated_user):
+        """Test that brotli is preferred when the client and server support it"""
+        brotli = pytest.importorskip('brotli')
+        _options('akzhal')
+
+        response = api_client.get(reverse('deals:dropdown'), HTTP_ACCEPT_ENCODING='gzip, br')
+
+        assert response['Content-Encoding'] == 'br'
+        assert json.loads(brotli.decompress(response.content))[0]['option_values']['value'] == 'akzhal'
+
+
+@pytest.mark.django_db
+class TestCachedResponseDecorator:
+    """Test cases for declaring model-driven caching on a view"""
+
+    @pytest.fixture
+    def clause_view(self):
+        calls = []
+
+        class ClauseCountView(APIView):
+            permission_classes = [IsAuthenticated]
+
+            @cached_response(AdditionalClause)
+            def get(self, request):
+                calls.append(1)
+                return Response({'count': AdditionalClause.objects.count()})
+
+        return ClauseCountView.as_view(), calls
+
+    def _get(self, view, user, **headers):
+        request = APIRequestFactory().get('/api/clause-count/', **headers)
+        force_authenticate(request, user=user)
+        return view(request)
+
+    def test_handler_skipped_on_hit(self, clause_view):
+        """Test that a repeat request and a revalidation do not call the handler"""
+        view, calls = clause_view
+        user = UserFactory()
+        AdditionalClauseFactory()
+
+        first = self._get(view, user)
+        second = self._get(view, user)
+        revalidated = self._get(view, user, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert len(calls) == 1
+        assert second.content == first.content
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_save_and_delete_invalidate(self, clause_view, django_capture_on_commit_callbacks):
+        """Test that model signals registered by the decorator change the response"""
+        view, calls = clause_view
+        user = UserFactory()
+        clause = AdditionalClauseFactory()
+        self._get(view, user)
+
+        AdditionalClauseFactory()
+        assert self._get(view, user).data == {'count': 2}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            clause.delete()
+        assert self._get(view, user).data == {'count': 1}
+
+    def test_bulk_writes_invalidate(self, api_client, authenticated_user):
+        """Test that QuerySet.update() and bulk_create() change cached responses"""
+        option, = _options('akzhal')
+        url = reverse('deals:dropdown')
+        api_client.get(url)
+
+        DropdownOption.objects.filter(pk=option.pk).update(tooltip_text='Bulk')
+        assert api_client.get(url).data[0]['tooltip_text'] == 'Bulk'
+
+        DropdownOption.objects.bulk_create([DropdownOption(field_name='packaging', option_values={'value': 'bulk'})])
+        assert [row['field_name'] for row in api_client.get(url).data] == ['material', 'packaging']
+
+    def test_model_without_versioned_manager_rejected(self):
+        """Test that a model whose bulk writes would not bump its table version cannot be declared"""
+        with pytest.raises(ImproperlyConfigured, match='deals.PaymentTerms'):
+            cached_response(PaymentTerms)
+
+        cached_response(bumped_manually=(PaymentTerms,))
+
+    def test_registration_is_idempotent(self):
+        """Test that declaring the same model twice connects one receiver per signal"""
+        cached_response(AdditionalClause)
+        cached_response(AdditionalClause)
+
+        receivers = [entry for entry in post_save.receivers if entry[0][0] == 'table_version_save_deals.additionalclause']
+        assert len(receivers) == 1
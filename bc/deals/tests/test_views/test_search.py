@@ -0,0 +1,114 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from deals.models import AdditionalClause
+from deals.tests.factories import (
+    AdditionalClauseFactory, CommercialTermsFactory, PaymentTermsFactory
+)
+
+
+@pytest.mark.django_db
+class TestSearch:
+    """Test cases for full-text search"""
+
+    def test_searches_all_text_sources(self, api_client, authenticated_user):
+        """Test that clauses, clause JSON and payment terms text are all matched"""
+        clause = AdditionalClauseFactory(clause='Force majeure applies to strikes and floods')
+        terms = CommercialTermsFactory(clauses=['Seller bears demurrage', 'Floods suspend delivery'])
+        payment = PaymentTermsFactory(final_payment_terms='Balance due after flooding survey')
+        AdditionalClauseFactory(clause='Arbitration in London')
+
+        response = api_client.get(reverse('deals:search'), {'q': 'flood'})
+
+        assert response.status_code == status.HTTP_200_OK
+        found = {(row['type'], row['id']) for row in response.data['results']}
+        assert found == {
+            ('additional_clauses', clause.id),
+            ('commercial_terms', terms.id),
+            ('payment_terms', payment.id),
+        }
+
+    def test_highlights_and_rank(self, api_client, authenticated_user):
+        """Test that matches are highlighted and ordered by rank"""
+        strong = AdditionalClauseFactory(clause='Demurrage demurrage demurrage at the discharge port')
+        weak = AdditionalClauseFactory(clause='Demurrage is payable after laytime as described in the charter party')
+
+        response = api_client.get(reverse('deals:search'), {'q': 'demurrage', 'types': 'additional_clauses'})
+
+        results = response.data['results']
+        assert [row['id'] for row in results] == [strong.id, weak.id]
+        assert results[0]['rank'] >= results[1]['rank']
+        assert '<mark>Demurrage</mark>' in results[1]['highlights']['clause']
+
+    def test_only_matching_fields_are_highlighted(self, api_client, authenticated_user):
+        """Test that a payment terms hit only highlights the field that matched"""
+        PaymentTermsFactory(provisional_payment_terms='90% on bill of lading', final_payment_terms='Balance on assay')
+
+        response = api_client.get(reverse('deals:search'), {'q': 'assay', 'types': 'payment_terms'})
+
+        assert list(response.data['results'][0]['highlights']) == ['final_payment_terms']
+
+    def test_vector_maintained_on_update_and_bulk_create(self, api_client, authenticated_user):
+        """Test that updates and bulk inserts are searchable immediately"""
+        clause = AdditionalClauseFactory(clause='Arbitration in London')
+        clause.clause = 'Arbitration in Singapore'
+        clause.save()
+        AdditionalClause.objects.bulk_create([AdditionalClause(clause='Singapore law governs')])
+
+        response = api_client.get(reverse('deals:search'), {'q': 'singapore'})
+
+        assert len(response.data['results']) == 2
+        assert api_client.get(reverse('deals:search'), {'q': 'london'}).data['results'] == []
+
+    def test_highlights_are_escaped(self, api_client, authenticated_user):
+        """Test that clause text is HTML escaped and only the matches are marked up"""
+        AdditionalClauseFactory(clause='Demurrage <script>alert(1)</script> unless price <b & "despatch"')
+
+        response = api_client.get(reverse('deals:search'), {'q': 'demurrage', 'types': 'additional_clauses'})
+
+        highlight = response.data['results'][0]['highlights']['clause']
+        assert '<script>' not in highlight
+        assert 'price &lt;b &amp; &quot;despatch' in highlight
+        assert highlight.startswith('<mark>Demurrage</mark>')
+
+    def test_commercial_terms_highlight_clause_text(self, api_client, authenticated_user):
+        """Test that commercial terms highlights show the clause strings, not their JSON"""
+        CommercialTermsFactory(clauses=['Seller bears demurrage', 'Floods suspend delivery'])
+
+        response = api_client.get(reverse('deals:search'), {'q': 'demurrage', 'types': 'commercial_terms'})
+
+        highlight = response.data['results'][0]['highlights']['clauses']
+        assert highlight == 'Seller bears <mark>demurrage</mark> Floods suspend delivery'
+
+    def test_websearch_syntax(self, api_client, authenticated_user):
+        """Test phrase and exclusion syntax"""
+        AdditionalClauseFactory(clause='Quality final at loading port')
+        AdditionalClauseFactory(clause='Quality final at discharge port')
+
+        response = api_client.get(reverse('deals:search'), {'q': '"quality final" -discharge'})
+
+        assert len(response.data['results']) == 1
+
+    def test_limit(self, api_client, authenticated_user):
+        """Test that limit caps the merged results"""
+        AdditionalClauseFactory.create_batch(3, clause='Weighing at loading port')
+        PaymentTermsFactory.create_batch(3, provisional_payment_terms='Payment after weighing')
+
+        response = api_client.get(reverse('deals:search'), {'q': 'weighing', 'limit': 4})
+
+        assert len(response.data['results']) == 4
+
+    def test_validation(self, api_client, authenticated_user):
+        """Test that q is required and types are checked"""
+        assert api_client.get(reverse('deals:search')).status_code == status.HTTP_400_BAD_REQUEST
+        response = api_client.get(reverse('deals:search'), {'q': 'x', 'types': 'deals'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'deals' in response.data['error']
+
+    def test_search_vector_not_exposed(self, api_client, authenticated_user):
+        """Test that the generated column stays out of API payloads"""
+        CommercialTermsFactory()
+        PaymentTermsFactory()
+
+        assert 'search_vector' not in api_client.get(reverse('deals:commercial-terms')).data[0]
+        assert 'search_vector' not in api_client.get(reverse('deals:payment-terms')).data[0]
@@ -0,0 +1,87 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from deals.tests.factories import (
+    PaymentTermsFactory, CommercialTermsFactory,
+    DropdownOptionFactory, BusinessConfirmationDealFactory
+)
+
+
+def selected_sql(queries):
+    return " ".join(query['sql'] for query in queries.captured_queries)
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """Test cases for ?fields= on list endpoints"""
+
+    def test_payment_terms_large_text_not_loaded(self, api_client, authenticated_user):
+        """Test that unrequested TextFields are neither selected nor rendered"""
+        PaymentTermsFactory.create_batch(2)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(reverse('deals:payment-terms'), {'fields': 'id,currency,payment_method'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(set(row) == {'id', 'currency', 'payment_method'} for row in response.data)
+        sql = selected_sql(queries)
+        assert 'provisional_payment_terms' not in sql
+        assert 'surveyor_notes' not in sql
+        assert len(queries.captured_queries) == 1
+
+    def test_commercial_terms_clauses_not_loaded(self, api_client, authenticated_user):
+        """Test that the clauses JSON is skipped on paginated pages too"""
+        CommercialTermsFactory.create_batch(3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(
+                reverse('deals:commercial-terms'), {'fields': 'delivery_term', 'page_size': 2}
+            )
+
+        assert [set(row) for row in response.data['results']] == [{'delivery_term'}] * 2
+        assert response.data['next'] is not None
+        assert '"clauses"' not in selected_sql(queries)
+        assert len(queries.captured_queries) == 1
+
+    def test_unknown_field_rejected(self, api_client, authenticated_user):
+        """Test that unknown field names return 400"""
+        response = api_client.get(reverse('deals:payment-terms'), {'fields': 'id,not_a_field'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'fields' in response.data
+
+    def test_deal_fields_with_expand(self, api_client, authenticated_user, django_assert_num_queries):
+        """Test that fields and expand combine, dropping unrequested relations"""
+        deal = BusinessConfirmationDealFactory()
+
+        with django_assert_num_queries(1):
+            response = api_client.get(
+                reverse('deals:business-confirmation-deals'),
+                {'fields': 'id,status,commercial_terms', 'expand': 'all'}
+            )
+
+        row = response.data[0]
+        assert set(row) == {'id', 'status', 'commercial_terms'}
+        assert row['commercial_terms']['id'] == deal.commercial_terms_id
+
+    def test_deal_detail_fields(self, api_client, authenticated_user):
+        """Test that the detail endpoint honours fields"""
+        deal = BusinessConfirmationDealFactory()
+        url = reverse('deals:business-confirmation-deal-detail', kwargs={'deal_id': deal.id})
+
+        response = api_client.get(url, {'fields': 'id,payment_terms'})
+
+        assert set(response.data) == {'id', 'payment_terms'}
+        assert response.data['payment_terms']['id'] == deal.payment_terms_id
+
+    def test_dropdown_fields(self, api_client, authenticated_user):
+        """Test that cached dropdown rows are trimmed to the requested fields"""
+        DropdownOptionFactory(field_name='material')
+        url = reverse('deals:dropdown')
+
+        api_client.get(url)
+        response = api_client.get(url, {'fields': 'field_name,option_values'})
+
+        assert [set(row) for row in response.data] == [{'field_name', 'option_values'}]
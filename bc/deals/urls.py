@@ -1,7 +1,10 @@
 from django.urls import path
 from .views import (NewBusinessConfirmationView, DropdownOptionView, CommercialTermsView, 
                     AdditionalClauseView, PaymentTermsView, BusinessConfirmationDealView,
-                    AISuggestionsView, SubmitDealView, TaskStatusView)
+                    BusinessConfirmationDealDetailView, BusinessConfirmationDealCompositeView, DealExportView,
+                    AISuggestionsView, SubmitDealView, TaskStatusView,
+                    NewBusinessConfirmationBulkView, CommercialTermsBulkView, PaymentTermsBulkView,
+                    SearchView, CounterpartyTypeaheadView, DealStatsView, CacheStatsView)
 
 
 app_name = "deals"
@@ -12,6 +15,11 @@ urlpatterns = [
         NewBusinessConfirmationView.as_view(), 
         name="new-business-confirmation"
     ),
+    path(
+        "new-business-confirmations/bulk/", 
+        NewBusinessConfirmationBulkView.as_view(), 
+        name="new-business-confirmation-bulk"
+    ),
     path(
         "dropdowns/", 
         DropdownOptionView.as_view(), 
@@ -22,6 +30,11 @@ urlpatterns = [
         CommercialTermsView.as_view(), 
         name="commercial-terms"
     ),
+    path(
+        "commercial-terms/bulk/", 
+        CommercialTermsBulkView.as_view(), 
+        name="commercial-terms-bulk"
+    ),
     path(
         "additional-clauses/", 
         AdditionalClauseView.as_view(), 
@@ -32,11 +45,51 @@ urlpatterns = [
         PaymentTermsView.as_view(), 
         name="payment-terms"
     ),
+    path(
+        "payment-terms/bulk/", 
+        PaymentTermsBulkView.as_view(), 
+        name="payment-terms-bulk"
+    ),
     path(
         "business-confirmation-deals/", 
         BusinessConfirmationDealView.as_view(), 
         name="business-confirmation-deals"
     ),
+    path(
+        "business-confirmation-deals/export/", 
+        DealExportView.as_view(), 
+        name="business-confirmation-deals-export"
+    ),
+    path(
+        "business-confirmation-deals/composite/", 
+        BusinessConfirmationDealCompositeView.as_view(), 
+        name="business-confirmation-deals-composite"
+    ),
+    path(
+        "business-confirmation-deals/<uuid:deal_id>/", 
+        BusinessConfirmationDealDetailView.as_view(), 
+        name="business-confirmation-deal-detail"
+    ),
+    path(
+        "search/", 
+        SearchView.as_view(), 
+        name="search"
+    ),
+    path(
+        "counterparties/", 
+        CounterpartyTypeaheadView.as_view(), 
+        name="counterparties"
+    ),
+    path(
+        "deal-stats/", 
+        DealStatsView.as_view(), 
+        name="deal-stats"
+    ),
+    path(
+        "cache-stats/", 
+        CacheStatsView.as_view(), 
+        name="cache-stats"
+    ),
     path(
         "ai-suggestions/", 
         AISuggestionsView.as_view(), 
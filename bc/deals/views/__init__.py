@@ -5,7 +5,15 @@ from .payment_terms_views import *
 from .bc_deal_views import *
 from .ai_suggestions_views import *
 from .submit_views import *
+from .bulk_views import *
+from .search_views import *
+from .counterparty_views import *
+from .stats_views import *
+from .cache_views import *
 
 __all__ = ["NewBusinessConfirmationView", "DropdownOptionView", "CommercialTermsView",
            "AdditionalClauseView", "PaymentTermsView", "BusinessConfirmationDealView",
-           "AISuggestionsView", "SubmitDealView", "TaskStatusView"]
+           "BusinessConfirmationDealDetailView", "BusinessConfirmationDealCompositeView", "DealExportView",
+           "AISuggestionsView", "SubmitDealView", "TaskStatusView",
+           "NewBusinessConfirmationBulkView", "CommercialTermsBulkView", "PaymentTermsBulkView",
+           "SearchView", "CounterpartyTypeaheadView", "DealStatsView", "CacheStatsView"]
@@ -8,13 +8,15 @@ from drf_yasg import openapi
 
 from deals.services.ai_suggestions import ai_suggestions_service
 from deals.response_messages import ResponseMessages
+from deals.serializers import AISuggestionsBatchSerializer
 
 logger = logging.getLogger("deals")
 
 
 class AISuggestionsView(APIView):
     """
-    Simple API endpoint that provides AI suggestions for commercial terms fields
+    API endpoint that provides AI suggestions for commercial terms fields,
+    one field per GET or a whole form per POST
     """
     permission_classes = [IsAuthenticated]
 
@@ -34,6 +36,27 @@ class AISuggestionsView(APIView):
                 description="Current value of the field",
                 type=openapi.TYPE_STRING,
                 required=True
+            ),
+            openapi.Parameter(
+                'material',
+                openapi.IN_QUERY,
+                description="Material of the deal, narrows the comparison to similar deals",
+                type=openapi.TYPE_STRING,
+                required=False
+            ),
+            openapi.Parameter(
+                'delivery_term',
+                openapi.IN_QUERY,
+                description="Delivery term of the deal (e.g., DAP, FOB)",
+                type=openapi.TYPE_STRING,
+                required=False
+            ),
+            openapi.Parameter(
+                'transport_mode',
+                openapi.IN_QUERY,
+                description="Transport mode of the deal (e.g., Rail, Ship)",
+                type=openapi.TYPE_STRING,
+                required=False
             )
         ],
         responses={
@@ -45,7 +68,11 @@ class AISuggestionsView(APIView):
                         'type': openapi.Schema(type=openapi.TYPE_STRING, enum=['info', 'warning', 'error']),
                         'message': openapi.Schema(type=openapi.TYPE_STRING),
                         'suggested_value': openapi.Schema(type=openapi.TYPE_NUMBER, format=openapi.FORMAT_DECIMAL),
-                        'show_accept_button': openapi.Schema(type=openapi.TYPE_BOOLEAN)
+                        'show_accept_button': openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                        'benchmark': openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            description="Percentile band of comparable historical deals the value was checked against"
+                        )
                     }
                 )
             ),
@@ -67,6 +94,7 @@ class AISuggestionsView(APIView):
         Query Parameters:
         - field_name: Name of the field (e.g., 'prepayment', 'treatment_charge', 'refining_charge')
         - field_value: Current value of the field
+        - material, delivery_term, transport_mode: Deal context (optional)
         """
         field_name = request.query_params.get('field_name')
         field_value = request.query_params.get('field_value')
@@ -81,7 +109,10 @@ class AISuggestionsView(APIView):
         logger.info(f"Getting AI suggestion for field {field_name} with value {field_value}")
         suggestion = ai_suggestions_service.get_suggestion(
             field_name=field_name,
-            field_value=field_value
+            field_value=field_value,
+            material=request.query_params.get('material'),
+            transport_mode=request.query_params.get('transport_mode'),
+            delivery_term=request.query_params.get('delivery_term')
         )
 
         if suggestion:
@@ -93,3 +124,46 @@ class AISuggestionsView(APIView):
                 {'message': ResponseMessages.NO_SUGGESTIONS_AVAILABLE},
                 status=status.HTTP_200_OK
             )
+
+    @swagger_auto_schema(
+        operation_description="Get AI suggestions for every field of an in-progress form in one request",
+        request_body=AISuggestionsBatchSerializer,
+        responses={
+            200: openapi.Response(
+                description="AI suggestions by field name; fields without a suggestion are left out",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'suggestions': openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            additional_properties=openapi.Schema(type=openapi.TYPE_OBJECT)
+                        )
+                    }
+                )
+            ),
+            400: "Bad Request - Neither form nor fields given"
+        }
+    )
+    def post(self, request):
+        """
+        Get AI suggestions for several fields at once
+
+        Body:
+        - form: In-progress form as {field_name: field_value}, and/or
+        - fields: List of {field_name, field_value}
+        - material, delivery_term, transport_mode: Deal context (optional, defaults to the form's values)
+        """
+        serializer = AISuggestionsBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        fields = serializer.field_values
+        logger.info(f"User {request.user} requested AI suggestions for {len(fields)} fields")
+        suggestions = ai_suggestions_service.get_suggestions(
+            fields,
+            material=serializer.validated_data.get('material'),
+            transport_mode=serializer.validated_data.get('transport_mode'),
+            delivery_term=serializer.validated_data.get('delivery_term')
+        )
+        logger.info(f"AI suggestions found for {len(suggestions)} of {len(fields)} fields")
+        return Response({'suggestions': suggestions}, status=status.HTTP_200_OK)
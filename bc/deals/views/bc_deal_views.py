@@ -3,15 +3,51 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from django.shortcuts import get_object_or_404
+from django.http import StreamingHttpResponse
 
-from deals.serializers import BusinessConfirmationDealSerializer
+from deals.serializers import BusinessConfirmationDealSerializer, CompositeDealSerializer
 from deals.models import BusinessConfirmationDeal
+from deals.conditional import not_modified, related_models, table_validators, with_validators
+from deals.pagination import CURSOR_PAGINATION_PARAMETERS, SPARSE_FIELDS_PARAMETER, paginate_list
+from deals.filters import BusinessConfirmationDealFilterSerializer, DEAL_FILTER_PARAMETERS
 from rest_framework.throttling import UserRateThrottle
+from deals.response_messages import ResponseMessages
+from deals.services import deal_export
 
 logger = logging.getLogger("deals")
 
 
+def parse_expand(request):
+    """
+    Read ``?expand=`` as a comma-separated list of deal relations.
+    ``?expand=all`` expands every relation.
+    """
+    raw = request.query_params.get("expand")
+    if not raw:
+        return ()
+    expandable = BusinessConfirmationDealSerializer.EXPANDABLE_FIELDS
+    if raw == "all":
+        return tuple(expandable)
+    expand = tuple(name.strip() for name in raw.split(",") if name.strip())
+    unknown = [name for name in expand if name not in expandable]
+    if unknown:
+        raise ValidationError({"expand": [ResponseMessages.INVALID_EXPAND_FIELDS.format(", ".join(unknown))]})
+    return expand
+
+
+EXPAND_PARAMETER = openapi.Parameter(
+    "expand",
+    openapi.IN_QUERY,
+    description="Comma-separated relations to nest (new_business_confirmation, commercial_terms, payment_terms) or 'all'",
+    type=openapi.TYPE_STRING,
+    required=False
+)
+
+
 class BusinessConfirmationDealView(APIView):
     """
     API endpoint that allows business confirmation deals to be viewed or created.
@@ -21,14 +57,24 @@ class BusinessConfirmationDealView(APIView):
 
     @swagger_auto_schema(
         operation_description="Get all business confirmation deals",
+        manual_parameters=CURSOR_PAGINATION_PARAMETERS + [SPARSE_FIELDS_PARAMETER, EXPAND_PARAMETER] + DEAL_FILTER_PARAMETERS,
         responses={200: BusinessConfirmationDealSerializer(many=True)}
     )
     def get(self, request):
         logger.info(f"User {request.user} requested all business confirmation deals")
-        business_confirmation_deals = BusinessConfirmationDeal.objects.all()
-        serializer = BusinessConfirmationDealSerializer(business_confirmation_deals, many=True)
-        logger.debug(f"Returned {len(serializer.data)} deals")
-        return Response(serializer.data)
+        fields = BusinessConfirmationDealSerializer.fields_from_request(request)
+        expand = tuple(name for name in parse_expand(request) if fields is None or name in fields)
+        filters = BusinessConfirmationDealFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        business_confirmation_deals = filters.filter_queryset(BusinessConfirmationDeal.objects.all())
+        if expand:
+            business_confirmation_deals = business_confirmation_deals.select_related(*expand)
+        response, count = paginate_list(
+            self, request, business_confirmation_deals, BusinessConfirmationDealSerializer,
+            ordering=filters.validated_data.get("ordering"), models=filters.related_models(), expand=expand
+        )
+        logger.debug(f"Returned {count} deals")
+        return response
 
     @swagger_auto_schema(
         operation_description="Create a new business confirmation deal",
@@ -43,4 +89,138 @@ class BusinessConfirmationDealView(APIView):
             logger.info(f"BusinessConfirmationDeal {instance.id} created by {request.user}")
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         logger.warning(f"Failed to create BusinessConfirmationDeal by {request.user}. Errors: {serializer.errors}")
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class BusinessConfirmationDealCompositeView(APIView):
+    """
+    API endpoint that creates a deal together with its new business
+    confirmation, commercial terms and payment terms in one request.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    @swagger_auto_schema(
+        operation_description="Create a deal with its confirmation and terms atomically",
+        request_body=CompositeDealSerializer,
+        responses={
+            201: BusinessConfirmationDealSerializer(expand=tuple(BusinessConfirmationDealSerializer.EXPANDABLE_FIELDS)),
+            400: openapi.Response(description="Validation errors, keyed by part")
+        }
+    )
+    def post(self, request):
+        logger.info(f"User {request.user} is creating a composite business confirmation deal")
+        serializer = CompositeDealSerializer(data=request.data)
+        if serializer.is_valid():
+            instance = serializer.save(user=request.user)
+            logger.info(f"BusinessConfirmationDeal {instance.id} created with its terms by {request.user}")
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        logger.warning(f"Failed to create composite deal by {request.user}. Errors: {serializer.errors}")
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class BusinessConfirmationDealDetailView(APIView):
+    """
+    API endpoint that returns one business confirmation deal with its
+    confirmation, commercial terms and payment terms nested.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    @swagger_auto_schema(
+        operation_description="Get a business confirmation deal with its terms nested",
+        manual_parameters=[
+            openapi.Parameter(
+                'deal_id',
+                openapi.IN_PATH,
+                description="UUID of the business confirmation deal",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_UUID
+            ),
+            SPARSE_FIELDS_PARAMETER,
+        ],
+        responses={
+            200: BusinessConfirmationDealSerializer(expand=tuple(BusinessConfirmationDealSerializer.EXPANDABLE_FIELDS)),
+            404: openapi.Response(description="Deal not found")
+        }
+    )
+    def get(self, request, deal_id):
+        logger.info(f"User {request.user} requested business confirmation deal {deal_id}")
+        fields = BusinessConfirmationDealSerializer.fields_from_request(request)
+        expand = tuple(
+            name for name in BusinessConfirmationDealSerializer.EXPANDABLE_FIELDS
+            if fields is None or name in fields
+        )
+        validators = table_validators(request, *related_models(BusinessConfirmationDeal, expand))
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
+        queryset = BusinessConfirmationDeal.objects.select_related(*expand)
+        if fields is not None:
+            queryset = queryset.only(*BusinessConfirmationDealSerializer.only_columns(fields))
+        deal = get_object_or_404(queryset, id=deal_id)
+        serializer = BusinessConfirmationDealSerializer(deal, expand=expand, fields=fields)
+        return with_validators(Response(serializer.data), validators)
+
+
+class DealExportView(APIView):
+    """
+    API endpoint that streams every business confirmation deal with its
+    confirmation, commercial terms and payment terms as NDJSON or CSV.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    @swagger_auto_schema(
+        operation_description="Stream all business confirmation deals with their terms",
+        manual_parameters=[
+            openapi.Parameter(
+                'export_format',
+                openapi.IN_QUERY,
+                description="Output format",
+                type=openapi.TYPE_STRING,
+                enum=list(deal_export.EXPORT_FORMATS),
+                required=False
+            ),
+            openapi.Parameter(
+                'gzip',
+                openapi.IN_QUERY,
+                description="Gzip-compress the output",
+                type=openapi.TYPE_BOOLEAN,
+                required=False
+            ),
+        ] + DEAL_FILTER_PARAMETERS,
+        responses={
+            200: openapi.Response(description="Streamed NDJSON or CSV file"),
+            400: openapi.Response(description="Invalid export format or filters")
+        }
+    )
+    def get(self, request):
+        export_format = request.query_params.get("export_format", deal_export.NDJSON)
+        gzip = request.query_params.get("gzip", "").lower() in ("1", "true", "yes")
+        logger.info(f"User {request.user} requested a {export_format} deal export (gzip={gzip})")
+
+        if export_format not in deal_export.EXPORT_FORMATS:
+            return Response(
+                {"error": ResponseMessages.INVALID_EXPORT_FORMAT.format(", ".join(deal_export.EXPORT_FORMATS))},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        filters = BusinessConfirmationDealFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        queryset = filters.filter_queryset(BusinessConfirmationDeal.objects.all())
+        validators = table_validators(
+            request, *dict.fromkeys(related_models(BusinessConfirmationDeal, deal_export.EXPAND) + filters.related_models())
+        )
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
+        response = StreamingHttpResponse(
+            deal_export.stream_export(export_format, gzip=gzip, queryset=queryset),
+            content_type="application/gzip" if gzip else deal_export.CONTENT_TYPES[export_format],
+        )
+        filename = deal_export.export_filename(export_format, gzip)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return with_validators(response, validators)
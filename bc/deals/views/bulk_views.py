@@ -0,0 +1,131 @@
+import logging
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.parsers import JSONParser
+from rest_framework.throttling import UserRateThrottle
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from deals.parsers import NDJSONParser
+from deals.serializers import (
+    NewBusinessConfirmationSerializer, CommercialTermsSerializer, PaymentTermsSerializer
+)
+from deals.services.bulk_create import bulk_create
+
+logger = logging.getLogger("deals")
+
+
+PARTIAL_PARAMETER = openapi.Parameter(
+    "partial",
+    openapi.IN_QUERY,
+    description="Insert the valid items even if some items are invalid (default: all or nothing)",
+    type=openapi.TYPE_BOOLEAN,
+    required=False
+)
+
+
+_BULK_ITEM_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "index": openapi.Schema(type=openapi.TYPE_INTEGER),
+        "status": openapi.Schema(type=openapi.TYPE_STRING, enum=["created", "invalid", "not_created"]),
+        "data": openapi.Schema(type=openapi.TYPE_OBJECT),
+        "errors": openapi.Schema(type=openapi.TYPE_OBJECT),
+    }
+)
+
+_BULK_BODY_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "created": openapi.Schema(type=openapi.TYPE_INTEGER),
+        "failed": openapi.Schema(type=openapi.TYPE_INTEGER),
+        "results": openapi.Schema(type=openapi.TYPE_ARRAY, items=_BULK_ITEM_SCHEMA),
+    }
+)
+
+BULK_CREATE_RESPONSES = {
+    201: openapi.Response(description="All items created", schema=_BULK_BODY_SCHEMA),
+    207: openapi.Response(description="Partial mode: some items created, some invalid", schema=_BULK_BODY_SCHEMA),
+    400: openapi.Response(description="Invalid body or invalid items; nothing created", schema=_BULK_BODY_SCHEMA),
+}
+
+
+class BulkCreateView(APIView):
+    """
+    Base for endpoints that create many rows from one JSON array (or an
+    NDJSON body) with a single bulk INSERT.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+    parser_classes = [JSONParser, NDJSONParser]
+    serializer_class = None
+
+    def create(self, request):
+        model_name = self.serializer_class.Meta.model.__name__
+        partial = request.query_params.get("partial", "").lower() in ("1", "true", "yes")
+        logger.info(f"User {request.user} is bulk creating {model_name} (partial={partial})")
+
+        result = bulk_create(self.serializer_class, request.data, partial=partial)
+        if result.errors is not None:
+            logger.warning(f"Rejected {model_name} bulk create by {request.user}. Errors: {result.errors}")
+            return Response(result.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        body = {"created": result.created, "failed": result.failed, "results": result.results}
+        if not result.failed:
+            response_status = status.HTTP_201_CREATED
+        elif result.created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        logger.info(f"Bulk created {result.created} {model_name}, {result.failed} invalid, by {request.user}")
+        return Response(body, status=response_status)
+
+
+class NewBusinessConfirmationBulkView(BulkCreateView):
+    """
+    API endpoint that creates many new business confirmations at once.
+    """
+    serializer_class = NewBusinessConfirmationSerializer
+
+    @swagger_auto_schema(
+        operation_description="Create new business confirmations from a JSON array or NDJSON body",
+        request_body=NewBusinessConfirmationSerializer(many=True),
+        manual_parameters=[PARTIAL_PARAMETER],
+        responses=BULK_CREATE_RESPONSES
+    )
+    def post(self, request):
+        return self.create(request)
+
+
+class CommercialTermsBulkView(BulkCreateView):
+    """
+    API endpoint that creates many commercial terms at once.
+    """
+    serializer_class = CommercialTermsSerializer
+
+    @swagger_auto_schema(
+        operation_description="Create commercial terms from a JSON array or NDJSON body",
+        request_body=CommercialTermsSerializer(many=True),
+        manual_parameters=[PARTIAL_PARAMETER],
+        responses=BULK_CREATE_RESPONSES
+    )
+    def post(self, request):
+        return self.create(request)
+
+
+class PaymentTermsBulkView(BulkCreateView):
+    """
+    API endpoint that creates many payment terms at once.
+    """
+    serializer_class = PaymentTermsSerializer
+
+    @swagger_auto_schema(
+        operation_description="Create payment terms from a JSON array or NDJSON body",
+        request_body=PaymentTermsSerializer(many=True),
+        manual_parameters=[PARTIAL_PARAMETER],
+        responses=BULK_CREATE_RESPONSES
+    )
+    def post(self, request):
+        return self.create(request)
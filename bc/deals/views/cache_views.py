@@ -0,0 +1,40 @@
+import logging
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from deals import cache_metrics
+
+logger = logging.getLogger("deals")
+
+
+class CacheStatsView(APIView):
+    """
+    Staff-only API endpoint reporting hit ratio and recompute latency of
+    every deals cache, aggregated over all processes.
+    """
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Per-cache lookups, hit ratio, stale serves and p50/p95 recompute latency (staff only)",
+        responses={
+            200: openapi.Response(
+                description="Cache metrics",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                        )
+                    }
+                )
+            )
+        }
+    )
+    def get(self, request):
+        logger.info(f"User {request.user} requested cache stats")
+        return Response({"results": cache_metrics.report()}, status=status.HTTP_200_OK)
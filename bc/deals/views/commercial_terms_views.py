@@ -7,6 +7,8 @@ from drf_yasg.utils import swagger_auto_schema
 
 from deals.serializers import CommercialTermsSerializer, AdditionalClauseSerializer
 from deals.models import AdditionalClause, CommercialTerms
+from deals.pagination import CURSOR_PAGINATION_PARAMETERS, SPARSE_FIELDS_PARAMETER, paginate_list
+from deals.response_cache import cached_response
 
 logger = logging.getLogger("deals")
 
@@ -19,14 +21,15 @@ class CommercialTermsView(APIView):
 
     @swagger_auto_schema(
         operation_description="Get all commercial terms",
+        manual_parameters=CURSOR_PAGINATION_PARAMETERS + [SPARSE_FIELDS_PARAMETER],
         responses={200: CommercialTermsSerializer(many=True)}
     )
     def get(self, request):
         logger.info(f"User {request.user} requested all commercial terms")
         commercial_terms = CommercialTerms.objects.all()
-        serializer = CommercialTermsSerializer(commercial_terms, many=True)
-        logger.debug(f"Returned {len(serializer.data)} commercial terms")
-        return Response(serializer.data)
+        response, count = paginate_list(self, request, commercial_terms, CommercialTermsSerializer)
+        logger.debug(f"Returned {count} commercial terms")
+        return response
 
     @swagger_auto_schema(
         operation_description="Create a new commercial terms",
@@ -52,11 +55,13 @@ class AdditionalClauseView(APIView):
 
     @swagger_auto_schema(
         operation_description="Get all additional clauses",
+        manual_parameters=CURSOR_PAGINATION_PARAMETERS + [SPARSE_FIELDS_PARAMETER],
         responses={200: AdditionalClauseSerializer(many=True)}
     )
+    @cached_response(AdditionalClause)
     def get(self, request):
         logger.info(f"User {request.user} requested all additional clauses")
         additional_clauses = AdditionalClause.objects.all()
-        serializer = AdditionalClauseSerializer(additional_clauses, many=True)
-        logger.debug(f"Returned {len(serializer.data)} additional clauses")
-        return Response(serializer.data)
\ No newline at end of file
+        response, count = paginate_list(self, request, additional_clauses, AdditionalClauseSerializer)
+        logger.debug(f"Returned {count} additional clauses")
+        return response
\ No newline at end of file
@@ -0,0 +1,97 @@
+import logging
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from deals.conditional import not_modified, table_validators, with_validators
+from deals.models import NewBusinessConfirmation
+from deals.response_messages import ResponseMessages
+from deals.services import counterparties
+
+logger = logging.getLogger("deals")
+
+
+class CounterpartyTypeaheadView(APIView):
+    """
+    API endpoint that suggests buyer and seller names as the user types.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Suggest buyer/seller names containing the typed text",
+        manual_parameters=[
+            openapi.Parameter(
+                'q',
+                openapi.IN_QUERY,
+                description="Typed text; names starting with it rank first",
+                type=openapi.TYPE_STRING,
+                required=True
+            ),
+            openapi.Parameter(
+                'role',
+                openapi.IN_QUERY,
+                description="Only suggest buyers or sellers (default: both)",
+                type=openapi.TYPE_STRING,
+                enum=list(counterparties.ROLES),
+                required=False
+            ),
+            openapi.Parameter(
+                'limit',
+                openapi.IN_QUERY,
+                description="Maximum number of suggestions (capped by COUNTERPARTY_TYPEAHEAD_MAX_LIMIT)",
+                type=openapi.TYPE_INTEGER,
+                required=False
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                description="Matching counterparties",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'results': openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    'name': openapi.Schema(type=openapi.TYPE_STRING),
+                                    'role': openapi.Schema(type=openapi.TYPE_STRING),
+                                    'confirmations': openapi.Schema(type=openapi.TYPE_INTEGER),
+                                }
+                            )
+                        )
+                    }
+                )
+            ),
+            400: openapi.Response(description="Missing q or invalid role")
+        }
+    )
+    def get(self, request):
+        term = request.query_params.get("q", "").strip()
+        role = request.query_params.get("role") or None
+        logger.debug(f"User {request.user} requested counterparty suggestions for {term!r}")
+        if not term:
+            return Response({"error": ResponseMessages.MISSING_SEARCH_QUERY}, status=status.HTTP_400_BAD_REQUEST)
+        if role is not None and role not in counterparties.ROLES:
+            return Response(
+                {"error": ResponseMessages.INVALID_COUNTERPARTY_ROLE.format(", ".join(counterparties.ROLES))},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", settings.COUNTERPARTY_TYPEAHEAD_LIMIT))
+        except ValueError:
+            limit = settings.COUNTERPARTY_TYPEAHEAD_LIMIT
+        limit = min(max(limit, 1), settings.COUNTERPARTY_TYPEAHEAD_MAX_LIMIT)
+
+        validators = table_validators(request, NewBusinessConfirmation)
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
+        results = counterparties.suggest(term, role=role, limit=limit)
+        return with_validators(Response({"results": results}), validators)
@@ -1,13 +1,16 @@
 import logging
-from django.core.cache import cache
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
 
 from deals.serializers import DropdownOptionSerializer
 from deals.models import DropdownOption
+from deals.pagination import SPARSE_FIELDS_PARAMETER
+from deals.response_cache import cached_response
+from deals.services import dropdown_cache
 
 logger = logging.getLogger("deals")
 
@@ -15,31 +18,41 @@ logger = logging.getLogger("deals")
 class DropdownOptionView(APIView):
     """
     API endpoint that allows dropdown options to be viewed or created.
-    Implements intelligent caching that invalidates when data changes.
+    Options are cached per field_name; saving or deleting an option only
+    invalidates its own field (see deals/signals.py).
     """
     permission_classes = [IsAuthenticated]
-    
-    CACHE_KEY = "dropdown_options_all"
-    CACHE_TIMEOUT = 3600
-    
+
     @swagger_auto_schema(
-        operation_description="Get all dropdown options (cached)",
+        operation_description="Get dropdown options, optionally for some fields only (cached per field)",
+        manual_parameters=[
+            openapi.Parameter(
+                'field_name',
+                openapi.IN_QUERY,
+                description="Comma-separated field names to return options for (default: all)",
+                type=openapi.TYPE_STRING,
+                required=False
+            ),
+            SPARSE_FIELDS_PARAMETER,
+        ],
         responses={200: DropdownOptionSerializer(many=True)}
     )
+    @cached_response(DropdownOption)
     def get(self, request):
-        logger.info(f"User {request.user} requested all dropdown options")
-
-        cached_data = cache.get(self.CACHE_KEY)
-
-        if cached_data is not None:
-            logger.debug("Returning dropdown options from cache")
-            return Response(cached_data, status=status.HTTP_200_OK)
-
-        logger.debug("Cache miss - fetching dropdown options from database")
-        dropdown_options = DropdownOption.objects.filter(is_active=True).order_by('field_name', 'display_order')
-        serializer = DropdownOptionSerializer(dropdown_options, many=True)
-
-        cache.set(self.CACHE_KEY, serializer.data, self.CACHE_TIMEOUT)
-
-        logger.debug(f"Returned {len(serializer.data)} dropdown options and cached them")
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        raw_field_names = request.query_params.get("field_name")
+        field_names = None
+        if raw_field_names:
+            field_names = [name.strip() for name in raw_field_names.split(",") if name.strip()]
+        logger.info(f"User {request.user} requested dropdown options for {field_names or 'all fields'}")
+        fields = DropdownOptionSerializer.fields_from_request(request)
+
+        options = dropdown_cache.get_options(field_names)
+        logger.debug(f"Returned {len(options)} dropdown options")
+        return Response(self.project(options, fields), status=status.HTTP_200_OK)
+
+    @staticmethod
+    def project(options, fields):
+        """The cache holds full rows; trim them to the requested sparse fieldset."""
+        if fields is None:
+            return options
+        return [{name: value for name, value in option.items() if name in fields} for option in options]
@@ -7,6 +7,7 @@ from drf_yasg.utils import swagger_auto_schema
 
 from deals.serializers import NewBusinessConfirmationSerializer
 from deals.models import NewBusinessConfirmation
+from deals.pagination import CURSOR_PAGINATION_PARAMETERS, SPARSE_FIELDS_PARAMETER, paginate_list
 
 logger = logging.getLogger("deals")
 
@@ -19,14 +20,15 @@ class NewBusinessConfirmationView(APIView):
 
     @swagger_auto_schema(
         operation_description="Get all new business confirmations",
+        manual_parameters=CURSOR_PAGINATION_PARAMETERS + [SPARSE_FIELDS_PARAMETER],
         responses={200: NewBusinessConfirmationSerializer(many=True)}
     )
     def get(self, request):
         logger.info(f"User {request.user} requested all new business confirmations")
         new_business_confirmations = NewBusinessConfirmation.objects.all()
-        serializer = NewBusinessConfirmationSerializer(new_business_confirmations, many=True)
-        logger.debug(f"Returned {len(serializer.data)} new business confirmations")
-        return Response(serializer.data)
+        response, count = paginate_list(self, request, new_business_confirmations, NewBusinessConfirmationSerializer)
+        logger.debug(f"Returned {count} new business confirmations")
+        return response
 
     @swagger_auto_schema(
         operation_description="Create a new new business confirmation",
@@ -7,6 +7,7 @@ from rest_framework import status
 from deals.serializers import PaymentTermsSerializer
 from drf_yasg.utils import swagger_auto_schema
 from deals.models import PaymentTerms
+from deals.pagination import CURSOR_PAGINATION_PARAMETERS, SPARSE_FIELDS_PARAMETER, paginate_list
 
 logger = logging.getLogger("deals")
 
@@ -19,14 +20,15 @@ class PaymentTermsView(APIView):
 
     @swagger_auto_schema(
         operation_description="Get all payment terms",
+        manual_parameters=CURSOR_PAGINATION_PARAMETERS + [SPARSE_FIELDS_PARAMETER],
         responses={200: PaymentTermsSerializer(many=True)}
     )
     def get(self, request):
         logger.info(f"User {request.user} requested all payment terms")
         payment_terms = PaymentTerms.objects.all()
-        serializer = PaymentTermsSerializer(payment_terms, many=True)
-        logger.debug(f"Returned {len(serializer.data)} payment terms")
-        return Response(serializer.data)
+        response, count = paginate_list(self, request, payment_terms, PaymentTermsSerializer)
+        logger.debug(f"Returned {count} payment terms")
+        return response
 
     @swagger_auto_schema(
         operation_description="Create a new payment terms",
@@ -0,0 +1,105 @@
+import logging
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.throttling import UserRateThrottle
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from deals.conditional import not_modified, table_validators, with_validators
+from deals.response_messages import ResponseMessages
+from deals.services import search as search_service
+
+logger = logging.getLogger("deals")
+
+
+class SearchView(APIView):
+    """
+    Full-text search over additional clauses, commercial terms clauses and
+    payment terms text, ranked and highlighted.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    @swagger_auto_schema(
+        operation_description="Full-text search over clauses and payment terms",
+        manual_parameters=[
+            openapi.Parameter(
+                'q',
+                openapi.IN_QUERY,
+                description='Search text; supports "quoted phrases", OR and -exclusions',
+                type=openapi.TYPE_STRING,
+                required=True
+            ),
+            openapi.Parameter(
+                'types',
+                openapi.IN_QUERY,
+                description=f"Comma-separated subset of: {', '.join(search_service.TARGETS)} (default: all)",
+                type=openapi.TYPE_STRING,
+                required=False
+            ),
+            openapi.Parameter(
+                'limit',
+                openapi.IN_QUERY,
+                description="Maximum number of results (capped by SEARCH_MAX_LIMIT)",
+                type=openapi.TYPE_INTEGER,
+                required=False
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                description="Matches ordered by rank",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'results': openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    'type': openapi.Schema(type=openapi.TYPE_STRING),
+                                    'id': openapi.Schema(type=openapi.TYPE_INTEGER),
+                                    'rank': openapi.Schema(type=openapi.TYPE_NUMBER),
+                                    'highlights': openapi.Schema(type=openapi.TYPE_OBJECT),
+                                }
+                            )
+                        )
+                    }
+                )
+            ),
+            400: openapi.Response(description="Missing query or unknown types")
+        }
+    )
+    def get(self, request):
+        text = request.query_params.get("q", "").strip()
+        logger.info(f"User {request.user} searched for {text!r}")
+        if not text:
+            return Response({"error": ResponseMessages.MISSING_SEARCH_QUERY}, status=status.HTTP_400_BAD_REQUEST)
+
+        raw_types = request.query_params.get("types")
+        types = tuple(search_service.TARGETS)
+        if raw_types:
+            types = tuple(name.strip() for name in raw_types.split(",") if name.strip())
+            unknown = [name for name in types if name not in search_service.TARGETS]
+            if unknown:
+                return Response(
+                    {"error": ResponseMessages.INVALID_SEARCH_TYPES.format(", ".join(unknown))},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        try:
+            limit = int(request.query_params.get("limit", settings.SEARCH_DEFAULT_LIMIT))
+        except ValueError:
+            limit = settings.SEARCH_DEFAULT_LIMIT
+        limit = min(max(limit, 1), settings.SEARCH_MAX_LIMIT)
+
+        validators = table_validators(request, *(search_service.TARGETS[name].model for name in types))
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
+        results = search_service.search(text, types, limit)
+        logger.debug(f"Search for {text!r} returned {len(results)} results")
+        return with_validators(Response({"results": results}), validators)
@@ -0,0 +1,127 @@
+import logging
+from datetime import datetime
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.throttling import UserRateThrottle
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from deals.models import BusinessConfirmationDeal, DealStatsBucket
+from deals.response_cache import cached_response
+from deals.response_messages import ResponseMessages
+from deals.services import deal_stats
+
+logger = logging.getLogger("deals")
+
+
+def _parse_month(value):
+    return datetime.strptime(value, "%Y-%m").date()
+
+
+class DealStatsView(APIView):
+    """
+    API endpoint for deal counts and quantities per status, material and
+    month, read from the incrementally maintained stats rollup.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    @swagger_auto_schema(
+        operation_description="Deal counts and total quantity grouped by status, material and/or month",
+        manual_parameters=[
+            openapi.Parameter(
+                'group_by',
+                openapi.IN_QUERY,
+                description=f"Comma-separated subset of: {', '.join(deal_stats.GROUP_BY_FIELDS)} (default: all)",
+                type=openapi.TYPE_STRING,
+                required=False
+            ),
+            openapi.Parameter(
+                'status',
+                openapi.IN_QUERY,
+                description="Only count deals with this status",
+                type=openapi.TYPE_STRING,
+                enum=[choice for choice, _ in BusinessConfirmationDeal.STATUS_CHOICES],
+                required=False
+            ),
+            openapi.Parameter(
+                'material',
+                openapi.IN_QUERY,
+                description="Only count deals for this material",
+                type=openapi.TYPE_STRING,
+                required=False
+            ),
+            openapi.Parameter(
+                'month_from',
+                openapi.IN_QUERY,
+                description="First month to include (YYYY-MM)",
+                type=openapi.TYPE_STRING,
+                required=False
+            ),
+            openapi.Parameter(
+                'month_to',
+                openapi.IN_QUERY,
+                description="Last month to include (YYYY-MM)",
+                type=openapi.TYPE_STRING,
+                required=False
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                description="Aggregated deal statistics",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'results': openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    'status': openapi.Schema(type=openapi.TYPE_STRING),
+                                    'material': openapi.Schema(type=openapi.TYPE_STRING),
+                                    'month': openapi.Schema(type=openapi.TYPE_STRING),
+                                    'deal_count': openapi.Schema(type=openapi.TYPE_INTEGER),
+                                    'total_quantity': openapi.Schema(type=openapi.TYPE_NUMBER),
+                                }
+                            )
+                        )
+                    }
+                )
+            ),
+            400: openapi.Response(description="Invalid group_by or month")
+        }
+    )
+    @cached_response(bumped_manually=(DealStatsBucket,))
+    def get(self, request):
+        logger.debug(f"User {request.user} requested deal stats")
+        group_by = deal_stats.GROUP_BY_FIELDS
+        raw_group_by = request.query_params.get("group_by")
+        if raw_group_by is not None:
+            group_by = tuple(name.strip() for name in raw_group_by.split(",") if name.strip())
+            if not group_by or any(name not in deal_stats.GROUP_BY_FIELDS for name in group_by):
+                return Response(
+                    {"error": ResponseMessages.INVALID_STATS_GROUP_BY.format(", ".join(deal_stats.GROUP_BY_FIELDS))},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        months = {}
+        for name in ("month_from", "month_to"):
+            value = request.query_params.get(name)
+            if value:
+                try:
+                    months[name] = _parse_month(value)
+                except ValueError:
+                    return Response(
+                        {"error": ResponseMessages.INVALID_MONTH.format(name)},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+        results = deal_stats.summarize(
+            group_by,
+            status=request.query_params.get("status"),
+            material=request.query_params.get("material"),
+            **months,
+        )
+        return Response({"results": results})
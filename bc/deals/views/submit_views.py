@@ -8,6 +8,7 @@ from drf_yasg import openapi
 from django.shortcuts import get_object_or_404
 
 from deals.models import BusinessConfirmationDeal, TaskStatus
+from deals.conditional import not_modified, queryset_validators, with_validators
 from deals.tasks.processing_tasks import process_business_confirmation_deal
 from rest_framework.throttling import UserRateThrottle
 from deals.response_messages import ResponseMessages
@@ -134,12 +135,17 @@ class TaskStatusView(APIView):
         }
     )
     def get(self, request, task_status_id):
+        validators = queryset_validators(request, TaskStatus.objects.filter(id=task_status_id))
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
         try:
             task_status = get_object_or_404(TaskStatus, id=task_status_id)
             
             logger.debug(f"Retrieved task status {task_status_id} for user {request.user}")
             
-            return Response({
+            response = Response({
                 "task_id": task_status.task_id,
                 "status": task_status.status,
                 "message": task_status.message,
@@ -148,6 +154,7 @@ class TaskStatusView(APIView):
                 "completed_at": task_status.completed_at.isoformat() if task_status.completed_at else None,
                 "deal_id": str(task_status.deal.id)
             }, status=status.HTTP_200_OK)
+            return with_validators(response, validators)
             
         except Exception as e:
             logger.error(f"Error retrieving task status {task_status_id}: {str(e)}")
@@ -0,0 +1,11 @@
+# Gunicorn reads this file from the working directory (bc/).
+
+
+def post_worker_init(worker):
+    """
+    Warm the caches after Django loads, before the worker accepts requests:
+    the shared ones once per deploy, the process-local ones in every worker.
+    """
+    from deals.services.cache_warmup import warm_on_start
+
+    warm_on_start("gunicorn worker")
@@ -0,0 +1,4 @@
+-- Runs once when the Postgres volume is first initialised (see docker-compose.yml).
+-- The deals app also creates it before migrating; doing it here covers
+-- deployments where the application role may not create extensions.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;